@@ -0,0 +1,85 @@
+"""
+Benchmark comparing the available arithmetic backends.
+
+Run with ``python benchmarks/bench_backends.py``. The gmpy2 backend is
+only measured when gmpy2 is installed.
+"""
+
+import timeit
+from collections.abc import Callable
+
+from factorial_calculator.backends import BACKENDS, FactorialBackend
+from factorial_calculator.exceptions import BackendUnavailableError
+
+SIZES = (1000, 5000, 10000, 20000)
+REPEAT = 5
+
+
+def available_backends() -> list[FactorialBackend]:
+    """
+    Instantiate every backend that can be loaded in this environment.
+
+    Returns:
+        list[FactorialBackend]: The loadable backends.
+    """
+    backends = []
+    for backend_class in BACKENDS.values():
+        try:
+            backends.append(backend_class())
+        except BackendUnavailableError:
+            print(f"skipping {backend_class.name}: not installed")
+    return backends
+
+
+def best_time(func: Callable[[], object], number: int = 1) -> float:
+    """
+    Return the best wall time of several runs of func.
+
+    Args:
+        func: Zero-argument callable to time.
+        number: Calls per measurement.
+
+    Returns:
+        float: Best time per call in seconds.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def time_backend(backend: FactorialBackend, n: int, value: int) -> list[float]:
+    """
+    Time factorial, multiplication and conversion for one backend.
+
+    Args:
+        backend: The backend to measure.
+        n: Factorial input size.
+        value: A precomputed n! used as operand.
+
+    Returns:
+        list[float]: Timings for factorial, multiply and to_string.
+    """
+    return [
+        best_time(lambda: backend.factorial(n)),
+        best_time(lambda: backend.multiply(value, value)),
+        best_time(lambda: backend.to_string(value, 16)),
+    ]
+
+
+def main() -> None:
+    """Print factorial, multiplication and conversion timings per backend."""
+    backends = available_backends()
+    header = f"{'operation':<24}" + "".join(f"{b.name:>14}" for b in backends)
+    print(header)
+    print("-" * len(header))
+
+    for n in SIZES:
+        value = backends[0].factorial(n)
+        timings = [time_backend(backend, n, value) for backend in backends]
+        labels = (f"factorial({n})", f"multiply({n}!, {n}!)", f"to_string({n}!)")
+        for row, label in enumerate(labels):
+            cells = "".join(f"{t[row] * 1e3:>12.3f}ms" for t in timings)
+            print(f"{label:<24}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,16 +9,40 @@ __version__ = "1.0.0"
 __author__ = "VibeCoding"
 __license__ = "MIT"
 
+from factorial_calculator.combinatorics import binomial, multinomial, permutations
 from factorial_calculator.core import FactorialCalculator
 from factorial_calculator.exceptions import (
+    BackendUnavailableError,
     FactorialError,
     InvalidInputError,
     OverflowError,
+    VerificationError,
+    WorkerError,
 )
+from factorial_calculator.executor import calculate_many
+from factorial_calculator.inverse import (
+    inverse_factorial,
+    is_factorial,
+    largest_factorial_input,
+    smallest_input_with_digits,
+)
+from factorial_calculator.result import FactorialResult
 
 __all__ = [
+    "BackendUnavailableError",
     "FactorialCalculator",
     "FactorialError",
+    "FactorialResult",
     "InvalidInputError",
     "OverflowError",
+    "VerificationError",
+    "WorkerError",
+    "binomial",
+    "calculate_many",
+    "inverse_factorial",
+    "is_factorial",
+    "largest_factorial_input",
+    "multinomial",
+    "permutations",
+    "smallest_input_with_digits",
 ]
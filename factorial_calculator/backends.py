@@ -0,0 +1,235 @@
+"""
+Arithmetic backends for the factorial calculator.
+
+This module abstracts the big-integer operations used by the calculator
+(multiplication, factorial and radix conversion) so that a faster
+implementation can be plugged in when it is available. The GMP backend
+is used when ``gmpy2`` is importable; otherwise the pure-Python backend
+is selected automatically.
+"""
+
+import importlib
+import math
+from abc import ABC, abstractmethod
+from types import ModuleType
+
+from factorial_calculator.exceptions import BackendUnavailableError, InvalidInputError
+
+# Imported through importlib so that type checking does not depend on
+# whether gmpy2 is installed
+gmpy2: ModuleType | None
+try:
+    gmpy2 = importlib.import_module("gmpy2")
+except ImportError:  # pragma: no cover - depends on the environment
+    gmpy2 = None
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Values below this many bits are converted with str(), which stays well
+# under CPython's default integer string conversion limit
+_DECIMAL_LEAF_BITS = 2000
+
+
+def _check_base(base: int) -> None:
+    """
+    Ensure a radix is supported by every backend.
+
+    Args:
+        base: The radix to check.
+
+    Raises:
+        InvalidInputError: If base is outside 2..36.
+    """
+    if not 2 <= base <= 36:
+        raise InvalidInputError(f"Invalid base: {base} is not between 2 and 36")
+
+
+def _to_decimal(value: int) -> str:
+    """
+    Convert a non-negative integer to decimal by divide and conquer.
+
+    Splitting around a power of ten keeps every str() call small, which
+    avoids CPython's integer string conversion limit and its quadratic
+    cost on huge values.
+
+    Args:
+        value: A non-negative integer.
+
+    Returns:
+        str: The decimal digits of value.
+    """
+    if value.bit_length() <= _DECIMAL_LEAF_BITS:
+        return str(value)
+    half = int(value.bit_length() * math.log10(2)) // 2
+    high, low = divmod(value, 10**half)
+    return _to_decimal(high) + _to_decimal(low).zfill(half)
+
+
+class FactorialBackend(ABC):
+    """
+    Abstract base class for big-integer arithmetic backends.
+
+    Every backend accepts and returns plain Python ``int`` values so
+    that callers never see backend-specific number types.
+
+    Attributes:
+        name: Short identifier of the backend.
+        native_factorial: True if factorial() is faster than the
+            calculator's own product-tree engine.
+        native_to_string: True if to_string() is faster than streaming
+            the digits with FactorialResult.
+    """
+
+    name: str = ""
+    native_factorial: bool = False
+    native_to_string: bool = False
+
+    @abstractmethod
+    def multiply(self, a: int, b: int) -> int:
+        """
+        Multiply two integers.
+
+        Args:
+            a: First factor.
+            b: Second factor.
+
+        Returns:
+            int: The product a * b.
+        """
+
+    @abstractmethod
+    def factorial(self, n: int) -> int:
+        """
+        Compute n! for an already validated non-negative integer.
+
+        Args:
+            n: A validated non-negative integer.
+
+        Returns:
+            int: The factorial of n.
+        """
+
+    @abstractmethod
+    def to_string(self, value: int, base: int = 10) -> str:
+        """
+        Convert an integer to its representation in the given radix.
+
+        Args:
+            value: The integer to convert.
+            base: Target radix between 2 and 36.
+
+        Returns:
+            str: Lower-case digits of value in the given base.
+        """
+
+
+class PythonBackend(FactorialBackend):
+    """Pure-Python backend built on CPython's arbitrary precision ints."""
+
+    name = "python"
+
+    def multiply(self, a: int, b: int) -> int:
+        """Multiply two integers with CPython ints."""
+        return a * b
+
+    def factorial(self, n: int) -> int:
+        """Compute n! iteratively."""
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+
+    def to_string(self, value: int, base: int = 10) -> str:
+        """Convert an integer to a string using built-in formatting."""
+        _check_base(base)
+        if base == 10:
+            if value < 0:
+                return "-" + _to_decimal(-value)
+            return _to_decimal(value)
+        if base in (2, 8, 16):
+            return format(value, {2: "b", 8: "o", 16: "x"}[base])
+
+        sign = "-" if value < 0 else ""
+        value = abs(value)
+        digits = []
+        while value:
+            value, digit = divmod(value, base)
+            digits.append(_DIGITS[digit])
+        return sign + ("".join(reversed(digits)) or "0")
+
+
+class GMPBackend(FactorialBackend):
+    """
+    Backend delegating to the GMP library through ``gmpy2``.
+
+    Raises:
+        BackendUnavailableError: If gmpy2 cannot be imported.
+    """
+
+    name = "gmpy2"
+    native_factorial = True
+    native_to_string = True
+
+    def __init__(self) -> None:
+        """Bind the backend to the gmpy2 module."""
+        if gmpy2 is None:
+            raise BackendUnavailableError("The gmpy2 backend is not installed")
+        self._gmpy2 = gmpy2
+
+    def multiply(self, a: int, b: int) -> int:
+        """Multiply two integers with GMP."""
+        return int(self._gmpy2.mpz(a) * b)
+
+    def factorial(self, n: int) -> int:
+        """Compute n! with GMP's ``fac``."""
+        return int(self._gmpy2.fac(n))
+
+    def to_string(self, value: int, base: int = 10) -> str:
+        """Convert an integer to a string with GMP's radix conversion."""
+        _check_base(base)
+        return str(self._gmpy2.mpz(value).digits(base))
+
+
+BACKENDS: dict[str, type[FactorialBackend]] = {
+    PythonBackend.name: PythonBackend,
+    GMPBackend.name: GMPBackend,
+}
+
+
+def is_gmpy2_available() -> bool:
+    """
+    Check whether the GMP backend can be used.
+
+    Returns:
+        bool: True if gmpy2 is importable.
+    """
+    return gmpy2 is not None
+
+
+def get_backend(name: str | None = None) -> FactorialBackend:
+    """
+    Create a backend by name, or pick the fastest available one.
+
+    Args:
+        name: ``"python"``, ``"gmpy2"`` or None/``"auto"`` to select
+              gmpy2 when available and fall back to pure Python.
+
+    Returns:
+        FactorialBackend: A backend instance.
+
+    Raises:
+        BackendUnavailableError: If the requested backend is unknown or
+            cannot be loaded.
+
+    Examples:
+        >>> get_backend("python").factorial(5)
+        120
+    """
+    if name is None or name == "auto":
+        return GMPBackend() if is_gmpy2_available() else PythonBackend()
+
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError as e:
+        raise BackendUnavailableError(f"Unknown backend: '{name}'") from e
+    return backend_class()
@@ -0,0 +1,281 @@
+"""
+Result cache for the factorial calculator.
+
+This module provides the memoization store used by FactorialCalculator.
+It behaves like a read-only mapping from n to n! (and from operation
+keys such as ``("binomial", n, k)`` to their results) and can enforce a
+memory budget by evicting the least recently used entries.
+
+The cache has two tiers. Hot entries are kept as ints. When a hot-tier
+budget is set, the least recently used entries are demoted to a cold
+tier of compact ``to_bytes`` blobs, optionally zlib- or lzma-compressed.
+Cold entries store only the odd part of a value and its power-of-two
+exponent, so the roughly n trailing zero bits of n! are neither encoded
+nor compressed. Cold entries are promoted back to the hot tier
+transparently when accessed.
+
+Every operation that touches the tiers holds a re-entrant lock, so one
+cache can be shared by threads, including on free-threaded builds.
+"""
+
+import lzma
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from itertools import chain
+
+from factorial_calculator.exceptions import InvalidInputError
+
+# Base cases that are always cached and never evicted
+BASE_CASES: dict[int, int] = {0: 1, 1: 1}
+
+
+def _identity(data: bytes) -> bytes:
+    """Return data unchanged (no compression)."""
+    return data
+
+
+# Codec name -> (compress, decompress) used for cold entries
+COMPRESSORS: dict[
+    str | None, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+] = {
+    None: (_identity, _identity),
+    "zlib": (zlib.compress, zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+class FactorialCache:
+    """
+    Two-tier memoization store mapping keys to big-integer results.
+
+    Integer keys hold factorials; tuple keys hold results of other
+    operations that share the same byte budget.
+
+    Attributes:
+        max_bytes: Memory budget for cached values, or None for unbounded.
+        max_hot_bytes: Budget of the hot tier before entries are demoted
+            to the cold tier, or None to keep everything hot.
+        compression: Codec of cold entries: "zlib", "lzma" or None.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        max_hot_bytes: int | None = None,
+        compression: str | None = "zlib",
+    ) -> None:
+        """
+        Initialize the cache with the base cases.
+
+        Args:
+            max_bytes: Memory budget for cached values, or None.
+            max_hot_bytes: Hot-tier budget, or None to disable demotion.
+            compression: Codec of cold entries: "zlib", "lzma" or None.
+
+        Raises:
+            InvalidInputError: If the compression codec is unknown.
+        """
+        if compression not in COMPRESSORS:
+            raise InvalidInputError(f"Unknown cache compression: '{compression}'")
+        self.max_bytes = max_bytes
+        self.max_hot_bytes = max_hot_bytes
+        self.compression = compression
+        self._compress, self._decompress = COMPRESSORS[compression]
+        self._track_recency = max_bytes is not None or max_hot_bytes is not None
+        self._hot: OrderedDict[Hashable, int] = OrderedDict(BASE_CASES.items())
+        # Cold entries are (blob of the odd part, size of the value, shift)
+        self._cold: OrderedDict[Hashable, tuple[bytes, int, int]] = OrderedDict()
+        self._hot_bytes = 0
+        self._cold_bytes = 0
+        self._cold_raw_bytes = 0
+        self._lock = threading.RLock()
+        self.evictions = 0
+        self.demotions = 0
+        self.promotions = 0
+
+    def __contains__(self, n: object) -> bool:
+        """Return True if n! is cached in either tier."""
+        return n in self._hot or n in self._cold
+
+    def __getitem__(self, n: Hashable) -> int:
+        """
+        Return the cached n! and mark it as recently used.
+
+        Cold entries are decompressed and promoted to the hot tier.
+
+        Raises:
+            KeyError: If n! is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._hot[n]
+            except KeyError:
+                return self._promote(n)
+            if self._track_recency:
+                self._hot.move_to_end(n)
+            return value
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._hot) + len(self._cold)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over a snapshot of the cached keys."""
+        with self._lock:
+            return chain(list(self._hot), list(self._cold))
+
+    def get(self, n: Hashable, default: int | None = None) -> int | None:
+        """
+        Return the cached n!, or default if it is not cached.
+
+        Args:
+            n: The factorial input or operation key.
+            default: Value returned on a miss.
+
+        Returns:
+            int | None: The cached value or default.
+        """
+        try:
+            return self[n]
+        except KeyError:
+            return default
+
+    def store(self, n: Hashable, value: int) -> None:
+        """
+        Cache n! and evict old entries if the byte budget is exceeded.
+
+        Values larger than the whole budget are not cached.
+
+        Args:
+            n: The factorial input or operation key.
+            value: The factorial of n, or the operation result.
+        """
+        size = sys.getsizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if n in self:
+                return
+            self._hot[n] = value
+            self._hot_bytes += size
+            self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Demote and evict entries until both budgets are respected."""
+        if self.max_hot_bytes is not None:
+            self._demote(self.max_hot_bytes)
+        if self.max_bytes is not None:
+            self._evict(self.max_bytes)
+
+    def _demote(self, max_hot_bytes: int) -> None:
+        """
+        Move least recently used hot entries to the cold tier.
+
+        Base cases and negative values stay hot; they are moved to the
+        most recently used end so that they are not scanned again.
+
+        Args:
+            max_hot_bytes: The hot-tier budget to respect.
+        """
+        pinned = 0
+        while self._hot_bytes > max_hot_bytes and pinned < len(self._hot):
+            n, value = self._hot.popitem(last=False)
+            if n in BASE_CASES or value < 0:
+                self._hot[n] = value
+                pinned += 1
+                continue
+            shift = (value & -value).bit_length() - 1 if value else 0
+            odd = value >> shift
+            blob = self._compress(odd.to_bytes((odd.bit_length() + 7) // 8, "little"))
+            raw_size = (value.bit_length() + 7) // 8
+            self._cold[n] = (blob, raw_size, shift)
+            self._hot_bytes -= sys.getsizeof(value)
+            self._cold_bytes += len(blob)
+            self._cold_raw_bytes += raw_size
+            self.demotions += 1
+
+    def _promote(self, n: Hashable) -> int:
+        """
+        Move a cold entry back to the hot tier.
+
+        Args:
+            n: Key of the cold entry.
+
+        Returns:
+            int: The decoded value.
+
+        Raises:
+            KeyError: If n is not in the cold tier.
+        """
+        blob, raw_size, shift = self._cold.pop(n)
+        value = int.from_bytes(self._decompress(blob), "little") << shift
+        self._cold_bytes -= len(blob)
+        self._cold_raw_bytes -= raw_size
+        self._hot[n] = value
+        self._hot_bytes += sys.getsizeof(value)
+        self.promotions += 1
+        self._rebalance()
+        return value
+
+    def _evict(self, max_bytes: int) -> None:
+        """
+        Drop entries until within max_bytes, oldest cold entries first.
+
+        Args:
+            max_bytes: The budget to respect.
+        """
+        while self._cold and self.nbytes > max_bytes:
+            _, (blob, raw_size, _) = self._cold.popitem(last=False)
+            self._cold_bytes -= len(blob)
+            self._cold_raw_bytes -= raw_size
+            self.evictions += 1
+        pinned = 0
+        while self.nbytes > max_bytes and pinned < len(self._hot):
+            n, value = self._hot.popitem(last=False)
+            if n in BASE_CASES:
+                self._hot[n] = value
+                pinned += 1
+                continue
+            self._hot_bytes -= sys.getsizeof(value)
+            self.evictions += 1
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by cached values, excluding base cases."""
+        return self._hot_bytes + self._cold_bytes
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Report the size of each tier.
+
+        Returns:
+            dict[str, int | float]: Entry and byte counts per tier, the
+            cold-tier compression ratio (bytes of the full values per
+            stored byte, counting the stripped zero bits) and
+            demotion, promotion and eviction counters.
+        """
+        with self._lock:
+            return {
+                "hot_entries": len(self._hot),
+                "hot_bytes": self._hot_bytes,
+                "cold_entries": len(self._cold),
+                "cold_bytes": self._cold_bytes,
+                "compression_ratio": (
+                    self._cold_raw_bytes / self._cold_bytes if self._cold_bytes else 1.0
+                ),
+                "demotions": self.demotions,
+                "promotions": self.promotions,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        """Reset the cache to the base cases."""
+        with self._lock:
+            self._hot = OrderedDict(BASE_CASES.items())
+            self._cold = OrderedDict()
+            self._hot_bytes = 0
+            self._cold_bytes = 0
+            self._cold_raw_bytes = 0
@@ -6,11 +6,84 @@ factorial calculation.
 """
 
 import argparse
+import contextlib
 import sys
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import NoReturn
 
-from factorial_calculator.core import FactorialCalculatorFactory
-from factorial_calculator.exceptions import FactorialError
+from factorial_calculator.core import (
+    STRATEGY_MIN_INPUTS,
+    FactorialCalculator,
+    FactorialCalculatorFactory,
+    available_strategies,
+)
+from factorial_calculator.distributed import (
+    DEFAULT_PORT,
+    DEFAULT_WORKER_MAX_INPUT,
+    Coordinator,
+    WorkerServer,
+    parse_address,
+)
+from factorial_calculator.exceptions import (
+    ComputationCancelledError,
+    FactorialError,
+    InvalidInputError,
+)
+from factorial_calculator.loadtest import (
+    DISTRIBUTIONS,
+    MODES,
+    TraceRequest,
+    read_trace,
+    replay,
+    synthetic_trace,
+    write_trace,
+)
+from factorial_calculator.policy import (
+    DEFAULT_POLICY,
+    CancellationToken,
+    ResourcePolicy,
+)
+from factorial_calculator.result import FactorialResult
+from factorial_calculator.simulator import (
+    CostModel,
+    default_policies,
+    format_reports,
+    simulate,
+    trace_inputs,
+)
+from factorial_calculator.tuning import (
+    DEFAULT_TUNING_SIZES,
+    PROFILE_ENV_VAR,
+    load_profile,
+    save_profile,
+    tune,
+)
+from factorial_calculator.validator import InputValidator
+
+# Operations selectable with --kind: (display name, notation template).
+# Templates receive the input as {n} and --order as {k}.
+KINDS: dict[str, tuple[str, str]] = {
+    "factorial": ("factorial", "{n}!"),
+    "double": ("double factorial", "{n}!!"),
+    "multi": ("multifactorial", "{n}!({k})"),
+    "rising": ("rising factorial", "{n}^({k})"),
+    "falling": ("falling factorial", "({n})_{k}"),
+    "primorial": ("primorial", "{n}#"),
+    "subfactorial": ("subfactorial", "!{n}"),
+}
+
+# Subcommands dispatched before the main parser: name -> handler method
+SUBCOMMANDS: dict[str, str] = {
+    "tune": "_handle_tune",
+    "load": "_handle_load",
+    "simulate": "_handle_simulate",
+    "worker": "_handle_worker",
+    "coordinate": "_handle_coordinate",
+}
+
+# Seconds between progress updates of a background calculation
+PROGRESS_INTERVAL = 0.5
 
 
 class CLI:
@@ -25,6 +98,10 @@ class CLI:
         """Initialize the CLI with a calculator instance."""
         self.calculator = FactorialCalculatorFactory.get_calculator()
         self.parser = self._create_parser()
+        self.kind = "factorial"
+        self.order = "2"
+        self.parallel = False
+        self.workers: int | None = None
 
     def _create_parser(self) -> argparse.ArgumentParser:
         """
@@ -65,6 +142,55 @@ class CLI:
             help="Calculate factorials for a range of numbers",
         )
 
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Compute --range in chunks on worker processes",
+        )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            metavar="N",
+            help="Worker processes for --parallel (default: CPU count)",
+        )
+
+        parser.add_argument(
+            "-k",
+            "--kind",
+            choices=list(KINDS),
+            default="factorial",
+            help="Operation to compute (default: factorial)",
+        )
+
+        parser.add_argument(
+            "--order",
+            type=str,
+            default="2",
+            metavar="K",
+            help="Step for --kind multi, number of factors for rising/falling",
+        )
+
+        parser.add_argument(
+            "--max-input",
+            type=int,
+            metavar="N",
+            help=f"Largest accepted input (default: {DEFAULT_POLICY.max_input})",
+        )
+
+        parser.add_argument(
+            "--time-limit",
+            type=float,
+            metavar="SECONDS",
+            help="Abort calculations that take longer than SECONDS",
+        )
+
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Check each computed factorial against its modular residues",
+        )
+
         return parser
 
     def run(self, args: list | None = None) -> int:
@@ -78,7 +204,16 @@ class CLI:
             int: Exit code (0 for success, 1 for error).
         """
         try:
+            if args is None:
+                args = sys.argv[1:]
+            if args and args[0] in SUBCOMMANDS:
+                handler = getattr(self, SUBCOMMANDS[args[0]])
+                return int(handler(args[1:]))
+
             parsed_args = self.parser.parse_args(args)
+            self._apply_policy(parsed_args)
+            self.kind, self.order = parsed_args.kind, parsed_args.order
+            self.parallel, self.workers = parsed_args.parallel, parsed_args.workers
 
             # Handle range mode
             if parsed_args.range:
@@ -105,6 +240,71 @@ class CLI:
             print(f"Unexpected error: {e}", file=sys.stderr)
             return 1
 
+    def _apply_policy(self, parsed_args: argparse.Namespace) -> None:
+        """
+        Use a dedicated calculator when limits or verification are requested.
+
+        Args:
+            parsed_args: Parsed command-line arguments.
+        """
+        if (
+            parsed_args.max_input is None
+            and parsed_args.time_limit is None
+            and not parsed_args.verify
+        ):
+            return
+        policy = ResourcePolicy(
+            max_input=(
+                DEFAULT_POLICY.max_input
+                if parsed_args.max_input is None
+                else parsed_args.max_input
+            ),
+            max_wall_time=parsed_args.time_limit,
+        )
+        self.calculator = FactorialCalculator(
+            policy=policy, verify=parsed_args.verify, tuning=load_profile()
+        )
+
+    def _operation(self) -> Callable[[int | str], int]:
+        """
+        Return the calculator operation selected with --kind.
+
+        Returns:
+            Callable[[int | str], int]: Function mapping an input to its result.
+        """
+        calc, order = self.calculator, self.order
+        operations: dict[str, Callable[[int | str], int]] = {
+            "factorial": calc.calculate,
+            "double": calc.double_factorial,
+            "multi": lambda n: calc.multifactorial(n, order),
+            "rising": lambda n: calc.rising_factorial(n, order),
+            "falling": lambda n: calc.falling_factorial(n, order),
+            "primorial": calc.primorial,
+            "subfactorial": calc.subfactorial,
+        }
+        return operations[self.kind]
+
+    def _print_result(self, prefix: str, value: int, end: str = "\n") -> None:
+        """
+        Print a labelled result in decimal.
+
+        Backends with a native radix conversion, such as GMP, convert the
+        whole value at once. Otherwise the digits are streamed in chunks,
+        so the full decimal string of a huge result is never built.
+
+        Args:
+            prefix: Text printed before the digits.
+            value: The result to print.
+            end: Text printed after the digits.
+        """
+        sys.stdout.write(prefix)
+        backend = self.calculator.backend
+        if backend.native_to_string:
+            sys.stdout.write(backend.to_string(value))
+        else:
+            FactorialResult(value).write_decimal(sys.stdout)
+        sys.stdout.write(end)
+
     def _handle_argument_mode(self, number: str) -> int:
         """
         Handle calculation when number is provided as argument.
@@ -116,8 +316,13 @@ class CLI:
             int: Exit code.
         """
         try:
-            result = self.calculator.calculate(number)
-            print(f"The factorial of {number} is: {result}")
+            result = self._operation()(number)
+            if self.kind == "factorial":
+                self._print_result(f"The factorial of {number} is: ", result)
+            else:
+                name, notation = KINDS[self.kind]
+                label = notation.format(n=number, k=self.order)
+                self._print_result(f"The {name} {label} is: ", result)
             return 0
         except FactorialError as e:
             print(f"Error: {e}", file=sys.stderr)
@@ -127,38 +332,147 @@ class CLI:
         """
         Handle interactive mode where user is prompted for input.
 
+        Calculations run on a background worker so that Ctrl-C cancels
+        only the calculation in flight, and long jobs report progress.
+        Results are numbered; ``!N`` shows result N again without
+        recomputing it and ``history`` lists them all.
+
         Returns:
             int: Exit code.
         """
         print("=== Factorial Calculator (Interactive Mode) ===")
         print("Enter a non-negative integer to calculate its factorial.")
+        print("Use '!N' to recall result N and 'history' to list results.")
+        print("Press Ctrl-C to cancel a running calculation.")
         print("Type 'quit' or 'exit' to leave.\n")
 
-        while True:
-            try:
-                user_input = input("Enter a number: ").strip()
-
-                if user_input.lower() in ("quit", "exit", "q"):
-                    print("Goodbye!")
+        history: list[tuple[str, int]] = []
+        with ThreadPoolExecutor(max_workers=1) as worker:
+            while True:
+                try:
+                    user_input = input("Enter a number: ").strip()
+
+                    if user_input.lower() in ("quit", "exit", "q"):
+                        print("Goodbye!")
+                        return 0
+
+                    if not user_input:
+                        print("Please enter a value.\n")
+                        continue
+
+                    if user_input.lower() == "history":
+                        self._print_history(history)
+                        continue
+
+                    if user_input.startswith("!"):
+                        index = self._history_index(history, user_input[1:])
+                    else:
+                        result = self._run_in_background(worker, user_input)
+                        if result is None:
+                            print("\nCalculation cancelled.\n")
+                            continue
+                        history.append((user_input, result))
+                        index = len(history)
+
+                    label, result = history[index - 1]
+                    self._print_result(f"Result [{index}]: {label}! = ", result, "\n\n")
+
+                except FactorialError as e:
+                    print(f"Error: {e}\n", file=sys.stderr)
+                except EOFError:
+                    print("\nGoodbye!")
                     return 0
 
-                if not user_input:
-                    print("Please enter a value.\n")
-                    continue
+    def _run_in_background(self, worker: Executor, user_input: str) -> int | None:
+        """
+        Calculate a factorial on the worker, showing progress while waiting.
 
-                result = self.calculator.calculate(user_input)
-                print(f"Result: {user_input}! = {result}\n")
+        Args:
+            worker: Executor running the calculation.
+            user_input: The number entered by the user.
 
-            except FactorialError as e:
-                print(f"Error: {e}\n", file=sys.stderr)
-            except EOFError:
-                print("\nGoodbye!")
-                return 0
+        Returns:
+            int | None: The factorial, or None if Ctrl-C cancelled it.
+
+        Raises:
+            FactorialError: If the calculation fails.
+        """
+        token = self.calculator.policy.new_token() or CancellationToken()
+        future = worker.submit(self.calculator.calculate, user_input, token)
+        shown = False
+        try:
+            while True:
+                try:
+                    result = future.result(timeout=PROGRESS_INTERVAL)
+                    break
+                except TimeoutError:
+                    self._print_progress(token)
+                    shown = True
+        except KeyboardInterrupt:
+            token.cancel()
+            with contextlib.suppress(ComputationCancelledError):
+                future.result()
+            return None
+        finally:
+            if shown:
+                sys.stderr.write("\r\033[K")
+        return result
+
+    def _print_progress(self, token: CancellationToken) -> None:
+        """
+        Show the progress and estimated remaining time of a calculation.
+
+        Args:
+            token: Token of the running calculation.
+        """
+        eta = token.eta()
+        remaining = "estimating..." if eta is None else f"about {eta:.1f}s left"
+        sys.stderr.write(f"\r  {token.progress:6.1%} done, {remaining}\033[K")
+        sys.stderr.flush()
+
+    @staticmethod
+    def _history_index(history: list[tuple[str, int]], reference: str) -> int:
+        """
+        Resolve a ``!N`` history reference.
+
+        Args:
+            history: Results of the session so far.
+            reference: The text after ``!``.
+
+        Returns:
+            int: The 1-based index of the referenced result.
+
+        Raises:
+            InvalidInputError: If the reference does not name a result.
+        """
+        if not reference.isdigit() or not 1 <= int(reference) <= len(history):
+            raise InvalidInputError(f"No result !{reference} in history")
+        return int(reference)
+
+    def _print_history(self, history: list[tuple[str, int]]) -> None:
+        """
+        List the results of the session by number.
+
+        Args:
+            history: Results of the session so far.
+        """
+        if not history:
+            print("No results yet.\n")
+            return
+        for index, (label, result) in enumerate(history, 1):
+            digits = FactorialResult(result).digit_count
+            print(f"  !{index}: {label}! ({digits} digits)")
+        print()
 
     def _handle_range_mode(self, start: str, end: str) -> int:
         """
         Handle calculation for a range of numbers.
 
+        Results are printed as they are produced, in ascending order.
+        Factorial ranges are accumulated in decimal limbs, so each line
+        is written without a binary-to-decimal conversion; with
+        --parallel, chunks of the range are swept by worker processes.
+
         Args:
             start: Starting number.
             end: Ending number.
@@ -167,15 +481,343 @@ class CLI:
             int: Exit code.
         """
         try:
-            results = self.calculator.calculate_range(start, end)
-            print(f"Factorials from {start} to {end}:")
-            for num, factorial in sorted(results.items()):
-                print(f"  {num}! = {factorial}")
+            name, notation = KINDS[self.kind]
+            if self.kind != "factorial" and (self.parallel or self.workers):
+                raise InvalidInputError(
+                    "--parallel and --workers only apply to factorial ranges"
+                )
+            if self.workers and not self.parallel:
+                raise InvalidInputError("--workers requires --parallel")
+            if self.kind == "factorial":
+                decimals = self.calculator.iter_range_decimal(
+                    start, end, parallel=self.parallel, workers=self.workers
+                )
+                print(f"{name.capitalize()}s from {start} to {end}:")
+                for num, chunks in decimals:
+                    label = notation.format(n=num, k=self.order)
+                    sys.stdout.write(f"  {label} = ")
+                    sys.stdout.writelines(chunks)
+                    sys.stdout.write("\n")
+                return 0
+
+            low, high = sorted(
+                InputValidator.validate_number(value, self.calculator.policy)
+                for value in (start, end)
+            )
+            operation = self._operation()
+            print(f"{name.capitalize()}s from {start} to {end}:")
+            for num in range(low, high + 1):
+                value = operation(num)
+                label = notation.format(n=num, k=self.order)
+                self._print_result(f"  {label} = ", value)
             return 0
         except FactorialError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
 
+    def _handle_tune(self, args: list[str]) -> int:
+        """
+        Benchmark the factorial strategies and write a tuning profile.
+
+        Args:
+            args: Arguments following ``tune``.
+
+        Returns:
+            int: Exit code.
+        """
+        parser = argparse.ArgumentParser(
+            prog="factorial tune",
+            description="Measure factorial strategies on this machine and "
+            "save the fastest choice per input size",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            metavar="PATH",
+            help=f"Profile file (default: ${PROFILE_ENV_VAR} or the user "
+            "configuration directory)",
+        )
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=list(DEFAULT_TUNING_SIZES),
+            metavar="N",
+            help="Input sizes to measure",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Measurements per size"
+        )
+        parsed_args = parser.parse_args(args)
+
+        strategies = available_strategies()
+        print(f"Tuning strategies: {', '.join(strategies)}")
+        try:
+            profile = tune(
+                strategies,
+                parsed_args.sizes,
+                parsed_args.repeat,
+                min_inputs=STRATEGY_MIN_INPUTS,
+            )
+        except FactorialError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        for size, timings in profile.timings.items():
+            best = min(timings, key=timings.__getitem__)
+            cells = "  ".join(f"{name}={t * 1e6:.1f}us" for name, t in timings.items())
+            print(f"  n={size:>8}: {cells}  -> {best}")
+        path = save_profile(profile, parsed_args.output)
+        print(f"Tuning profile written to {path}")
+        return 0
+
+    def _handle_load(self, args: list[str]) -> int:
+        """
+        Replay a recorded or synthetic trace and print a load report.
+
+        Args:
+            args: Arguments following ``load``.
+
+        Returns:
+            int: Exit code.
+        """
+        parser = argparse.ArgumentParser(
+            prog="factorial load",
+            description="Replay a JSONL request trace and report throughput, "
+            "latency percentiles, cache hit ratio and peak RSS",
+        )
+        self._add_trace_arguments(parser)
+        parser.add_argument(
+            "-c", "--concurrency", type=int, default=4, help="Concurrent workers"
+        )
+        parser.add_argument(
+            "--mode", choices=MODES, default="thread", help="Concurrency model"
+        )
+        parser.add_argument(
+            "--pace",
+            action="store_true",
+            help="Issue requests at their trace timestamps",
+        )
+        parsed_args = parser.parse_args(args)
+
+        try:
+            report = replay(
+                self._load_trace(parsed_args),
+                FactorialCalculator(policy=self.calculator.policy),
+                concurrency=parsed_args.concurrency,
+                mode=parsed_args.mode,
+                pace=parsed_args.pace,
+            )
+        except (FactorialError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        print(report.format())
+        return 0
+
+    def _handle_simulate(self, args: list[str]) -> int:
+        """
+        Replay a trace through simulated cache policies and compare them.
+
+        Args:
+            args: Arguments following ``simulate``.
+
+        Returns:
+            int: Exit code.
+        """
+        parser = argparse.ArgumentParser(
+            prog="factorial simulate",
+            description="Estimate hit ratio, memory footprint and compute "
+            "time of cache policies on a JSONL request trace, without "
+            "computing any factorial",
+        )
+        self._add_trace_arguments(parser)
+        parser.add_argument(
+            "--entries",
+            type=int,
+            default=256,
+            help="Capacity of the LRU and LFU policies",
+        )
+        parser.add_argument(
+            "--max-bytes",
+            type=int,
+            default=64 * 1024 * 1024,
+            help="Budget of the byte-budgeted policy",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=100, help="Checkpoint interval"
+        )
+        parsed_args = parser.parse_args(args)
+
+        try:
+            inputs = trace_inputs(self._load_trace(parsed_args))
+            policies = default_policies(
+                parsed_args.entries, parsed_args.max_bytes, parsed_args.interval
+            )
+            print("Measuring multiplication costs...", file=sys.stderr)
+            reports = simulate(inputs, policies, CostModel.measure())
+        except (FactorialError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        print(f"Requests: {len(inputs)}")
+        print(format_reports(reports))
+        return 0
+
+    def _handle_worker(self, args: list[str]) -> int:
+        """
+        Serve range products to distributed coordinators until interrupted.
+
+        Args:
+            args: Arguments following ``worker``.
+
+        Returns:
+            int: Exit code.
+        """
+        parser = argparse.ArgumentParser(
+            prog="factorial worker",
+            description="Compute sub-range products for a distributed "
+            "coordinator over TCP",
+        )
+        parser.add_argument(
+            "--listen",
+            metavar="[HOST:]PORT",
+            default=f"127.0.0.1:{DEFAULT_PORT}",
+            help="Address to listen on (port 0 picks a free port)",
+        )
+        parser.add_argument(
+            "--max-input",
+            type=int,
+            default=DEFAULT_WORKER_MAX_INPUT,
+            help="Largest factor accepted in a request",
+        )
+        parsed_args = parser.parse_args(args)
+
+        try:
+            address = parse_address(parsed_args.listen)
+            server = WorkerServer(address, parsed_args.max_input)
+        except (FactorialError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        with server:
+            host, port = server.socket.getsockname()[:2]
+            print(f"Worker listening on {host}:{port}", flush=True)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("\nWorker stopped.")
+        return 0
+
+    def _handle_coordinate(self, args: list[str]) -> int:
+        """
+        Compute a factorial on distributed workers and print it.
+
+        Args:
+            args: Arguments following ``coordinate``.
+
+        Returns:
+            int: Exit code.
+        """
+        parser = argparse.ArgumentParser(
+            prog="factorial coordinate",
+            description="Split a factorial across workers started with "
+            "'factorial worker --listen'",
+        )
+        parser.add_argument("number", type=str, help="Number to calculate")
+        parser.add_argument(
+            "-w",
+            "--worker",
+            action="append",
+            required=True,
+            metavar="HOST:PORT",
+            help="Worker address (repeat for each worker)",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=2,
+            help="Connection failures tolerated per worker",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=300.0,
+            help="Seconds to wait for a connection or a response",
+        )
+        parsed_args = parser.parse_args(args)
+
+        try:
+            n = InputValidator.validate_number(
+                parsed_args.number, ResourcePolicy(max_input=DEFAULT_WORKER_MAX_INPUT)
+            )
+            coordinator = Coordinator(
+                parsed_args.worker, parsed_args.retries, parsed_args.timeout
+            )
+            result = coordinator.factorial(n)
+        except FactorialError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        self._print_result(f"The factorial of {n} is: ", result)
+        return 0
+
+    @staticmethod
+    def _add_trace_arguments(parser: argparse.ArgumentParser) -> None:
+        """
+        Add the trace file and synthetic trace options to a parser.
+
+        Args:
+            parser: Parser of the ``load`` or ``simulate`` subcommand.
+        """
+        parser.add_argument("trace", nargs="?", help="JSONL trace to replay")
+        parser.add_argument(
+            "--synthetic",
+            choices=DISTRIBUTIONS,
+            default="zipf",
+            help="Distribution of the generated trace when no file is given",
+        )
+        parser.add_argument(
+            "--count", type=int, default=10000, help="Synthetic requests"
+        )
+        parser.add_argument(
+            "--max-n", type=int, default=1000, help="Largest synthetic input"
+        )
+        parser.add_argument(
+            "--rate", type=float, help="Synthetic arrivals per second (Poisson)"
+        )
+        parser.add_argument("--seed", type=int, help="Synthetic trace seed")
+        parser.add_argument(
+            "--write-trace", metavar="PATH", help="Save the replayed trace"
+        )
+
+    @staticmethod
+    def _load_trace(parsed_args: argparse.Namespace) -> list[TraceRequest]:
+        """
+        Read the trace file, or generate a synthetic trace, and save it.
+
+        Args:
+            parsed_args: Options added by _add_trace_arguments().
+
+        Returns:
+            list[TraceRequest]: The requests to replay.
+
+        Raises:
+            InvalidInputError: If the trace or its options are invalid.
+            OSError: If a trace file cannot be read or written.
+        """
+        if parsed_args.trace:
+            requests = read_trace(parsed_args.trace)
+        else:
+            requests = synthetic_trace(
+                parsed_args.synthetic,
+                parsed_args.count,
+                parsed_args.max_n,
+                rate=parsed_args.rate,
+                seed=parsed_args.seed,
+            )
+        if parsed_args.write_trace:
+            write_trace(requests, parsed_args.write_trace)
+        return requests
+
 
 def main() -> NoReturn:
     """
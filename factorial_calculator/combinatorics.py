@@ -0,0 +1,178 @@
+"""
+Combinatorics built on prime factorisation.
+
+This module computes binomial coefficients, permutations and
+multinomial coefficients without building any full factorial. Binomial
+and multinomial coefficients are assembled from Legendre exponent
+differences over the shared prime sieve; permutations are a product over
+a range. Every function validates its inputs and caches its result
+through a FactorialCalculator, sharing its policy and statistics.
+"""
+
+import math
+from collections.abc import Sequence
+
+from factorial_calculator.core import (
+    FactorialCalculator,
+    FactorialCalculatorFactory,
+    product_tree,
+)
+from factorial_calculator.primes import get_sieve, legendre_exponent
+from factorial_calculator.validator import InputValidator
+
+
+def _from_exponents(top: int, bottoms: Sequence[int]) -> int:
+    """
+    Compute top! / prod(b! for b in bottoms) from prime exponents.
+
+    Args:
+        top: Numerator factorial input.
+        bottoms: Denominator factorial inputs summing to at most top.
+
+    Returns:
+        int: The exact quotient.
+    """
+    powers = []
+    for p in get_sieve().primes_up_to(top):
+        exponent = legendre_exponent(top, p)
+        for b in bottoms:
+            if b >= p:
+                exponent -= legendre_exponent(b, p)
+        if exponent:
+            powers.append(p if exponent == 1 else p**exponent)
+    return product_tree(powers)
+
+
+def log2_factorial(n: int) -> float:
+    """
+    Return log2(n!) as a float, without computing n!.
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        float: The base-2 logarithm of n!.
+
+    Examples:
+        >>> round(log2_factorial(10), 3)
+        21.791
+    """
+    return math.lgamma(n + 1) / math.log(2)
+
+
+def binomial(
+    n: int | str, k: int | str, calculator: FactorialCalculator | None = None
+) -> int:
+    """
+    Calculate the binomial coefficient C(n, k).
+
+    Args:
+        n: Size of the set.
+        k: Size of the chosen subset.
+        calculator: Calculator providing validation, cache and
+                    statistics, or None for the factory singleton.
+
+    Returns:
+        int: The number of k-element subsets of an n-element set
+        (0 when k > n).
+
+    Raises:
+        InvalidInputError: If n or k is invalid or out of range.
+        OverflowError: If the result would exceed the policy limits.
+
+    Examples:
+        >>> binomial(5, 2)
+        10
+    """
+    calc = calculator or FactorialCalculatorFactory.get_calculator()
+    n = InputValidator.validate_number(n, calc.policy)
+    k = InputValidator.validate_number(k, calc.policy)
+    if k > n:
+        return 0
+    k = min(k, n - k)
+
+    def compute() -> int:
+        bits = log2_factorial(n) - log2_factorial(k) - log2_factorial(n - k)
+        calc.policy.check_result_bits(int(bits) + 1, f"C({n}, {k})")
+        if k < 2:
+            return n if k else 1
+        return _from_exponents(n, (k, n - k))
+
+    return calc.memoize(("binomial", n, k), compute)
+
+
+def permutations(
+    n: int | str, k: int | str, calculator: FactorialCalculator | None = None
+) -> int:
+    """
+    Calculate the number of k-permutations of n, n! / (n - k)!.
+
+    The result is the product of the range (n - k, n], so no factorial
+    is ever built.
+
+    Args:
+        n: Size of the set.
+        k: Length of the arrangements.
+        calculator: Calculator providing validation, cache and
+                    statistics, or None for the factory singleton.
+
+    Returns:
+        int: The number of ordered k-arrangements (0 when k > n).
+
+    Raises:
+        InvalidInputError: If n or k is invalid or out of range.
+        OverflowError: If the result would exceed the policy limits.
+
+    Examples:
+        >>> permutations(5, 2)
+        20
+    """
+    calc = calculator or FactorialCalculatorFactory.get_calculator()
+    n = InputValidator.validate_number(n, calc.policy)
+    k = InputValidator.validate_number(k, calc.policy)
+    if k > n:
+        return 0
+
+    def compute() -> int:
+        bits = log2_factorial(n) - log2_factorial(n - k)
+        calc.policy.check_result_bits(int(bits) + 1, f"P({n}, {k})")
+        return product_tree(range(n - k + 1, n + 1))
+
+    return calc.memoize(("permutations", n, k), compute)
+
+
+def multinomial(
+    counts: Sequence[int | str], calculator: FactorialCalculator | None = None
+) -> int:
+    """
+    Calculate the multinomial coefficient (k1 + ... + km)! / (k1! ... km!).
+
+    Args:
+        counts: The group sizes k1..km; their sum must be a valid input.
+        calculator: Calculator providing validation, cache and
+                    statistics, or None for the factory singleton.
+
+    Returns:
+        int: The number of ways to split a set into groups of the given
+        sizes.
+
+    Raises:
+        InvalidInputError: If a count or their sum is invalid or out of
+            range.
+        OverflowError: If the result would exceed the policy limits.
+
+    Examples:
+        >>> multinomial([2, 1, 1])
+        12
+    """
+    calc = calculator or FactorialCalculatorFactory.get_calculator()
+    ks = [InputValidator.validate_number(k, calc.policy) for k in counts]
+    n = InputValidator.validate_number(sum(ks), calc.policy)
+    bottoms = tuple(sorted((k for k in ks if k > 1), reverse=True))
+
+    def compute() -> int:
+        bits = log2_factorial(n) - sum(log2_factorial(k) for k in bottoms)
+        calc.policy.check_result_bits(int(bits) + 1, f"Multinomial of {n}")
+        return _from_exponents(n, bottoms)
+
+    return calc.memoize(("multinomial", n, bottoms), compute)
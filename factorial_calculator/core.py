@@ -5,8 +5,536 @@ This module implements the main factorial calculation logic using
 object-oriented design patterns and optimized algorithms.
 """
 
-from factorial_calculator.exceptions import OverflowError
+import itertools
+import math
+import operator
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from factorial_calculator.backends import FactorialBackend, get_backend
+from factorial_calculator.cache import FactorialCache
+from factorial_calculator.exceptions import InvalidInputError, OverflowError
+from factorial_calculator.policy import (
+    DEFAULT_POLICY,
+    CancellationToken,
+    ResourcePolicy,
+    estimate_factorial_bits,
+)
+from factorial_calculator.prefetch import (
+    DEFAULT_DEPTH,
+    DEFAULT_IDLE_DELAY,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_CPU_FRACTION,
+    DEFAULT_MAX_INPUT,
+    Prefetcher,
+)
+from factorial_calculator.primes import get_sieve, legendre_exponent
+from factorial_calculator.result import FactorialResult
+from factorial_calculator.tuning import DEFAULT_PROFILE, TuningProfile, load_profile
 from factorial_calculator.validator import InputValidator
+from factorial_calculator.verification import verify_factorial
+
+# Number of factors per leaf of the cancellable product tree
+CHUNK_SIZE = 512
+
+# Number of factors below which the range-product engine multiplies
+# sequentially instead of splitting further
+LEAF_SIZE = 32
+
+# Bits available to packed products of small factors; products below
+# 2**60 stay in a single machine word on every 64-bit build
+WORD_BITS = 60
+
+# Smallest n for which parallel_factorial starts worker processes
+PARALLEL_MIN_INPUT = 20000
+
+# Approximate bits of results returned by one parallel range chunk; with
+# at most two chunks in flight per worker this bounds buffered memory
+PARALLEL_CHUNK_BITS = 1 << 26
+
+# Largest n whose factorial fits in an unsigned 64-bit word
+MAX_UINT64_FACTORIAL_INPUT = 20
+
+# Largest n whose factorial is a finite double
+MAX_FLOAT_FACTORIAL_INPUT = 170
+
+# Exact factorials 0! .. 170!, served ahead of validation for exact ints
+SMALL_FACTORIAL_LIMIT = MAX_FLOAT_FACTORIAL_INPUT
+SMALL_FACTORIALS: tuple[int, ...] = tuple(
+    itertools.accumulate(range(1, SMALL_FACTORIAL_LIMIT + 1), operator.mul, initial=1)
+)
+
+# Growth exponent of big-integer multiplication cost with operand size
+_KARATSUBA_EXPONENT = math.log2(3)
+
+# Upper bound of theta(n) / n (Rosser and Schoenfeld), used to size primorials
+_PRIMORIAL_BITS_PER_N = 1.01624 / math.log(2)
+
+
+def product_tree(factors: Sequence[int]) -> int:
+    """
+    Multiply a sequence of integers as a balanced binary tree.
+
+    Pairing operands of similar size keeps big-integer multiplications
+    balanced, which is much faster than a left-to-right fold.
+
+    Args:
+        factors: The integers to multiply.
+
+    Returns:
+        int: The product of all factors (1 for an empty sequence).
+
+    Examples:
+        >>> product_tree([2, 3, 4, 5])
+        120
+    """
+    values = list(factors)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [a * b for a, b in zip(values[::2], values[1::2], strict=False)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def _merge_cost(sizes: list[int]) -> float:
+    """
+    Estimate the cost of merging operands of the given bit sizes pairwise.
+
+    Args:
+        sizes: Bit lengths of the operands, in merge order.
+
+    Returns:
+        float: Sum of the result sizes of every multiplication raised to
+        the Karatsuba exponent (never below 1).
+    """
+    total = 1.0
+    while len(sizes) > 1:
+        paired = [a + b for a, b in zip(sizes[::2], sizes[1::2], strict=False)]
+        total += sum(size**_KARATSUBA_EXPONENT for size in paired)
+        if len(sizes) % 2:
+            paired.append(sizes[-1])
+        sizes = paired
+    return total
+
+
+def range_product(low: int, high: int, step: int = 1) -> int:
+    """
+    Multiply the arithmetic progression low, low + step, ..., <= high.
+
+    This is the shared engine behind factorials and the generalised
+    factorial family. The range is split recursively so that both
+    halves of every multiplication have similar sizes.
+
+    Args:
+        low: First factor.
+        high: Upper bound of the factors (inclusive).
+        step: Positive difference between consecutive factors.
+
+    Returns:
+        int: The product (1 for an empty range).
+
+    Examples:
+        >>> range_product(2, 5)
+        120
+        >>> range_product(1, 9, 2)
+        945
+    """
+    if low > high:
+        return 1
+    count = (high - low) // step + 1
+    if count <= LEAF_SIZE:
+        # math.prod already multiplies in machine words while the product
+        # fits; packing such short leaves first only adds overhead
+        return math.prod(range(low, high + 1, step))
+    mid = low + (count // 2) * step
+    return range_product(low, mid - step, step) * range_product(mid, high, step)
+
+
+def word_products(low: int, high: int, step: int = 1) -> Iterator[int]:
+    """
+    Pack the progression low, low + step, ..., <= high into word-sized products.
+
+    Each yielded value multiplies WORD_BITS // high.bit_length()
+    consecutive factors, so it stays below 2**WORD_BITS and is formed
+    with machine-word multiplications. Folding the words into a big
+    integer needs several times fewer big-integer multiplications than
+    folding the factors one by one.
+
+    Args:
+        low: First factor (non-negative).
+        high: Upper bound of the factors (inclusive).
+        step: Positive difference between consecutive factors.
+
+    Yields:
+        int: Products whose overall product is range_product(low, high, step).
+
+    Examples:
+        >>> list(word_products(2, 9))
+        [362880]
+        >>> math.prod(word_products(1, 99, 2)) == range_product(1, 99, 2)
+        True
+    """
+    if low > high:
+        return
+    group = max(1, WORD_BITS // max(high.bit_length(), 1))
+    count = (high - low) // step + 1
+    stop = low + count // group * group * step
+    span = group * step
+    words: Iterator[int] = iter(range(low, stop, span))
+    for offset in range(1, group):
+        words = map(operator.mul, words, range(low + offset * step, stop, span))
+    yield from words
+    if stop <= high:
+        yield math.prod(range(stop, high + 1, step))
+
+
+def _log2_range_product(low: int, high: int, step: int = 1) -> float:
+    """
+    Estimate log2 of range_product(low, high, step) for low >= 1.
+
+    Args:
+        low: First factor.
+        high: Upper bound of the factors (inclusive).
+        step: Positive difference between consecutive factors.
+
+    Returns:
+        float: Approximate bit length of the product.
+    """
+    if low > high:
+        return 0.0
+    count = (high - low) // step + 1
+    last = low + (count - 1) * step
+    log_product = (
+        count * math.log(step) + math.lgamma(last / step + 1) - math.lgamma(low / step)
+    )
+    return log_product / math.log(2)
+
+
+def _subfactorial_maps(low: int, high: int) -> tuple[int, int]:
+    """
+    Compose the maps x -> i * x + (-1)**i for i in low..high.
+
+    The subfactorial recurrence !i = i * !(i - 1) + (-1)**i is affine,
+    so consecutive steps compose into a single map a * x + b. Splitting
+    the range in halves gives the same balanced multiplications as
+    range_product.
+
+    Args:
+        low: First index (inclusive).
+        high: Last index (inclusive).
+
+    Returns:
+        tuple[int, int]: Coefficients (a, b) of the composed map.
+    """
+    if high - low < LEAF_SIZE:
+        a, b = 1, 0
+        for i in range(low, high + 1):
+            a, b = a * i, b * i + (-1 if i & 1 else 1)
+        return a, b
+    mid = (low + high) // 2
+    a1, b1 = _subfactorial_maps(low, mid)
+    a2, b2 = _subfactorial_maps(mid + 1, high)
+    return a2 * a1, a2 * b1 + b2
+
+
+def linear_factorial(n: int) -> int:
+    """
+    Compute n! by folding 2..n into a single running product.
+
+    Factors are packed into machine words by word_products first, so
+    the running product is multiplied once per word, not per factor.
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        int: The factorial of n.
+    """
+    result = 1
+    for word in word_products(2, n):
+        result *= word
+    return result
+
+
+def factorial_two_exponent(n: int) -> int:
+    """
+    Return the exponent of 2 in n! (Legendre: n minus its binary digit sum).
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        int: The number of trailing zero bits of n!.
+
+    Examples:
+        >>> factorial_two_exponent(10)
+        8
+    """
+    return n - n.bit_count()
+
+
+def odd_factorial(n: int) -> int:
+    """
+    Compute the odd part of n!, n! >> factorial_two_exponent(n).
+
+    n! = 2**(n // 2) * (n // 2)! * (1 * 3 * 5 * ... <= n), so the odd
+    part is the product over k of the odd numbers up to n >> k. Walking k
+    downwards, each block of odd numbers in (n >> (k + 1), n >> k] joins
+    a running product that is folded into the result once per level.
+    Only odd factors are ever multiplied.
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        int: The odd part of n!.
+
+    Examples:
+        >>> odd_factorial(10)
+        14175
+    """
+    result = inner = 1
+    for k in range(n.bit_length() - 1, -1, -1):
+        inner *= range_product((n >> (k + 1)) + 1 | 1, (n >> k) - 1 | 1, 2)
+        result *= inner
+    return result
+
+
+def tree_factorial(n: int) -> int:
+    """
+    Compute n! from its odd part and a single shift.
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        int: The factorial of n.
+    """
+    return odd_factorial(n) << factorial_two_exponent(n)
+
+
+def factorised_factorial(n: int) -> int:
+    """
+    Compute n! from its prime factorisation.
+
+    Primes sharing a Legendre exponent are multiplied together first, so
+    the many large primes with exponent 1 cost a single product tree.
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        int: The factorial of n.
+    """
+    groups: dict[int, list[int]] = {}
+    for p in get_sieve().primes_up_to(n):
+        groups.setdefault(legendre_exponent(n, p), []).append(p)
+    return product_tree([product_tree(primes) ** e for e, primes in groups.items()])
+
+
+def parallel_factorial(n: int, workers: int | None = None) -> int:
+    """
+    Compute n! by splitting the range across worker processes.
+
+    Falls back to tree_factorial on single-core machines and for inputs
+    too small to amortise process start-up.
+
+    Args:
+        n: A non-negative integer.
+        workers: Number of processes, or None for the CPU count.
+
+    Returns:
+        int: The factorial of n.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or n < PARALLEL_MIN_INPUT:
+        return tree_factorial(n)
+    bounds = [2 + (n - 1) * i // workers for i in range(workers + 1)]
+    with ProcessPoolExecutor(workers) as pool:
+        parts = pool.map(range_product, bounds[:-1], [b - 1 for b in bounds[1:]])
+        return product_tree(list(parts))
+
+
+# Strategy name -> function computing n!, selected through TuningProfile
+FACTORIAL_STRATEGIES: dict[str, Callable[[int], int]] = {
+    "linear": linear_factorial,
+    "tree": tree_factorial,
+    "factorised": factorised_factorial,
+    "parallel": parallel_factorial,
+}
+
+# Smallest size at which a strategy differs from tree_factorial, and so
+# is worth measuring when tuning
+STRATEGY_MIN_INPUTS: dict[str, int] = {"parallel": PARALLEL_MIN_INPUT}
+
+
+def factorial_sweep(low: int, high: int) -> list[int]:
+    """
+    Compute low!, (low + 1)!, ..., high! from a single product tree.
+
+    Only low! is built from scratch; every later factorial costs one
+    multiplication by a small integer.
+
+    Args:
+        low: First input (non-negative).
+        high: Last input (inclusive).
+
+    Returns:
+        list[int]: The factorials in input order.
+
+    Examples:
+        >>> factorial_sweep(3, 5)
+        [6, 24, 120]
+    """
+    value = tree_factorial(low)
+    results = [value]
+    for n in range(low + 1, high + 1):
+        value *= n
+        results.append(value)
+    return results
+
+
+def decimal_sweep(low: int, high: int) -> list[str]:
+    """
+    Compute the decimal digits of low!, (low + 1)!, ..., high!.
+
+    Only low! is converted to decimal; the later results are swept in
+    decimal limbs, as for a sequential decimal range.
+
+    Args:
+        low: First input (non-negative).
+        high: Last input (inclusive), at most limbs.MAX_MULTIPLIER.
+
+    Returns:
+        list[str]: The decimal factorials in input order.
+
+    Examples:
+        >>> decimal_sweep(3, 5)
+        ['6', '24', '120']
+    """
+    # Imported here so that NumPy is only loaded for decimal ranges
+    from factorial_calculator.limbs import iter_factorial_decimals
+
+    pairs = iter_factorial_decimals(low, high, tree_factorial(low))
+    return ["".join(chunks) for _, chunks in pairs]
+
+
+def parallel_range(
+    start: int,
+    end: int,
+    workers: int | None = None,
+    token: CancellationToken | None = None,
+    max_in_flight: int | None = None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Stream (n, n!) for start <= n <= end, computed by worker processes.
+
+    The range is split into chunks sized by PARALLEL_CHUNK_BITS. Each
+    worker sweeps one chunk with factorial_sweep(). Results are yielded
+    in input order, and at most max_in_flight chunks are submitted or
+    buffered at any time.
+
+    Args:
+        start: First validated input.
+        end: Last validated input (inclusive), at least start.
+        workers: Number of processes, or None for the CPU count; with a
+                 single worker the chunks are swept in this process.
+        token: Cancellation token checked between chunks, or None.
+        max_in_flight: Chunk limit, or None for two per worker.
+
+    Returns:
+        Iterator[tuple[int, int]]: Pairs (n, n!) in ascending order of n.
+    """
+    return _parallel_sweeps(factorial_sweep, start, end, workers, token, max_in_flight)
+
+
+def parallel_decimal_range(
+    start: int,
+    end: int,
+    workers: int | None = None,
+    token: CancellationToken | None = None,
+    max_in_flight: int | None = None,
+) -> Iterator[tuple[int, str]]:
+    """
+    Stream the decimal digits of n! for start <= n <= end in parallel.
+
+    Chunks are split as for parallel_range(), but each worker sweeps
+    its chunk with decimal_sweep(), so the decimal conversion happens in
+    the workers and only once per chunk.
+
+    Args:
+        start: First validated input.
+        end: Last validated input (inclusive), at least start.
+        workers: Number of processes, or None for the CPU count.
+        token: Cancellation token checked between chunks, or None.
+        max_in_flight: Chunk limit, or None for two per worker.
+
+    Returns:
+        Iterator[tuple[int, str]]: Pairs (n, decimal n!) in ascending
+        order of n.
+    """
+    return _parallel_sweeps(decimal_sweep, start, end, workers, token, max_in_flight)
+
+
+def _parallel_sweeps(
+    sweep: Callable[[int, int], list[Any]],
+    start: int,
+    end: int,
+    workers: int | None,
+    token: CancellationToken | None,
+    max_in_flight: int | None,
+) -> Iterator[tuple[int, Any]]:
+    """Yield (n, result) from sweep() over chunks of a range, in order."""
+    workers = workers or os.cpu_count() or 1
+    size = max(1, PARALLEL_CHUNK_BITS // estimate_factorial_bits(end))
+    size = min(size, -(-(end - start + 1) // workers))
+    chunks = [(low, min(low + size - 1, end)) for low in range(start, end + 1, size)]
+
+    if workers < 2:
+        for low, high in chunks:
+            if token is not None:
+                token.check()
+            yield from zip(itertools.count(low), sweep(low, high))
+        return
+
+    limit = max(max_in_flight or 2 * workers, 1)
+    pending: deque[tuple[int, Future[list[Any]]]] = deque()
+    pool = ProcessPoolExecutor(workers)
+    try:
+        for low, high in chunks:
+            if len(pending) >= limit:
+                first, future = pending.popleft()
+                yield from zip(itertools.count(first), future.result())
+            if token is not None:
+                token.check()
+            pending.append((low, pool.submit(sweep, low, high)))
+        while pending:
+            first, future = pending.popleft()
+            yield from zip(itertools.count(first), future.result())
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def available_strategies() -> dict[str, Callable[[int], int]]:
+    """
+    Return the strategies worth measuring on this machine.
+
+    The parallel strategy is left out on single-core machines, where it
+    is identical to the tree strategy.
+
+    Returns:
+        dict[str, Callable[[int], int]]: Strategy name -> function.
+    """
+    if (os.cpu_count() or 1) > 1:
+        return dict(FACTORIAL_STRATEGIES)
+    return {k: v for k, v in FACTORIAL_STRATEGIES.items() if k != "parallel"}
 
 
 class FactorialCalculator:
@@ -18,29 +546,105 @@ class FactorialCalculator:
     factorial calculation with comprehensive error handling.
 
     Attributes:
-        _cache: Dictionary storing previously calculated factorials.
+        _cache: Cache storing previously calculated factorials.
+        _backend: Arithmetic backend used for the heavy computation.
+        _policy: Resource limits applied to every calculation.
+        _stats: Counters of cache hits and misses. They are updated
+            without locking, so they are approximate under concurrency.
+        _table_hits: Number of calls served from the constant table,
+            counted the same way.
+        _verify: Whether computed factorials are residue-checked.
+        _tuning: Profile mapping each n to a computation strategy.
     """
 
-    def __init__(self) -> None:
-        """Initialize the factorial calculator with an empty cache."""
-        self._cache: dict[int, int] = {0: 1, 1: 1}
+    def __init__(
+        self,
+        backend: FactorialBackend | str | None = None,
+        policy: ResourcePolicy | None = None,
+        cache: FactorialCache | None = None,
+        verify: bool = False,
+        tuning: TuningProfile | None = None,
+    ) -> None:
+        """
+        Initialize the factorial calculator with an empty cache.
+
+        Args:
+            backend: A backend instance, a backend name (``"python"`` or
+                     ``"gmpy2"``) or None to use gmpy2 when it is
+                     available and pure Python otherwise.
+            policy: Resource limits, or None for the default policy.
+            cache: Result cache, e.g. with a compressed cold tier, or None
+                   for a single-tier cache bounded by max_cache_bytes.
+            verify: Check every computed factorial against its residues
+                    modulo word-sized primes before caching it.
+            tuning: Profile choosing the strategy for each n, or None for
+                    the built-in defaults.
+        """
+        self._policy = policy or DEFAULT_POLICY
+        if cache is None:
+            cache = FactorialCache(self._policy.max_cache_bytes)
+        self._cache = cache
+        if not isinstance(backend, FactorialBackend):
+            backend = get_backend(backend)
+        self._backend = backend
+        self._stats: dict[str, int] = {"hits": 0, "misses": 0}
+        self._table_hits = 0
+        self._verify = verify
+        self._tuning = tuning or DEFAULT_PROFILE
+        self._table_limit = self._small_table_limit(self._policy)
+        self._prefetcher: Prefetcher | None = None
+
+    @property
+    def backend(self) -> FactorialBackend:
+        """Return the arithmetic backend used by this calculator."""
+        return self._backend
 
-    def calculate(self, n: int | str) -> int:
+    @property
+    def policy(self) -> ResourcePolicy:
+        """Return the resource policy applied by this calculator."""
+        return self._policy
+
+    @staticmethod
+    def _small_table_limit(policy: ResourcePolicy) -> int:
+        """
+        Return the largest n that the constant table may serve under policy.
+
+        Args:
+            policy: The calculator's resource policy.
+
+        Returns:
+            int: Largest n allowed by both the table and the policy, or -1.
+        """
+        limit = min(SMALL_FACTORIAL_LIMIT, policy.max_input)
+        if policy.max_result_bits is not None:
+            while limit >= 0 and (
+                SMALL_FACTORIALS[limit].bit_length() > policy.max_result_bits
+            ):
+                limit -= 1
+        return limit
+
+    def calculate(self, n: int | str, token: CancellationToken | None = None) -> int:
         """
         Calculate the factorial of a given number.
 
-        This method uses an iterative approach with memoization for
-        optimal performance. The result is cached for future use.
+        The heavy lifting is delegated to the configured backend and the
+        result is cached for future use.
 
         Args:
             n: A non-negative integer for which to calculate the factorial.
+            token: Cancellation token checked between chunks. When None,
+                   a token is created if the policy sets max_wall_time.
 
         Returns:
             int: The factorial of n (n!).
 
         Raises:
             InvalidInputError: If n is invalid or out of range.
-            OverflowError: If calculation would cause overflow.
+            OverflowError: If the result would exceed the policy limits.
+            ComputationCancelledError: If the token is cancelled or its
+                deadline expires before the computation completes.
+            VerificationError: If verification is enabled and the result
+                fails its residue check.
 
         Examples:
             >>> calc = FactorialCalculator()
@@ -49,42 +653,411 @@ class FactorialCalculator:
             >>> calc.calculate(0)
             1
         """
+        # Fast path: exact ints within the constant table skip validation
+        if type(n) is int and 0 <= n <= self._table_limit:
+            self._table_hits += 1
+            if self._prefetcher is not None:
+                self._prefetcher.observe(n)
+            return SMALL_FACTORIALS[n]
+
         # Validate input
-        n = InputValidator.validate_number(n)
+        n = InputValidator.validate_number(n, self._policy)
+        if self._prefetcher is not None:
+            self._prefetcher.observe(n)
+        return self.memoize(n, lambda: self._compute_factorial(n, token))
 
-        # Check cache first
-        if n in self._cache:
-            return self._cache[n]
+    def calculate_lazy(
+        self, n: int | str, token: CancellationToken | None = None
+    ) -> FactorialResult:
+        """
+        Calculate n! and wrap it in a lazily formatted result.
 
-        # Calculate factorial iteratively with overflow detection
-        try:
-            result = 1
-            for i in range(2, n + 1):
-                prev_result = result
-                result *= i
-
-                # Check for potential overflow by verifying result integrity
-                if result // i != prev_result:
-                    raise OverflowError(
-                        f"Factorial calculation for {n} would cause overflow"
-                    )
-
-            # Cache the result
-            self._cache[n] = result
+        Views such as the digit count or the leading digits are derived
+        on demand, so callers that only need a few properties never pay
+        for a full decimal conversion. On a miss served by the default
+        strategy, the result keeps the odd part of n! it was computed
+        from, so its hex and byte forms skip the trailing zero bits.
+
+        Args:
+            n: A non-negative integer for which to calculate the factorial.
+            token: Cancellation token, as for calculate().
+
+        Returns:
+            FactorialResult: The factorial of n.
+
+        Raises:
+            InvalidInputError: If n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+            ComputationCancelledError: If the computation is cancelled.
+
+        Examples:
+            >>> FactorialCalculator().calculate_lazy(25).digit_count
+            26
+        """
+        n = InputValidator.validate_number(n, self._policy)
+        if self._prefetcher is not None:
+            self._prefetcher.observe(n)
+        if not self._computes_odd_part(n, token):
+            return FactorialResult(self.calculate(n, token), n)
+
+        computed: FactorialResult | None = None
+
+        def compute() -> int:
+            nonlocal computed
+            self._policy.check_result_size(n)
+            computed = FactorialResult.from_odd_part(
+                odd_factorial(n), factorial_two_exponent(n), n
+            )
+            return computed.value
+
+        value = self.memoize(n, compute)
+        return computed or FactorialResult(value, n)
+
+    def _computes_odd_part(self, n: int, token: CancellationToken | None) -> bool:
+        """
+        Check whether a miss for n! would be served by tree_factorial.
+
+        Args:
+            n: A validated non-negative integer.
+            token: Cancellation token passed by the caller.
+
+        Returns:
+            bool: True if n is beyond the constant table and no token,
+            verification or native backend applies.
+        """
+        return (
+            n > self._table_limit
+            and token is None
+            and self._policy.max_wall_time is None
+            and not self._verify
+            and not self._backend.native_factorial
+            and FACTORIAL_STRATEGIES.get(self._tuning.strategy_for(n), tree_factorial)
+            is tree_factorial
+        )
+
+    def memoize(self, key: Hashable, compute: Callable[[], int]) -> int:
+        """
+        Return the cached result for key, computing it on a miss.
+
+        This is the shared caching path for factorials (integer keys)
+        and derived operations (tuple keys). Hits and misses are counted
+        in the calculator statistics.
+
+        Args:
+            key: Cache key of the result.
+            compute: Zero-argument callable producing the result.
+
+        Returns:
+            int: The cached or freshly computed result.
+
+        Raises:
+            OverflowError: If the computation runs out of memory.
+        """
+        result = self._cache.get(key)
+        if result is not None:
+            self._stats["hits"] += 1
             return result
 
+        self._stats["misses"] += 1
+        try:
+            result = compute()
         except MemoryError as e:
             raise OverflowError(
-                f"Factorial calculation for {n} exceeded memory limits"
+                f"Calculation for {key!r} exceeded memory limits"
             ) from e
 
-    def calculate_range(self, start: int | str, end: int | str) -> dict[int, int]:
+        # Cache the result
+        self._cache.store(key, result)
+        return result
+
+    def _compute_factorial(self, n: int, token: CancellationToken | None) -> int:
+        """
+        Compute n! within the policy limits.
+
+        Args:
+            n: A validated non-negative integer.
+            token: Cancellation token, or None to use the policy default.
+
+        Returns:
+            int: The factorial of n.
+
+        Raises:
+            VerificationError: If verification is enabled and the result
+                fails its residue check.
+        """
+        self._policy.check_result_size(n)
+        if token is None:
+            token = self._policy.new_token()
+        if token is not None:
+            result = self._chunked_factorial(n, token)
+        elif self._backend.native_factorial:
+            result = self._backend.factorial(n)
+        else:
+            strategy = self._tuning.strategy_for(n)
+            result = FACTORIAL_STRATEGIES.get(strategy, tree_factorial)(n)
+        if self._verify:
+            verify_factorial(n, result)
+        return result
+
+    def _chunked_factorial(self, n: int, token: CancellationToken) -> int:
+        """
+        Compute n! as a product tree of chunks, checking the token between them.
+
+        The factors are multiplied in chunks of CHUNK_SIZE, whose powers of
+        two are stripped and applied with a single shift at the end. The
+        odd chunk products are then merged pairwise like product_tree, so
+        operands stay balanced and the cost matches the untokened path.
+        Progress is reported as the share of the estimated merge cost
+        done, each multiplication weighing its result size to the power
+        of the Karatsuba exponent.
+
+        Args:
+            n: A validated non-negative integer.
+            token: Cancellation token polled before every multiplication.
+
+        Returns:
+            int: The factorial of n.
+        """
+        values = []
+        shift = 0
+        for low in range(2, n + 1, CHUNK_SIZE):
+            token.check()
+            chunk = range_product(low, min(low + CHUNK_SIZE - 1, n))
+            zeros = (chunk & -chunk).bit_length() - 1
+            shift += zeros
+            values.append(chunk >> zeros)
+
+        total = _merge_cost([value.bit_length() for value in values])
+        done = 0.0
+        while len(values) > 1:
+            paired = []
+            for a, b in zip(values[::2], values[1::2], strict=False):
+                token.report_progress(done / total)
+                token.check()
+                product = self._backend.multiply(a, b)
+                done += product.bit_length() ** _KARATSUBA_EXPONENT
+                paired.append(product)
+            if len(values) % 2:
+                paired.append(values[-1])
+            values = paired
+        token.report_progress(1.0)
+        return (values[0] if values else 1) << shift
+
+    def _derived(
+        self,
+        key: tuple,
+        log2_size: float,
+        description: str,
+        compute: Callable[[], int],
+    ) -> int:
+        """
+        Compute a derived result within the policy limits, with caching.
+
+        Args:
+            key: Cache key of the result.
+            log2_size: Estimated bit length of the result.
+            description: Human-readable name of the result for errors.
+            compute: Zero-argument callable producing the result.
+
+        Returns:
+            int: The cached or freshly computed result.
+        """
+
+        def checked() -> int:
+            self._policy.check_result_bits(int(log2_size) + 1, description)
+            return compute()
+
+        return self.memoize(key, checked)
+
+    def multifactorial(self, n: int | str, k: int | str) -> int:
+        """
+        Calculate the k-th multifactorial n!(k) = n (n - k) (n - 2k) ...
+
+        Args:
+            n: A non-negative integer.
+            k: The step between factors, at least 1.
+
+        Returns:
+            int: The product of the positive terms n, n - k, n - 2k, ...
+
+        Raises:
+            InvalidInputError: If n or k is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+
+        Examples:
+            >>> FactorialCalculator().multifactorial(10, 3)
+            280
+        """
+        n = InputValidator.validate_number(n, self._policy)
+        k = InputValidator.validate_number(k, self._policy)
+        if k < 1:
+            raise InvalidInputError("Invalid input: multifactorial step must be >= 1")
+        if k == 1:
+            return self.calculate(n)
+        low = n % k or k
+        return self._derived(
+            ("multifactorial", n, k),
+            _log2_range_product(low, n, k),
+            f"Multifactorial {n}!({k})",
+            lambda: range_product(low, n, k),
+        )
+
+    def double_factorial(self, n: int | str) -> int:
+        """
+        Calculate the double factorial n!! = n (n - 2) (n - 4) ...
+
+        Args:
+            n: A non-negative integer.
+
+        Returns:
+            int: The double factorial of n.
+
+        Raises:
+            InvalidInputError: If n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+
+        Examples:
+            >>> FactorialCalculator().double_factorial(7)
+            105
+        """
+        return self.multifactorial(n, 2)
+
+    def rising_factorial(self, x: int | str, n: int | str) -> int:
+        """
+        Calculate the rising factorial (Pochhammer) x (x + 1) ... (x + n - 1).
+
+        Args:
+            x: A non-negative integer base.
+            n: The number of factors.
+
+        Returns:
+            int: The rising factorial of x with n factors.
+
+        Raises:
+            InvalidInputError: If x or n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+
+        Examples:
+            >>> FactorialCalculator().rising_factorial(3, 4)
+            360
+        """
+        x = InputValidator.validate_number(x, self._policy)
+        n = InputValidator.validate_number(n, self._policy)
+        if x == 0:
+            return 0 if n else 1
+        return self._derived(
+            ("rising", x, n),
+            _log2_range_product(x, x + n - 1),
+            f"Rising factorial of {x} with {n} factors",
+            lambda: range_product(x, x + n - 1),
+        )
+
+    def falling_factorial(self, x: int | str, n: int | str) -> int:
+        """
+        Calculate the falling factorial x (x - 1) ... (x - n + 1).
+
+        Args:
+            x: A non-negative integer base.
+            n: The number of factors.
+
+        Returns:
+            int: The falling factorial of x with n factors (0 when n > x).
+
+        Raises:
+            InvalidInputError: If x or n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+
+        Examples:
+            >>> FactorialCalculator().falling_factorial(5, 3)
+            60
+        """
+        x = InputValidator.validate_number(x, self._policy)
+        n = InputValidator.validate_number(n, self._policy)
+        if n > x:
+            return 0
+        return self._derived(
+            ("falling", x, n),
+            _log2_range_product(x - n + 1, x),
+            f"Falling factorial of {x} with {n} factors",
+            lambda: range_product(x - n + 1, x),
+        )
+
+    def primorial(self, n: int | str) -> int:
+        """
+        Calculate the primorial n#, the product of all primes <= n.
+
+        Args:
+            n: A non-negative integer.
+
+        Returns:
+            int: The primorial of n.
+
+        Raises:
+            InvalidInputError: If n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+
+        Examples:
+            >>> FactorialCalculator().primorial(10)
+            210
+        """
+        n = InputValidator.validate_number(n, self._policy)
+        return self._derived(
+            ("primorial", n),
+            n * _PRIMORIAL_BITS_PER_N,
+            f"Primorial {n}#",
+            lambda: product_tree(get_sieve().primes_up_to(n)),
+        )
+
+    def subfactorial(self, n: int | str) -> int:
+        """
+        Calculate the subfactorial !n, the number of derangements of n items.
+
+        Args:
+            n: A non-negative integer.
+
+        Returns:
+            int: The subfactorial of n.
+
+        Raises:
+            InvalidInputError: If n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+
+        Examples:
+            >>> FactorialCalculator().subfactorial(4)
+            9
+        """
+        n = InputValidator.validate_number(n, self._policy)
+
+        def compute() -> int:
+            a, b = _subfactorial_maps(1, n)
+            return a + b
+
+        return self._derived(
+            ("subfactorial", n),
+            estimate_factorial_bits(n),
+            f"Subfactorial !{n}",
+            compute,
+        )
+
+    def calculate_range(
+        self,
+        start: int | str,
+        end: int | str,
+        token: CancellationToken | None = None,
+        parallel: bool = False,
+        workers: int | None = None,
+    ) -> dict[int, int]:
         """
         Calculate factorials for a range of numbers.
 
         Args:
             start: Starting number (inclusive).
             end: Ending number (inclusive).
+            token: Cancellation token shared by the whole range. When
+                   None, the policy's max_wall_time applies to the range.
+            parallel: Compute the range in chunks on worker processes
+                      (see iter_range).
+            workers: Number of worker processes, or None for the CPU count.
 
         Returns:
             Dict[int, int]: Dictionary mapping numbers to their factorials.
@@ -97,17 +1070,115 @@ class FactorialCalculator:
             >>> calc.calculate_range(3, 5)
             {3: 6, 4: 24, 5: 120}
         """
-        start = InputValidator.validate_number(start)
-        end = InputValidator.validate_number(end)
+        return dict(self.iter_range(start, end, token, parallel, workers))
+
+    def iter_range(
+        self,
+        start: int | str,
+        end: int | str,
+        token: CancellationToken | None = None,
+        parallel: bool = False,
+        workers: int | None = None,
+    ) -> Iterator[tuple[int, int]]:
+        """
+        Stream the factorials of a range in ascending order.
+
+        Inputs are validated before the first result is produced. The
+        sequential mode goes through calculate() and the cache. The
+        parallel mode splits the range into chunks that worker processes
+        sweep independently; it bypasses the cache, so that wide ranges
+        only ever hold a bounded number of chunks in memory.
+
+        Args:
+            start: Starting number (inclusive).
+            end: Ending number (inclusive).
+            token: Cancellation token shared by the whole range. When
+                   None, the policy's max_wall_time applies to the range.
+            parallel: Use worker processes.
+            workers: Number of worker processes, or None for the CPU count.
+
+        Returns:
+            Iterator[tuple[int, int]]: Pairs (n, n!) in ascending order.
+
+        Raises:
+            InvalidInputError: If range is invalid.
+            OverflowError: If the largest result exceeds the policy limits.
+        """
+        start = InputValidator.validate_number(start, self._policy)
+        end = InputValidator.validate_number(end, self._policy)
 
         if start > end:
             start, end = end, start
 
-        results = {}
-        for i in range(start, end + 1):
-            results[i] = self.calculate(i)
+        if token is None:
+            token = self._policy.new_token()
+
+        if parallel:
+            self._policy.check_result_size(end)
+            return parallel_range(start, end, workers, token)
+        return self._sequential_range(start, end, token)
+
+    def iter_range_decimal(
+        self,
+        start: int | str,
+        end: int | str,
+        token: CancellationToken | None = None,
+        parallel: bool = False,
+        workers: int | None = None,
+    ) -> Iterator[tuple[int, Iterator[str]]]:
+        """
+        Stream the decimal digits of the factorials of a range.
+
+        Only the first factorial goes through calculate() and the cache;
+        every later one is its predecessor times n, accumulated in
+        decimal limbs once results are large, so no result pays a full
+        binary-to-decimal conversion. The chunks of each result must be
+        consumed before advancing to the next. The parallel mode sweeps
+        chunks of the range in limbs on worker processes, each seeded
+        from the chunk's first factorial, and bypasses the cache.
+
+        Args:
+            start: Starting number (inclusive).
+            end: Ending number (inclusive).
+            token: Cancellation token shared by the whole range. When
+                   None, the policy's max_wall_time applies to the range.
+            parallel: Use worker processes.
+            workers: Number of worker processes, or None for the CPU count.
+
+        Returns:
+            Iterator[tuple[int, Iterator[str]]]: Pairs (n, decimal chunks
+            of n!) in ascending order.
+
+        Raises:
+            InvalidInputError: If range is invalid.
+            OverflowError: If the largest result exceeds the policy limits.
+        """
+        start = InputValidator.validate_number(start, self._policy)
+        end = InputValidator.validate_number(end, self._policy)
 
-        return results
+        if start > end:
+            start, end = end, start
+
+        if token is None:
+            token = self._policy.new_token()
+
+        self._policy.check_result_size(end)
+        if parallel:
+            pairs = parallel_decimal_range(start, end, workers, token)
+            return ((n, iter((text,))) for n, text in pairs)
+        # Imported here so that NumPy is only loaded for decimal ranges
+        from factorial_calculator.limbs import iter_factorial_decimals
+
+        return iter_factorial_decimals(start, end, self.calculate(start, token), token)
+
+    def _sequential_range(
+        self, start: int, end: int, token: CancellationToken | None
+    ) -> Iterator[tuple[int, int]]:
+        """Yield (n, n!) for a validated range through the cache."""
+        for i in range(start, end + 1):
+            if token is not None:
+                token.check()
+            yield i, self.calculate(i, token)
 
     def clear_cache(self) -> None:
         """
@@ -116,7 +1187,53 @@ class FactorialCalculator:
         This method resets the cache to its initial state, keeping only
         the base cases (0! = 1, 1! = 1).
         """
-        self._cache = {0: 1, 1: 1}
+        self._cache.clear()
+
+    @property
+    def prefetcher(self) -> Prefetcher | None:
+        """Return the attached prefetcher, if any."""
+        return self._prefetcher
+
+    @prefetcher.setter
+    def prefetcher(self, prefetcher: Prefetcher | None) -> None:
+        """Attach a prefetcher, or detach it with None."""
+        self._prefetcher = prefetcher
+
+    def warm(self, n: int) -> int:
+        """
+        Compute and cache n! without counting a lookup in the statistics.
+
+        Used by prefetching, so that a correct prediction shows up as a
+        hit when the input is requested.
+
+        Args:
+            n: A non-negative integer.
+
+        Returns:
+            int: The factorial of n.
+
+        Raises:
+            InvalidInputError: If n is invalid or out of range.
+            OverflowError: If the result would exceed the policy limits.
+        """
+        n = InputValidator.validate_number(n, self._policy)
+        value = self._cache.get(n)
+        if value is None:
+            value = self._compute_factorial(n, None)
+            self._cache.store(n, value)
+        return value
+
+    def is_cached(self, key: Hashable) -> bool:
+        """
+        Check whether a result is cached, without touching the statistics.
+
+        Args:
+            key: A factorial input or operation key.
+
+        Returns:
+            bool: True if the result is in the cache.
+        """
+        return key in self._cache
 
     def get_cache_size(self) -> int:
         """
@@ -127,16 +1244,45 @@ class FactorialCalculator:
         """
         return len(self._cache)
 
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Get cache and usage statistics.
+
+        Returns:
+            dict[str, int | float]: Hits (including constant table
+            hits, also reported as ``table_hits``), misses, hit ratio,
+            number of cached entries, cached bytes, the per-tier sizes,
+            compression ratio and counters of the cache, and the
+            ``prefetch_*`` counters when a prefetcher is attached.
+        """
+        hits = self._stats["hits"] + self._table_hits
+        misses = self._stats["misses"]
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "table_hits": self._table_hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "cache_size": len(self._cache),
+            "cache_bytes": self._cache.nbytes,
+            **self._cache.stats(),
+            **(self._prefetcher.stats() if self._prefetcher else {}),
+        }
+
 
 class FactorialCalculatorFactory:
     """
     Factory class for creating FactorialCalculator instances.
 
     This class implements the Factory pattern to provide a centralized
-    way to create calculator instances.
+    way to create calculator instances. Calculators it creates use the
+    machine's tuning profile (see ``factorial tune``) when one exists.
+    The singleton is created under a lock, so concurrent first calls
+    share one instance.
     """
 
     _instance: FactorialCalculator | None = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_calculator(cls, use_singleton: bool = True) -> FactorialCalculator:
@@ -156,8 +1302,57 @@ class FactorialCalculatorFactory:
             120
         """
         if use_singleton:
+            # Double-checked locking: only the first callers contend
             if cls._instance is None:
-                cls._instance = FactorialCalculator()
+                with cls._lock:
+                    if cls._instance is None:
+                        cls._instance = FactorialCalculator(tuning=load_profile())
             return cls._instance
         else:
-            return FactorialCalculator()
+            return FactorialCalculator(tuning=load_profile())
+
+    @classmethod
+    def enable_prefetch(
+        cls,
+        depth: int = DEFAULT_DEPTH,
+        max_input: int = DEFAULT_MAX_INPUT,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        idle_delay: float = DEFAULT_IDLE_DELAY,
+        max_cpu_fraction: float = DEFAULT_MAX_CPU_FRACTION,
+    ) -> Prefetcher:
+        """
+        Attach a prefetcher to the singleton calculator.
+
+        Calling it again replaces the previous prefetcher.
+
+        Args:
+            depth: Number of inputs predicted after each access.
+            max_input: Largest input computed speculatively.
+            max_bytes: Budget of prefetched results not requested yet.
+            idle_delay: Seconds without an access before computing.
+            max_cpu_fraction: Largest share of wall time spent computing.
+
+        Returns:
+            Prefetcher: The attached prefetcher.
+
+        Raises:
+            InvalidInputError: If max_cpu_fraction is not in (0, 1].
+        """
+        calculator = cls.get_calculator()
+        prefetcher = Prefetcher(
+            calculator, depth, max_input, max_bytes, idle_delay, max_cpu_fraction
+        )
+        with cls._lock:
+            previous, calculator.prefetcher = calculator.prefetcher, prefetcher
+        if previous is not None:
+            previous.close()
+        return prefetcher
+
+    @classmethod
+    def disable_prefetch(cls) -> None:
+        """Detach and stop the singleton's prefetcher, if any."""
+        calculator = cls.get_calculator()
+        with cls._lock:
+            previous, calculator.prefetcher = calculator.prefetcher, None
+        if previous is not None:
+            previous.close()
@@ -0,0 +1,445 @@
+"""
+Distributed range products over TCP.
+
+For the very largest inputs a single factorial can be spread across
+several machines. Worker nodes (``factorial worker --listen HOST:PORT``)
+compute the products of the sub-ranges they are sent; a Coordinator
+splits 2..n into sub-ranges, hands them out to its workers, and merges
+the returned products with a product tree. A sub-range whose worker
+fails is retried on a new connection and, once that worker has used up
+its retries, reassigned to the remaining workers.
+
+Every message is a frame: an 8-byte big-endian payload length followed
+by the payload. A request payload holds the first and last factor as two
+8-byte unsigned integers. A response payload starts with a status byte,
+followed by the product as big-endian ``to_bytes`` on success or a UTF-8
+error message if the worker rejected the request.
+"""
+
+import socket
+import socketserver
+import struct
+import threading
+from collections import deque
+from collections.abc import Sequence
+
+from factorial_calculator.core import product_tree, range_product
+from factorial_calculator.exceptions import InvalidInputError, WorkerError
+
+# Port used when an address does not give one
+DEFAULT_PORT = 7785
+
+# Largest factor a worker accepts by default
+DEFAULT_WORKER_MAX_INPUT = 10_000_000
+
+# Largest factor a request frame can carry
+MAX_FACTOR = 2**64 - 1
+
+_HEADER = struct.Struct("!Q")
+_REQUEST = struct.Struct("!QQ")
+_STATUS_OK = 0
+_STATUS_ERROR = 1
+
+
+def parse_address(text: str, default_host: str = "127.0.0.1") -> tuple[str, int]:
+    """
+    Parse ``HOST:PORT``, ``PORT`` or ``HOST`` into a socket address.
+
+    Args:
+        text: The address to parse.
+        default_host: Host used when only a port is given.
+
+    Returns:
+        tuple[str, int]: Host and port.
+
+    Raises:
+        InvalidInputError: If the port is not a valid number.
+
+    Examples:
+        >>> parse_address("10.0.0.5:9000")
+        ('10.0.0.5', 9000)
+        >>> parse_address("9000")
+        ('127.0.0.1', 9000)
+    """
+    host, _, port = text.rpartition(":")
+    if not host and not port.isdigit():
+        host, port = port, str(DEFAULT_PORT)
+    try:
+        number = int(port)
+    except ValueError:
+        raise InvalidInputError(f"Invalid address: '{text}'") from None
+    if not 0 <= number <= 65535:
+        raise InvalidInputError(f"Invalid address: port {number} is out of range")
+    return host or default_host, number
+
+
+def _send_frame(sock: socket.socket, payload: bytes) -> None:
+    """Send one length-prefixed frame."""
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    """
+    Read exactly size bytes.
+
+    Returns:
+        bytes | None: The data, or None if the peer closed the
+        connection before sending anything.
+
+    Raises:
+        ConnectionError: If the connection closes mid-message.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            if received == 0:
+                return None
+            raise ConnectionError("Connection closed mid-frame")
+        received += count
+    return bytes(buffer)
+
+
+def _recv_frame(sock: socket.socket, max_length: int | None = None) -> bytes | None:
+    """
+    Read one length-prefixed frame.
+
+    Args:
+        sock: Connected socket.
+        max_length: Largest payload accepted, or None for no limit.
+
+    Returns:
+        bytes | None: The payload, or None at end of stream.
+
+    Raises:
+        ConnectionError: If the connection closes mid-frame or the frame
+            is longer than max_length.
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if max_length is not None and length > max_length:
+        raise ConnectionError(f"Frame of {length} bytes exceeds {max_length}")
+    if length == 0:
+        return b""
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        raise ConnectionError("Connection closed mid-frame")
+    return payload
+
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+    """Serve range-product requests on one connection until it closes."""
+
+    server: "WorkerServer"
+
+    def handle(self) -> None:
+        """Answer every request frame of the connection in order."""
+        while True:
+            try:
+                payload = _recv_frame(self.request, _REQUEST.size)
+            except ConnectionError:
+                return
+            if payload is None:
+                return
+            _send_frame(self.request, self.server.answer(payload))
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+    """
+    TCP server computing range products for a Coordinator.
+
+    Attributes:
+        max_input: Largest factor accepted in a request.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        max_input: int = DEFAULT_WORKER_MAX_INPUT,
+    ) -> None:
+        """
+        Bind the server; call serve_forever() to start answering.
+
+        Args:
+            address: Host and port to listen on (port 0 picks a free one).
+            max_input: Largest factor accepted in a request.
+        """
+        super().__init__(address, _WorkerHandler)
+        self.max_input = max_input
+
+    def answer(self, payload: bytes) -> bytes:
+        """
+        Compute the response payload of one request.
+
+        Args:
+            payload: A request payload.
+
+        Returns:
+            bytes: Status byte followed by the product or an error message.
+        """
+        if len(payload) != _REQUEST.size:
+            return bytes([_STATUS_ERROR]) + b"Malformed request"
+        low, high = _REQUEST.unpack(payload)
+        if low < 1 or high > self.max_input:
+            message = f"Range {low}..{high} is outside 1..{self.max_input}"
+            return bytes([_STATUS_ERROR]) + message.encode()
+        product = range_product(low, high)
+        return bytes([_STATUS_OK]) + product.to_bytes(
+            (product.bit_length() + 7) // 8, "big"
+        )
+
+
+class _Job:
+    """Shared state of one distributed range product."""
+
+    def __init__(self, chunks: list[tuple[int, int, int]]) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            chunks: (index, low, high) sub-ranges to compute.
+        """
+        self.pending = deque(chunks)
+        self.results: list[int] = [1] * len(chunks)
+        self.remaining = len(chunks)
+        self.error: InvalidInputError | None = None
+        # Last unexpected failure of a driver, for the final report
+        self.failure: Exception | None = None
+        self.condition = threading.Condition()
+
+    def take(self) -> tuple[int, int, int] | None:
+        """
+        Wait for a sub-range to compute.
+
+        Returns:
+            tuple[int, int, int] | None: The next sub-range, or None once
+            the job is complete or has failed.
+        """
+        with self.condition:
+            while not self.pending and self.remaining and self.error is None:
+                self.condition.wait()
+            if not self.pending or self.error is not None:
+                return None
+            return self.pending.popleft()
+
+    def finish(self, index: int, value: int) -> None:
+        """Record the product of a sub-range."""
+        with self.condition:
+            self.results[index] = value
+            self.remaining -= 1
+            if not self.remaining:
+                self.condition.notify_all()
+
+    def give_back(self, chunk: tuple[int, int, int]) -> None:
+        """Return a sub-range whose worker failed to the queue."""
+        with self.condition:
+            self.pending.appendleft(chunk)
+            self.condition.notify()
+
+    def fail(self, error: InvalidInputError) -> None:
+        """Abort the job with an error reported by a worker."""
+        with self.condition:
+            self.error = error
+            self.condition.notify_all()
+
+
+class Coordinator:
+    """
+    Client splitting range products across TCP worker nodes.
+
+    Attributes:
+        workers: Worker addresses.
+        retries: Connection failures tolerated per worker before its
+            sub-ranges go to the other workers.
+        timeout: Seconds to wait for a connection or a response.
+        chunks_per_worker: Sub-ranges per worker, so that faster
+            workers take on more of the work.
+    """
+
+    def __init__(
+        self,
+        workers: Sequence[str | tuple[str, int]],
+        retries: int = 2,
+        timeout: float = 300.0,
+        chunks_per_worker: int = 4,
+    ) -> None:
+        """
+        Initialize the coordinator; connections are opened per product.
+
+        Args:
+            workers: Worker addresses as ``HOST:PORT`` or (host, port).
+            retries: Connection failures tolerated per worker.
+            timeout: Seconds to wait for a connection or a response.
+            chunks_per_worker: Sub-ranges per worker.
+
+        Raises:
+            InvalidInputError: If no worker is given or an address is invalid.
+        """
+        if not workers:
+            raise InvalidInputError("The coordinator needs at least one worker")
+        self.workers = [
+            parse_address(worker) if isinstance(worker, str) else worker
+            for worker in workers
+        ]
+        self.retries = retries
+        self.timeout = timeout
+        self.chunks_per_worker = chunks_per_worker
+
+    def factorial(self, n: int) -> int:
+        """
+        Compute n! on the workers.
+
+        Args:
+            n: A non-negative integer.
+
+        Returns:
+            int: The factorial of n.
+
+        Raises:
+            InvalidInputError: If n is negative or a worker rejects a range.
+            WorkerError: If every worker failed.
+        """
+        if n < 0:
+            raise InvalidInputError(f"Invalid input: {n} is negative")
+        return self.range_product(2, n)
+
+    def range_product(self, low: int, high: int) -> int:
+        """
+        Compute low * (low + 1) * ... * high on the workers.
+
+        The range is cut into sub-ranges of equal length, which workers
+        pull as they finish; the products are merged in a product tree.
+
+        Args:
+            low: First factor (at least 1).
+            high: Last factor (inclusive).
+
+        Returns:
+            int: The product (1 for an empty range).
+
+        Raises:
+            InvalidInputError: If low is below 1, high exceeds MAX_FACTOR
+                or a worker rejects a range.
+            WorkerError: If every worker failed.
+        """
+        if low < 1:
+            raise InvalidInputError(f"Invalid range: first factor {low} is below 1")
+        if high > MAX_FACTOR:
+            raise InvalidInputError(
+                f"Invalid range: last factor {high} exceeds {MAX_FACTOR}"
+            )
+        if low > high:
+            return 1
+        count = min(high - low + 1, len(self.workers) * self.chunks_per_worker)
+        bounds = [low + (high - low + 1) * i // count for i in range(count + 1)]
+        job = _Job([(i, bounds[i], bounds[i + 1] - 1) for i in range(count)])
+        threads = [
+            threading.Thread(target=self._drive, args=(address, job), daemon=True)
+            for address in self.workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if job.error is not None:
+            raise job.error
+        if job.remaining:
+            cause = f" (last error: {job.failure})" if job.failure else ""
+            raise WorkerError(
+                f"All {len(self.workers)} workers failed with {job.remaining} "
+                f"of {count} sub-ranges of {low}..{high} outstanding{cause}"
+            )
+        return product_tree(job.results)
+
+    def _drive(self, address: tuple[str, int], job: _Job) -> None:
+        """
+        Feed sub-ranges to one worker until the job is done.
+
+        Connection errors are retried; any other error retires the
+        worker. Either way a sub-range in flight goes back to the queue,
+        so that the other drivers never wait for it forever.
+
+        Args:
+            address: The worker's address.
+            job: The shared job.
+        """
+        failures = 0
+        sock: socket.socket | None = None
+        chunk: tuple[int, int, int] | None = None
+        try:
+            while (chunk := job.take()) is not None:
+                index, low, high = chunk
+                try:
+                    if sock is None:
+                        sock = socket.create_connection(address, self.timeout)
+                    payload = _exchange(sock, low, high)
+                except OSError as e:
+                    job.give_back(chunk)
+                    chunk = None
+                    if sock is not None:
+                        sock.close()
+                        sock = None
+                    failures += 1
+                    if failures > self.retries:
+                        job.failure = e
+                        return
+                    continue
+                if payload[0] != _STATUS_OK:
+                    job.fail(InvalidInputError(payload[1:].decode(errors="replace")))
+                    return
+                job.finish(index, int.from_bytes(payload[1:], "big"))
+                chunk = None
+        except Exception as e:
+            job.failure = e
+        finally:
+            if chunk is not None:
+                job.give_back(chunk)
+            if sock is not None:
+                sock.close()
+
+
+def _exchange(sock: socket.socket, low: int, high: int) -> bytes:
+    """
+    Send one sub-range request and read its response.
+
+    Args:
+        sock: Connection to the worker.
+        low: First factor.
+        high: Last factor.
+
+    Returns:
+        bytes: The response payload.
+
+    Raises:
+        ConnectionError: If the worker closes the connection or sends a
+            frame longer than any valid response.
+    """
+    _send_frame(sock, _REQUEST.pack(low, high))
+    payload = _recv_frame(sock, _response_limit(low, high))
+    if not payload:
+        raise ConnectionError("Worker closed the connection")
+    return payload
+
+
+def _response_limit(low: int, high: int) -> int:
+    """
+    Return the largest valid response payload for a sub-range.
+
+    Every factor has at most high.bit_length() bits, which bounds the
+    product; an error message is far shorter than any such bound.
+
+    Args:
+        low: First factor.
+        high: Last factor.
+
+    Returns:
+        int: Payload bytes, including the status byte.
+    """
+    return 1 + ((high - low + 1) * high.bit_length() + 7) // 8 + 1024
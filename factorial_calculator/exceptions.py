@@ -32,3 +32,61 @@ class OverflowError(FactorialError):
     """
 
     pass
+
+
+class BackendUnavailableError(FactorialError):
+    """
+    Exception raised when an arithmetic backend cannot be used.
+
+    This exception is raised when a backend is requested by name but is
+    unknown or its optional dependency is not installed.
+    """
+
+    pass
+
+
+class ComputationCancelledError(FactorialError):
+    """
+    Exception raised when a computation is cancelled cooperatively.
+
+    This exception is raised between chunks of a long computation once
+    its cancellation token has been cancelled. The calculator remains
+    usable afterwards.
+    """
+
+    pass
+
+
+class DeadlineExceededError(ComputationCancelledError):
+    """
+    Exception raised when a computation exceeds its wall-time budget.
+
+    This exception is raised when the deadline configured through a
+    ResourcePolicy or CancellationToken expires mid-computation.
+    """
+
+    pass
+
+
+class VerificationError(FactorialError):
+    """
+    Exception raised when a computed result fails its integrity check.
+
+    This exception is raised in verification mode when the residues of
+    a result disagree with independently computed modular values, which
+    points to memory corruption or a backend bug.
+    """
+
+    pass
+
+
+class WorkerError(FactorialError):
+    """
+    Exception raised when distributed work cannot be completed.
+
+    This exception is raised by the coordinator when every worker node
+    has failed, after retries, while sub-range products were still
+    outstanding, and by pool workers used before their initializer ran.
+    """
+
+    pass
@@ -0,0 +1,280 @@
+"""
+Parallel batch execution of factorial workloads.
+
+This module runs many independent calculations across cores with the
+cheapest mechanism the runtime offers:
+
+* ``"thread"``: on free-threaded builds (Python 3.13t and later) threads
+  run in parallel and share the caller's calculator and cache directly;
+* ``"interpreter"``: where ``InterpreterPoolExecutor`` exists (Python
+  3.14 and later), sub-interpreters with their own GIL run in one
+  process, without spawning or pickling through pipes;
+* ``"process"``: on a standard GIL build, a process pool is used.
+
+Cached inputs are always served from the caller's calculator, and
+results computed by workers are stored back into its cache.
+"""
+
+import concurrent.futures
+import os
+import sys
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+
+from factorial_calculator.core import FactorialCalculator, FactorialCalculatorFactory
+from factorial_calculator.exceptions import InvalidInputError, WorkerError
+from factorial_calculator.policy import ResourcePolicy
+from factorial_calculator.tuning import load_profile
+from factorial_calculator.validator import InputValidator
+
+# Execution modes in order of preference
+EXECUTION_MODES = ("thread", "interpreter", "process")
+
+# Calculator of the current worker interpreter or process
+_worker_calculator: FactorialCalculator | None = None
+
+
+def is_free_threaded() -> bool:
+    """
+    Check whether the interpreter runs without the GIL.
+
+    Returns:
+        bool: True on a free-threaded build with the GIL disabled.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def has_subinterpreters() -> bool:
+    """
+    Check whether sub-interpreter pools are available.
+
+    Returns:
+        bool: True if concurrent.futures provides InterpreterPoolExecutor.
+    """
+    return hasattr(concurrent.futures, "InterpreterPoolExecutor")
+
+
+def select_mode() -> str:
+    """
+    Pick the fastest execution mode supported by this runtime.
+
+    Returns:
+        str: ``"thread"``, ``"interpreter"`` or ``"process"``.
+    """
+    if is_free_threaded():
+        return "thread"
+    if has_subinterpreters():
+        return "interpreter"
+    return "process"
+
+
+def init_worker(policy: ResourcePolicy) -> None:
+    """
+    Create the calculator of a worker interpreter or process.
+
+    Pools pass this as their initializer, with the parent calculator's
+    policy in initargs, so that workers accept exactly the same inputs.
+
+    Args:
+        policy: Resource limits of the parent calculator.
+    """
+    global _worker_calculator
+    _worker_calculator = FactorialCalculator(policy=policy, tuning=load_profile())
+
+
+def worker_calculator() -> FactorialCalculator:
+    """
+    Return the calculator created by init_worker in this worker.
+
+    Returns:
+        FactorialCalculator: The worker's calculator.
+
+    Raises:
+        WorkerError: If the pool was created without init_worker.
+    """
+    if _worker_calculator is None:
+        raise WorkerError("Worker calculator used before init_worker ran")
+    return _worker_calculator
+
+
+def _calculate_chunk(chunk: list[int]) -> list[int]:
+    """
+    Compute the factorials of a chunk of validated inputs in a worker.
+
+    Args:
+        chunk: Inputs to compute.
+
+    Returns:
+        list[int]: Their factorials, in order.
+    """
+    calculator = worker_calculator()
+    return [calculator.calculate(n) for n in chunk]
+
+
+class BatchExecutor:
+    """
+    Pool running batches of factorial calculations in parallel.
+
+    Attributes:
+        mode: The execution mode in use.
+        workers: Number of worker threads, interpreters or processes.
+        calculator: Calculator whose cache serves and receives results.
+    """
+
+    def __init__(
+        self,
+        calculator: FactorialCalculator | None = None,
+        workers: int | None = None,
+        mode: str | None = None,
+    ) -> None:
+        """
+        Initialize the executor; workers start on first use.
+
+        Args:
+            calculator: Calculator to use, or None for the shared singleton.
+            workers: Pool size, or None for the CPU count.
+            mode: One of EXECUTION_MODES, or None to use select_mode().
+
+        Raises:
+            InvalidInputError: If the mode is unknown or unsupported here.
+        """
+        mode = mode or select_mode()
+        if mode not in EXECUTION_MODES:
+            raise InvalidInputError(
+                f"Unknown execution mode: '{mode}' "
+                f"(expected one of {', '.join(EXECUTION_MODES)})"
+            )
+        if mode == "interpreter" and not has_subinterpreters():
+            raise InvalidInputError("Sub-interpreters are not available")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.calculator = calculator or FactorialCalculatorFactory.get_calculator()
+        self._pool: Executor | None = None
+
+    def _executor(self) -> Executor:
+        """Return the worker pool, starting it on first use."""
+        if self._pool is None:
+            if self.mode == "thread":
+                self._pool = ThreadPoolExecutor(self.workers)
+            else:
+                pool_class = (
+                    # Not defined before Python 3.14
+                    getattr(concurrent.futures, "InterpreterPoolExecutor")  # noqa: B009
+                    if self.mode == "interpreter"
+                    else ProcessPoolExecutor
+                )
+                self._pool = pool_class(
+                    self.workers,
+                    initializer=init_worker,
+                    initargs=(self.calculator.policy,),
+                )
+        return self._pool
+
+    def map(self, values: Iterable[int | str]) -> list[int]:
+        """
+        Compute the factorial of every input.
+
+        All inputs are validated first, so either every result is
+        returned or nothing is computed.
+
+        Args:
+            values: Inputs accepted by InputValidator.
+
+        Returns:
+            list[int]: The factorials, in input order.
+
+        Raises:
+            InvalidInputError: If any input is invalid.
+        """
+        items = values if isinstance(values, list) else list(values)
+        checked = InputValidator.validate_many(items, self.calculator.policy)
+        if not checked.all_valid:
+            index = checked.errors.index(1)
+            raise InvalidInputError(
+                f"Invalid input at position {index}: {items[index]!r} "
+                f"({checked.error_count} invalid in total)"
+            )
+
+        if self.mode == "thread":
+            return list(self._executor().map(self.calculator.calculate, checked.values))
+
+        # Serve cached inputs locally and ship only distinct misses
+        results: dict[int, int] = {}
+        missing: list[int] = []
+        for n in dict.fromkeys(checked.values):
+            if self.calculator.is_cached(n):
+                results[n] = self.calculator.calculate(n)
+            else:
+                missing.append(n)
+        chunks = self._chunks(missing)
+        computed = self._executor().map(_calculate_chunk, chunks) if chunks else []
+        for chunk, chunk_results in zip(chunks, computed, strict=True):
+            for n, value in zip(chunk, chunk_results, strict=True):
+                results[n] = self.calculator.memoize(n, partial(int, value))
+        return [results[n] for n in checked.values]
+
+    def _chunks(self, values: Sequence[int]) -> list[list[int]]:
+        """
+        Split inputs into interleaved chunks of similar total cost.
+
+        Striding spreads large and small inputs evenly over the chunks.
+
+        Args:
+            values: Inputs to split.
+
+        Returns:
+            list[list[int]]: At most four chunks per worker.
+        """
+        count = min(len(values), self.workers * 4)
+        return [list(values[start::count]) for start in range(count)]
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "BatchExecutor":
+        """Return the executor for use in a with block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut down the worker pool."""
+        self.close()
+
+
+def calculate_many(
+    values: Iterable[int | str],
+    calculator: FactorialCalculator | None = None,
+    workers: int | None = None,
+    mode: str | None = None,
+) -> list[int]:
+    """
+    Compute many factorials in parallel.
+
+    Args:
+        values: Inputs accepted by InputValidator.
+        calculator: Calculator to use, or None for the shared singleton.
+        workers: Pool size, or None for the CPU count.
+        mode: Execution mode, or None to pick the fastest available.
+
+    Returns:
+        list[int]: The factorials, in input order.
+
+    Raises:
+        InvalidInputError: If any input is invalid.
+
+    Examples:
+        >>> calculate_many([3, 4, 5], mode="thread", workers=2)
+        [6, 24, 120]
+    """
+    with BatchExecutor(calculator, workers, mode) as executor:
+        return executor.map(values)
@@ -0,0 +1,206 @@
+"""
+Inverse factorial queries.
+
+This module answers "which n?" questions about factorials without
+searching through them: the largest n with n! <= x, the smallest n
+whose factorial has at least a given number of digits, and whether an
+integer is a factorial at all. Candidates are bracketed with
+math.lgamma, which is accurate far beyond the gap of at least one bit
+between consecutive factorials; only when the estimate lands within
+rounding error of the target is an exact factorial fetched from the
+calculator, and its cache, to settle the comparison.
+"""
+
+import math
+from collections.abc import Callable
+
+from factorial_calculator.core import FactorialCalculator, FactorialCalculatorFactory
+from factorial_calculator.exceptions import InvalidInputError
+
+# Relative tolerance of lgamma-based comparisons; closer calls are exact
+LOG_TOLERANCE = 1e-10
+
+
+def _check_positive(value: object, name: str) -> int:
+    """
+    Ensure value is a positive integer.
+
+    Args:
+        value: The value to check.
+        name: Its name in error messages.
+
+    Returns:
+        int: The value.
+
+    Raises:
+        InvalidInputError: If value is not an int or is below 1.
+    """
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise InvalidInputError(f"Invalid input: {name} must be an integer")
+    if value < 1:
+        raise InvalidInputError(f"Invalid input: {name} must be at least 1")
+    return value
+
+
+def _first_reaching(
+    log_target: float, reaches: Callable[[int], bool], calc: FactorialCalculator
+) -> int:
+    """
+    Find the smallest n whose factorial reaches a target.
+
+    Args:
+        log_target: Natural logarithm of the target.
+        reaches: Exact test of n! against the target, used only when
+                 lgamma cannot tell the two apart.
+        calc: Calculator supplying exact factorials.
+
+    Returns:
+        int: The smallest n with reaches(n!) true.
+    """
+    margin = LOG_TOLERANCE * max(1.0, abs(log_target))
+
+    def meets(n: int) -> bool:
+        difference = math.lgamma(n + 1) - log_target
+        if abs(difference) > margin:
+            return difference > 0
+        return reaches(calc.calculate(n))
+
+    # Exponential then binary search on the float estimate
+    high = 1
+    while math.lgamma(high + 1) < log_target:
+        high *= 2
+    low = 0
+    while low < high:
+        middle = (low + high) // 2
+        if math.lgamma(middle + 1) < log_target:
+            low = middle + 1
+        else:
+            high = middle
+
+    # Settle the candidate against the exact boundary
+    while low > 0 and meets(low - 1):
+        low -= 1
+    while not meets(low):
+        low += 1
+    return low
+
+
+def largest_factorial_input(
+    x: int, calculator: FactorialCalculator | None = None
+) -> int:
+    """
+    Return the largest n with n! <= x.
+
+    Args:
+        x: A positive integer.
+        calculator: Calculator providing exact factorials for close
+                    calls, or None for the factory singleton.
+
+    Returns:
+        int: The largest such n (1 for x = 1, since 0! = 1! = 1).
+
+    Raises:
+        InvalidInputError: If x is not a positive integer, or a close
+            call needs a factorial beyond the calculator's max_input.
+
+    Examples:
+        >>> largest_factorial_input(120)
+        5
+        >>> largest_factorial_input(719)
+        5
+    """
+    x = _check_positive(x, "x")
+    calc = calculator or FactorialCalculatorFactory.get_calculator()
+    return _first_reaching(math.log(x), lambda value: value > x, calc) - 1
+
+
+def smallest_input_with_digits(
+    digits: int, calculator: FactorialCalculator | None = None
+) -> int:
+    """
+    Return the smallest n whose factorial has at least the given digits.
+
+    Args:
+        digits: A positive number of decimal digits.
+        calculator: Calculator providing exact factorials for close
+                    calls, or None for the factory singleton.
+
+    Returns:
+        int: The smallest n with n! >= 10**(digits - 1).
+
+    Raises:
+        InvalidInputError: If digits is not a positive integer, or a
+            close call needs a factorial beyond the calculator's
+            max_input.
+
+    Examples:
+        >>> smallest_input_with_digits(3)
+        5
+        >>> smallest_input_with_digits(1000)
+        450
+    """
+    digits = _check_positive(digits, "digits")
+    calc = calculator or FactorialCalculatorFactory.get_calculator()
+    return _first_reaching(
+        (digits - 1) * math.log(10),
+        lambda value: value >= 10 ** (digits - 1),
+        calc,
+    )
+
+
+def inverse_factorial(
+    x: int, calculator: FactorialCalculator | None = None
+) -> int | None:
+    """
+    Return n such that n! == x, or None if x is not a factorial.
+
+    The candidate is the largest n with n! <= x. Its trailing zero
+    bits, n minus its binary digit sum, reject most non-factorials
+    before the exact comparison with the (cached) factorial.
+
+    Args:
+        x: A positive integer.
+        calculator: Calculator providing the exact factorial, or None
+                    for the factory singleton.
+
+    Returns:
+        int | None: The input whose factorial is x (1 for x = 1), or None.
+
+    Raises:
+        InvalidInputError: If x is not a positive integer, or the
+            candidate exceeds the calculator's max_input.
+
+    Examples:
+        >>> inverse_factorial(3628800)
+        10
+        >>> inverse_factorial(3628801) is None
+        True
+    """
+    calc = calculator or FactorialCalculatorFactory.get_calculator()
+    n = largest_factorial_input(x, calc)
+    if (x & -x).bit_length() - 1 != n - n.bit_count():
+        return None
+    return n if calc.calculate(n) == x else None
+
+
+def is_factorial(x: int, calculator: FactorialCalculator | None = None) -> bool:
+    """
+    Check whether x is the factorial of some n.
+
+    Args:
+        x: A positive integer.
+        calculator: Calculator providing the exact factorial, or None
+                    for the factory singleton.
+
+    Returns:
+        bool: True if x == n! for some n.
+
+    Raises:
+        InvalidInputError: If x is not a positive integer, or the
+            candidate exceeds the calculator's max_input.
+
+    Examples:
+        >>> is_factorial(40320)
+        True
+    """
+    return inverse_factorial(x, calculator) is not None
@@ -0,0 +1,244 @@
+"""
+Decimal-limb accumulator for runs of consecutive factorials.
+
+Printing n!, (n+1)!, ... one after another converts every product from
+binary to decimal from scratch, and for large results that conversion
+dominates decimal range dumps. DecimalAccumulator keeps the running
+product in base 10**9 limbs instead, least significant first, so that
+multiplying by the next factor is one linear pass and each result is
+written straight from the limbs. The limbs live in a NumPy uint64 array
+when NumPy is installed, with carries propagated by whole-array passes,
+and in a stdlib array otherwise. Importing this module loads NumPy, so
+the calculator only imports it when a decimal range is requested.
+"""
+
+import math
+from array import array
+from collections.abc import Iterator
+from types import ModuleType
+from typing import Any, TextIO
+
+from factorial_calculator import vectorized
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.policy import CancellationToken
+from factorial_calculator.result import iter_decimal
+from factorial_calculator.vectorized import is_numpy_available
+
+LIMB_DIGITS = 9
+BASE = 10**LIMB_DIGITS
+
+# Largest multiplier; keeps limb * k + carry within 64 bits
+MAX_MULTIPLIER = 2**32
+
+# Limbs converted per streamed decimal chunk
+DEFAULT_CHUNK_LIMBS = 1024
+
+# Result sizes from which limbs beat str(); measured per step against
+# int multiplication plus conversion, NumPy wins from about 1500 digits
+# and the pure-Python loop from about 4000
+NUMPY_THRESHOLD_DIGITS = 1500
+PYTHON_THRESHOLD_DIGITS = 4000
+
+_LOG10_2 = math.log10(2)
+
+
+class DecimalAccumulator:
+    """
+    Running product held as base 10**9 decimal limbs.
+
+    Attributes:
+        uses_numpy: True if the limbs are a NumPy array.
+    """
+
+    def __init__(self, value: int = 1, use_numpy: bool | None = None) -> None:
+        """
+        Initialize the accumulator from a starting value.
+
+        Args:
+            value: A positive starting value, converted to limbs once.
+            use_numpy: Force or disable NumPy limbs; None uses NumPy
+                       when it is installed.
+
+        Raises:
+            InvalidInputError: If value is not positive, or use_numpy is
+                True without NumPy.
+        """
+        if value < 1:
+            raise InvalidInputError("Invalid input: the start value must be positive")
+        if use_numpy is None:
+            use_numpy = is_numpy_available()
+        elif use_numpy and not is_numpy_available():
+            raise InvalidInputError("NumPy limbs require NumPy")
+        np = vectorized.np if use_numpy else None
+        self._np: ModuleType | None = np
+        self.uses_numpy = np is not None
+
+        text = "".join(iter_decimal(value))
+        if np is not None:
+            padded = "0" * (-len(text) % LIMB_DIGITS) + text
+            digits = np.frombuffer(padded.encode("ascii"), dtype=np.uint8) - 48
+            blocks = digits.reshape(-1, LIMB_DIGITS).astype(np.uint64)
+            powers = 10 ** np.arange(LIMB_DIGITS - 1, -1, -1, dtype=np.uint64)
+            limbs = (blocks @ powers)[::-1]
+            self._limbs: Any = np.zeros(2 * len(limbs), dtype=np.uint64)
+            self._limbs[: len(limbs)] = limbs
+            self._powers = powers
+        else:
+            self._limbs = array(
+                "Q",
+                (
+                    int(text[max(0, end - LIMB_DIGITS) : end])
+                    for end in range(len(text), 0, -LIMB_DIGITS)
+                ),
+            )
+        self._size = len(text) // LIMB_DIGITS + (len(text) % LIMB_DIGITS > 0)
+
+    @property
+    def digit_count(self) -> int:
+        """Number of decimal digits of the current value."""
+        top = int(self._limbs[self._size - 1])
+        return (self._size - 1) * LIMB_DIGITS + len(str(top))
+
+    def multiply(self, k: int) -> None:
+        """
+        Multiply the current value by k in place.
+
+        Args:
+            k: A multiplier between 1 and MAX_MULTIPLIER.
+
+        Raises:
+            InvalidInputError: If k is out of range.
+        """
+        if not 1 <= k <= MAX_MULTIPLIER:
+            raise InvalidInputError(
+                f"Invalid multiplier: {k} is not between 1 and {MAX_MULTIPLIER}"
+            )
+        if self._np is not None:
+            self._multiply_numpy(self._np, k)
+            return
+        limbs = self._limbs
+        carry = 0
+        for i, limb in enumerate(limbs):
+            carry, limbs[i] = divmod(limb * k + carry, BASE)
+        while carry:
+            carry, limb = divmod(carry, BASE)
+            limbs.append(limb)
+        self._size = len(limbs)
+
+    def _multiply_numpy(self, np: ModuleType, k: int) -> None:
+        """Multiply NumPy limbs by k, normalising carries array-wide."""
+        size = self._size
+        active = self._limbs[:size]
+        active *= np.uint64(k)
+        while True:
+            carry = active // np.uint64(BASE)
+            if not carry.any():
+                break
+            active -= carry * np.uint64(BASE)
+            active[1:] += carry[:-1]
+            if carry[-1]:
+                if size == len(self._limbs):
+                    grown = np.zeros(2 * size, dtype=np.uint64)
+                    grown[:size] = self._limbs
+                    self._limbs = grown
+                self._limbs[size] = carry[-1]
+                size += 1
+                active = self._limbs[:size]
+        self._size = size
+
+    def iter_decimal(self, chunk_limbs: int = DEFAULT_CHUNK_LIMBS) -> Iterator[str]:
+        """
+        Yield the decimal digits of the current value, most significant first.
+
+        The chunks read the live limbs, so the iterator must be consumed
+        before the next multiply().
+
+        Args:
+            chunk_limbs: Limbs converted per chunk.
+
+        Returns:
+            Iterator[str]: Decimal chunks in output order.
+        """
+        np = self._np
+        yield str(int(self._limbs[self._size - 1]))
+        for high in range(self._size - 1, 0, -chunk_limbs):
+            low = max(0, high - chunk_limbs)
+            if np is not None:
+                block = self._limbs[low:high][::-1, None]
+                digits = (block // self._powers) % np.uint64(10) + np.uint64(48)
+                yield digits.astype(np.uint8).tobytes().decode("ascii")
+            else:
+                limbs = self._limbs[low:high]
+                limbs.reverse()
+                yield ("%09d" * len(limbs)) % tuple(limbs)
+
+    def write_decimal(self, stream: TextIO) -> int:
+        """
+        Write the decimal representation of the current value.
+
+        Args:
+            stream: Destination text stream.
+
+        Returns:
+            int: Number of digits written.
+        """
+        written = 0
+        for chunk in self.iter_decimal():
+            stream.write(chunk)
+            written += len(chunk)
+        return written
+
+    def __str__(self) -> str:
+        """Return the decimal representation of the current value."""
+        return "".join(self.iter_decimal())
+
+
+def iter_factorial_decimals(
+    start: int,
+    end: int,
+    first: int,
+    token: CancellationToken | None = None,
+    use_numpy: bool | None = None,
+) -> Iterator[tuple[int, Iterator[str]]]:
+    """
+    Stream the decimal digits of start!, (start + 1)!, ..., end!.
+
+    Small results are kept as ints and converted with iter_decimal();
+    once they pass the size where limbs are faster, the running product
+    moves to a DecimalAccumulator and each later step is a single limb
+    pass. The chunk iterators of one result must be consumed before
+    asking for the next.
+
+    Args:
+        start: First input, at most end.
+        end: Last input (inclusive), at most MAX_MULTIPLIER.
+        first: The value of start!.
+        token: Cancellation token checked before every step.
+        use_numpy: Passed to DecimalAccumulator.
+
+    Returns:
+        Iterator[tuple[int, Iterator[str]]]: Pairs (n, decimal chunks of n!).
+
+    Examples:
+        >>> [(n, "".join(chunks)) for n, chunks in iter_factorial_decimals(3, 5, 6)]
+        [(3, '6'), (4, '24'), (5, '120')]
+    """
+    if use_numpy is None:
+        use_numpy = is_numpy_available()
+    threshold = NUMPY_THRESHOLD_DIGITS if use_numpy else PYTHON_THRESHOLD_DIGITS
+    value = first
+    accumulator: DecimalAccumulator | None = None
+    for n in range(start, end + 1):
+        if token is not None:
+            token.check()
+        if n > start:
+            if accumulator is not None:
+                accumulator.multiply(n)
+            else:
+                value *= n
+        if accumulator is None and value.bit_length() * _LOG10_2 >= threshold:
+            accumulator = DecimalAccumulator(value, use_numpy)
+        if accumulator is not None:
+            yield n, accumulator.iter_decimal()
+        else:
+            yield n, iter_decimal(value)
@@ -0,0 +1,475 @@
+"""
+Load-replay harness for the factorial calculator.
+
+This module replays a trace of requests against a FactorialCalculator
+at a chosen concurrency, using threads, processes or asyncio, and
+reports throughput, latency percentiles, the cache hit ratio and peak
+resident memory. Traces are JSONL files with one request per line::
+
+    {"n": 500, "t": 0.25}
+    {"range": [10, 20], "t": 0.5}
+
+where ``t`` is the optional arrival time in seconds from the start of
+the trace. Synthetic traces (Zipf, sequential, uniform) can be generated
+when no recorded trace is available.
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import NamedTuple
+
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import FactorialError, InvalidInputError
+from factorial_calculator.executor import init_worker, worker_calculator
+from factorial_calculator.policy import ResourcePolicy
+
+resource: ModuleType | None
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Concurrency models accepted by replay()
+MODES = ("thread", "process", "asyncio")
+
+# Synthetic trace distributions accepted by synthetic_trace()
+DISTRIBUTIONS = ("zipf", "sequential", "uniform")
+
+
+class TraceRequest(NamedTuple):
+    """
+    One request of a load trace.
+
+    Attributes:
+        low: The input, or the first input of a range.
+        high: Equal to low for a single factorial, else the range end.
+        timestamp: Arrival time in seconds from the start of the trace.
+    """
+
+    low: int
+    high: int
+    timestamp: float = 0.0
+
+    def to_json(self) -> str:
+        """Return the request as one JSONL line."""
+        if self.low == self.high:
+            record: dict[str, object] = {"n": self.low}
+        else:
+            record = {"range": [self.low, self.high]}
+        if self.timestamp:
+            record["t"] = round(self.timestamp, 6)
+        return json.dumps(record)
+
+
+@dataclass
+class LoadReport:
+    """
+    Results of a replay.
+
+    Attributes:
+        mode: Concurrency model used.
+        concurrency: Number of concurrent workers.
+        requests: Requests completed successfully.
+        errors: Requests that raised a FactorialError.
+        duration: Wall time of the replay in seconds.
+        p50: Median latency in seconds.
+        p95: 95th percentile latency in seconds.
+        p99: 99th percentile latency in seconds.
+        hit_ratio: Cache hits per lookup during the replay.
+        peak_rss_kib: Peak resident set size in KiB, or None if unknown.
+    """
+
+    mode: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    p50: float
+    p95: float
+    p99: float
+    hit_ratio: float
+    peak_rss_kib: int | None
+
+    @property
+    def throughput(self) -> float:
+        """Return completed requests per second."""
+        return self.requests / self.duration if self.duration > 0 else 0.0
+
+    def format(self) -> str:
+        """
+        Render the report as human-readable text.
+
+        Returns:
+            str: One metric per line.
+        """
+        rss = "n/a" if self.peak_rss_kib is None else f"{self.peak_rss_kib} KiB"
+        return "\n".join(
+            [
+                f"Mode:        {self.mode} x {self.concurrency}",
+                f"Requests:    {self.requests} ok, {self.errors} errors "
+                f"in {self.duration:.3f}s",
+                f"Throughput:  {self.throughput:.1f} req/s",
+                f"Latency:     p50 {self.p50 * 1e3:.3f} ms, "
+                f"p95 {self.p95 * 1e3:.3f} ms, p99 {self.p99 * 1e3:.3f} ms",
+                f"Hit ratio:   {self.hit_ratio:.1%}",
+                f"Peak RSS:    {rss}",
+            ]
+        )
+
+
+def read_trace(path: Path | str) -> list[TraceRequest]:
+    """
+    Read a JSONL trace file.
+
+    Blank lines are ignored.
+
+    Args:
+        path: The trace file.
+
+    Returns:
+        list[TraceRequest]: Requests sorted by arrival time.
+
+    Raises:
+        InvalidInputError: If a line is not a valid request.
+    """
+    requests = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if "range" in record:
+                    low, high = (int(v) for v in record["range"])
+                else:
+                    low = high = int(record["n"])
+                timestamp = float(record.get("t", 0.0))
+            except (ValueError, KeyError, TypeError) as e:
+                raise InvalidInputError(f"Invalid trace line {number}: {e}") from e
+            requests.append(TraceRequest(low, high, timestamp))
+    requests.sort(key=lambda request: request.timestamp)
+    return requests
+
+
+def write_trace(requests: Iterable[TraceRequest], path: Path | str) -> None:
+    """
+    Write requests as a JSONL trace file.
+
+    Args:
+        requests: The requests to write.
+        path: Destination file.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for request in requests:
+            f.write(request.to_json() + "\n")
+
+
+def synthetic_trace(
+    distribution: str,
+    count: int,
+    max_n: int = 1000,
+    rate: float | None = None,
+    zipf_exponent: float = 1.1,
+    seed: int | None = None,
+) -> list[TraceRequest]:
+    """
+    Generate a trace of single-factorial requests.
+
+    Args:
+        distribution: ``"zipf"`` (a few hot inputs, long tail),
+                      ``"sequential"`` (0, 1, 2, ... wrapping at max_n) or
+                      ``"uniform"``.
+        count: Number of requests.
+        max_n: Largest input generated.
+        rate: Mean arrivals per second (Poisson), or None for all
+              requests at time zero.
+        zipf_exponent: Skew of the Zipf distribution.
+        seed: Random seed for reproducible traces.
+
+    Returns:
+        list[TraceRequest]: The generated requests.
+
+    Raises:
+        InvalidInputError: If the distribution is unknown.
+
+    Examples:
+        >>> [r.low for r in synthetic_trace("sequential", 4, max_n=2)]
+        [0, 1, 2, 0]
+    """
+    # Traces must be reproducible from the seed, not unpredictable
+    rng = random.Random(seed)  # nosec B311
+    inputs = range(max_n + 1)
+    if distribution == "zipf":
+        # Popularity ranks are assigned to inputs in random order
+        ranked = rng.sample(inputs, len(inputs))
+        weights = [1 / rank**zipf_exponent for rank in range(1, len(ranked) + 1)]
+        values = rng.choices(ranked, weights, k=count)
+    elif distribution == "sequential":
+        values = [i % (max_n + 1) for i in range(count)]
+    elif distribution == "uniform":
+        values = [rng.randint(0, max_n) for _ in range(count)]
+    else:
+        raise InvalidInputError(
+            f"Unknown distribution: '{distribution}' "
+            f"(expected one of {', '.join(DISTRIBUTIONS)})"
+        )
+
+    timestamp = 0.0
+    requests = []
+    for value in values:
+        if rate:
+            timestamp += rng.expovariate(rate)
+        requests.append(TraceRequest(value, value, timestamp))
+    return requests
+
+
+def _execute(calculator: FactorialCalculator, request: TraceRequest) -> None:
+    """
+    Run one request against a calculator.
+
+    Args:
+        calculator: The calculator under test.
+        request: The request to run.
+    """
+    if request.low == request.high:
+        calculator.calculate(request.low)
+    else:
+        calculator.calculate_range(request.low, request.high)
+
+
+def _timed(
+    calculator: FactorialCalculator, request: TraceRequest, submitted: float | None
+) -> float | None:
+    """
+    Run a request and return its latency.
+
+    Args:
+        calculator: The calculator under test.
+        request: The request to run.
+        submitted: perf_counter() value when a paced request was issued,
+                   so that queueing delay counts towards its latency, or
+                   None to measure the service time alone.
+
+    Returns:
+        float | None: Latency in seconds, or None if the request failed.
+    """
+    if submitted is None:
+        submitted = time.perf_counter()
+    try:
+        _execute(calculator, request)
+    except FactorialError:
+        return None
+    return time.perf_counter() - submitted
+
+
+def _timed_in_worker(
+    request: TraceRequest, submitted: float | None
+) -> tuple[float | None, int, int, int]:
+    """
+    Run a request in a worker process.
+
+    perf_counter() is system-wide on the supported platforms, so the
+    submission time taken in the parent process can be compared.
+
+    Args:
+        request: The request to run.
+        submitted: perf_counter() value when the request was issued, or
+                   None to measure the service time alone.
+
+    Returns:
+        tuple[float | None, int, int, int]: Latency, worker pid and the
+        worker calculator's cumulative hits and misses.
+    """
+    calculator = worker_calculator()
+    latency = _timed(calculator, request, submitted)
+    stats = calculator.get_stats()
+    return latency, os.getpid(), int(stats["hits"]), int(stats["misses"])
+
+
+def _issue(start: float, request: TraceRequest, pace: bool) -> float | None:
+    """
+    Wait for a request's arrival time when pacing.
+
+    Args:
+        start: perf_counter() value at the start of the replay.
+        request: The request about to be issued.
+        pace: Whether trace timestamps are honoured.
+
+    Returns:
+        float | None: The issue time when pacing, else None.
+    """
+    if not pace:
+        return None
+    delay = start + request.timestamp - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+    return time.perf_counter()
+
+
+def _replay_executor(
+    executor: Executor,
+    requests: Sequence[TraceRequest],
+    calculator: FactorialCalculator,
+    pace: bool,
+) -> list[float | None]:
+    """Replay requests through a thread pool sharing one calculator."""
+    start = time.perf_counter()
+    futures = []
+    for request in requests:
+        submitted = _issue(start, request, pace)
+        futures.append(executor.submit(_timed, calculator, request, submitted))
+    return [future.result() for future in futures]
+
+
+def _replay_processes(
+    requests: Sequence[TraceRequest],
+    concurrency: int,
+    pace: bool,
+    policy: ResourcePolicy,
+) -> tuple[list[float | None], int, int]:
+    """Replay requests through worker processes with their own calculators."""
+    worker_stats: dict[int, tuple[int, int]] = {}
+    latencies: list[float | None] = []
+    with ProcessPoolExecutor(
+        concurrency, initializer=init_worker, initargs=(policy,)
+    ) as pool:
+        start = time.perf_counter()
+        futures = []
+        for request in requests:
+            submitted = _issue(start, request, pace)
+            futures.append(pool.submit(_timed_in_worker, request, submitted))
+        for future in futures:
+            latency, pid, hits, misses = future.result()
+            latencies.append(latency)
+            worker_stats[pid] = max(worker_stats.get(pid, (0, 0)), (hits, misses))
+    hits = sum(h for h, _ in worker_stats.values())
+    misses = sum(m for _, m in worker_stats.values())
+    return latencies, hits, misses
+
+
+async def _replay_async(
+    requests: Sequence[TraceRequest],
+    calculator: FactorialCalculator,
+    concurrency: int,
+    pace: bool,
+) -> list[float | None]:
+    """Replay requests as asyncio tasks bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+
+    async def run(request: TraceRequest) -> float | None:
+        submitted = None
+        if pace:
+            await asyncio.sleep(start + request.timestamp - time.perf_counter())
+            submitted = time.perf_counter()
+        async with semaphore:
+            return await asyncio.to_thread(_timed, calculator, request, submitted)
+
+    return list(await asyncio.gather(*(run(request) for request in requests)))
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of sorted data.
+
+    Args:
+        ordered: Latencies in ascending order.
+        fraction: Percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The percentile, or 0.0 for no data.
+    """
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _peak_rss_kib(mode: str) -> int | None:
+    """Return the peak RSS of this process, or of its workers, in KiB."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if mode == "process" else resource.RUSAGE_SELF
+    return int(resource.getrusage(who).ru_maxrss)
+
+
+def replay(
+    requests: Sequence[TraceRequest],
+    calculator: FactorialCalculator | None = None,
+    concurrency: int = 4,
+    mode: str = "thread",
+    pace: bool = False,
+) -> LoadReport:
+    """
+    Replay a trace and measure how the calculator copes.
+
+    In thread and asyncio mode all workers share one calculator; in
+    process mode each worker process has its own, with the same policy,
+    and the hit ratio is aggregated over them. Without pacing, latency is
+    the service time of each request; with pacing it also includes any
+    queueing delay.
+
+    Args:
+        requests: The trace to replay.
+        calculator: Calculator under test, or None for a fresh one; in
+                    process mode only its policy is used.
+        concurrency: Number of concurrent workers.
+        mode: ``"thread"``, ``"process"`` or ``"asyncio"``.
+        pace: Issue requests at their trace timestamps instead of as fast
+              as possible.
+
+    Returns:
+        LoadReport: Throughput, latency percentiles, hit ratio and peak RSS.
+
+    Raises:
+        InvalidInputError: If the mode or concurrency is invalid.
+    """
+    if mode not in MODES:
+        raise InvalidInputError(
+            f"Unknown mode: '{mode}' (expected one of {', '.join(MODES)})"
+        )
+    if concurrency < 1:
+        raise InvalidInputError("Concurrency must be at least 1")
+    calculator = calculator or FactorialCalculator()
+    before = calculator.get_stats()
+
+    start = time.perf_counter()
+    if mode == "thread":
+        with ThreadPoolExecutor(concurrency) as executor:
+            latencies = _replay_executor(executor, requests, calculator, pace)
+    elif mode == "asyncio":
+        latencies = asyncio.run(_replay_async(requests, calculator, concurrency, pace))
+    else:
+        latencies, hits, misses = _replay_processes(
+            requests, concurrency, pace, calculator.policy
+        )
+    duration = time.perf_counter() - start
+
+    if mode != "process":
+        after = calculator.get_stats()
+        hits = int(after["hits"] - before["hits"])
+        misses = int(after["misses"] - before["misses"])
+
+    ordered = sorted(latency for latency in latencies if latency is not None)
+    lookups = hits + misses
+    return LoadReport(
+        mode=mode,
+        concurrency=concurrency,
+        requests=len(ordered),
+        errors=len(latencies) - len(ordered),
+        duration=duration,
+        p50=_percentile(ordered, 0.50),
+        p95=_percentile(ordered, 0.95),
+        p99=_percentile(ordered, 0.99),
+        hit_ratio=hits / lookups if lookups else 0.0,
+        peak_rss_kib=_peak_rss_kib(mode),
+    )
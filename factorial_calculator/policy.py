@@ -0,0 +1,183 @@
+"""
+Resource-budget policy for the factorial calculator.
+
+This module defines the limits applied to a calculation (input size,
+result size, wall time and cache memory) and the cancellation token
+that long computations poll between chunks.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from factorial_calculator.exceptions import (
+    ComputationCancelledError,
+    DeadlineExceededError,
+    InvalidInputError,
+    OverflowError,
+)
+
+
+def estimate_factorial_bits(n: int) -> int:
+    """
+    Estimate the number of bits of n! without computing it.
+
+    Args:
+        n: A non-negative integer.
+
+    Returns:
+        int: The bit length of n!, up to floating-point rounding.
+
+    Examples:
+        >>> estimate_factorial_bits(20)
+        62
+    """
+    if n < 3:
+        return max(n, 1)
+    return math.floor(math.lgamma(n + 1) / math.log(2)) + 1
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation handle with an optional deadline.
+
+    Long computations call check() between chunks; it raises once the
+    token is cancelled or its deadline has passed. Tokens are safe to
+    cancel from another thread. Computations may also report their
+    progress, from which an estimated time to completion is derived.
+
+    Attributes:
+        deadline: Monotonic time after which check() raises, or None.
+        started: Monotonic time at which the token was created.
+        progress: Estimated fraction of the work done, from 0.0 to 1.0.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        """
+        Initialize the token.
+
+        Args:
+            timeout: Seconds from now after which check() raises
+                     DeadlineExceededError, or None for no deadline.
+        """
+        self._event = threading.Event()
+        self.started = time.monotonic()
+        self.deadline = None if timeout is None else self.started + timeout
+        self.progress = 0.0
+
+    def cancel(self) -> None:
+        """Request cancellation of the computation using this token."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if cancel() has been called."""
+        return self._event.is_set()
+
+    def check(self) -> None:
+        """
+        Raise if the computation should stop.
+
+        Raises:
+            ComputationCancelledError: If the token was cancelled.
+            DeadlineExceededError: If the deadline has passed.
+        """
+        if self._event.is_set():
+            raise ComputationCancelledError("Computation was cancelled")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineExceededError("Computation exceeded its time limit")
+
+    def report_progress(self, fraction: float) -> None:
+        """
+        Record the fraction of the work completed so far.
+
+        Args:
+            fraction: Estimated share of the total work, clamped to 0..1.
+        """
+        self.progress = min(max(fraction, 0.0), 1.0)
+
+    def eta(self) -> float | None:
+        """
+        Estimate the seconds remaining from the reported progress.
+
+        Returns:
+            float | None: Estimated remaining time, or None before any
+            progress has been reported.
+        """
+        if self.progress <= 0.0:
+            return None
+        elapsed = time.monotonic() - self.started
+        return elapsed * (1.0 - self.progress) / self.progress
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """
+    Limits applied by a FactorialCalculator.
+
+    Attributes:
+        max_input: Largest n accepted by validation.
+        max_result_bits: Largest allowed bit length of a result, or None.
+        max_wall_time: Seconds allowed per calculation, or None.
+        max_cache_bytes: Memory budget of the result cache, or None.
+    """
+
+    max_input: int = 10000
+    max_result_bits: int | None = None
+    max_wall_time: float | None = None
+    max_cache_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        """Reject negative limits."""
+        for name in ("max_input", "max_result_bits", "max_wall_time"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise InvalidInputError(f"Invalid policy: {name} is negative")
+        if self.max_cache_bytes is not None and self.max_cache_bytes < 0:
+            raise InvalidInputError("Invalid policy: max_cache_bytes is negative")
+
+    def new_token(self) -> CancellationToken | None:
+        """
+        Create a token enforcing max_wall_time.
+
+        Returns:
+            CancellationToken | None: A token with a deadline, or None if
+            the policy has no time limit.
+        """
+        if self.max_wall_time is None:
+            return None
+        return CancellationToken(self.max_wall_time)
+
+    def check_result_size(self, n: int) -> None:
+        """
+        Ensure n! fits within max_result_bits before computing it.
+
+        Args:
+            n: A validated non-negative integer.
+
+        Raises:
+            OverflowError: If n! would exceed max_result_bits.
+        """
+        if self.max_result_bits is not None:
+            self.check_result_bits(estimate_factorial_bits(n), f"Factorial of {n}")
+
+    def check_result_bits(self, bits: int, description: str) -> None:
+        """
+        Ensure a result of the given size fits within max_result_bits.
+
+        Args:
+            bits: Estimated bit length of the result.
+            description: Human-readable name of the result for errors.
+
+        Raises:
+            OverflowError: If bits exceeds max_result_bits.
+        """
+        if self.max_result_bits is not None and bits > self.max_result_bits:
+            raise OverflowError(
+                f"{description} needs about {bits} bits, exceeding the "
+                f"limit of {self.max_result_bits}"
+            )
+
+
+DEFAULT_POLICY = ResourcePolicy()
@@ -0,0 +1,268 @@
+"""
+Speculative prefetching of likely-next factorials.
+
+Clients often walk n upwards with a fixed stride or come back to the
+neighbours of recent queries. A Prefetcher attached to a calculator
+watches the inputs it is asked for, predicts the next ones and computes
+them on a background thread while the calculator is idle, so that a
+correct prediction turns the next miss into a cache hit.
+
+Prefetching is bounded in CPU, memory and scope: the background thread
+computes for at most a max_cpu_fraction share of wall time, resting in
+proportion to each computation; prefetched results that have not been
+requested yet may occupy at most max_bytes of the cache; and only inputs
+up to max_input are predicted.
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from factorial_calculator.exceptions import FactorialError, InvalidInputError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from factorial_calculator.core import FactorialCalculator
+
+# Number of inputs predicted after each access
+DEFAULT_DEPTH = 2
+
+# Largest input computed speculatively
+DEFAULT_MAX_INPUT = 20000
+
+# Memory budget of prefetched results that were not requested yet
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Seconds without an access before the background thread computes
+DEFAULT_IDLE_DELAY = 0.005
+
+# Largest share of wall time the background thread spends computing
+DEFAULT_MAX_CPU_FRACTION = 0.5
+
+
+class Prefetcher:
+    """
+    Background predictor and precomputer of factorial inputs.
+
+    After two equal steps between consecutive distinct inputs the stride
+    is extrapolated; otherwise the neighbours of the latest input are
+    predicted.
+
+    Attributes:
+        depth: Number of inputs predicted after each access.
+        max_input: Largest input computed speculatively.
+        max_bytes: Budget of prefetched results not requested yet.
+        idle_delay: Seconds without an access before computing.
+        max_cpu_fraction: Largest share of wall time spent computing.
+    """
+
+    def __init__(
+        self,
+        calculator: "FactorialCalculator",
+        depth: int = DEFAULT_DEPTH,
+        max_input: int = DEFAULT_MAX_INPUT,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        idle_delay: float = DEFAULT_IDLE_DELAY,
+        max_cpu_fraction: float = DEFAULT_MAX_CPU_FRACTION,
+    ) -> None:
+        """
+        Initialize the prefetcher; its thread starts on the first prediction.
+
+        Args:
+            calculator: Calculator whose cache receives prefetched results.
+            depth: Number of inputs predicted after each access.
+            max_input: Largest input computed speculatively, lowered to
+                       the calculator's policy max_input.
+            max_bytes: Budget of prefetched results not requested yet.
+            idle_delay: Seconds without an access before computing.
+            max_cpu_fraction: Largest share of wall time spent computing,
+                              in (0, 1]; after a computation taking t
+                              seconds the thread rests for
+                              t * (1 / max_cpu_fraction - 1) seconds.
+
+        Raises:
+            InvalidInputError: If max_cpu_fraction is not in (0, 1].
+        """
+        if not 0 < max_cpu_fraction <= 1:
+            raise InvalidInputError(
+                f"Invalid CPU budget: {max_cpu_fraction} is not in (0, 1]"
+            )
+        self.calculator = calculator
+        self.depth = depth
+        # Predictions above the policy limit would only fail validation
+        self.max_input = min(max_input, calculator.policy.max_input)
+        self.max_bytes = max_bytes
+        self.idle_delay = idle_delay
+        self.max_cpu_fraction = max_cpu_fraction
+        self._recent: deque[int] = deque(maxlen=3)
+        # Newest predictions push out stale ones
+        self._pending: deque[int] = deque(maxlen=4 * depth)
+        # Prefetched inputs not requested yet -> size of their result
+        self._prefetched: dict[int, int] = {}
+        self._prefetched_bytes = 0
+        self._last_access = 0.0
+        # monotonic() time before which the thread rests after computing
+        self._resume_at = 0.0
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # True while a prediction is being computed
+        self._busy = False
+        self.issued = 0
+        self.useful = 0
+        self.skipped = 0
+        self.busy_seconds = 0.0
+
+    def observe(self, n: int) -> None:
+        """
+        Record an access to n! and queue the predicted next inputs.
+
+        Args:
+            n: A validated input requested from the calculator.
+        """
+        with self._condition:
+            self._last_access = time.monotonic()
+            size = self._prefetched.pop(n, None)
+            if size is not None:
+                self.useful += 1
+                self._prefetched_bytes -= size
+            if self._recent and self._recent[-1] == n:
+                return
+            self._recent.append(n)
+            predictions = [
+                m
+                for m in self.predict()
+                if 0 <= m <= self.max_input and m not in self._pending
+            ]
+            if not predictions or self._closed:
+                return
+            self._pending.extend(predictions)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="factorial-prefetch", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def predict(self) -> list[int]:
+        """
+        Predict the next inputs from the recent distinct accesses.
+
+        Returns:
+            list[int]: Up to depth inputs, most likely first.
+
+        Examples:
+            >>> from factorial_calculator.core import FactorialCalculator
+            >>> prefetcher = Prefetcher(FactorialCalculator())
+            >>> prefetcher._recent.extend([100, 110, 120])
+            >>> prefetcher.predict()
+            [130, 140]
+        """
+        recent = self._recent
+        if not recent:
+            return []
+        last = recent[-1]
+        if len(recent) == 3 and recent[2] - recent[1] == recent[1] - recent[0]:
+            stride = recent[2] - recent[1]
+            return [last + stride * k for k in range(1, self.depth + 1)]
+        neighbours = [last + 1, last - 1, last + 2, last - 2]
+        return neighbours[: self.depth]
+
+    def _run(self) -> None:
+        """Compute queued predictions whenever the calculator is idle."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                now = time.monotonic()
+                wait = max(self._last_access + self.idle_delay, self._resume_at) - now
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                n = self._pending.popleft()
+                self._busy = self._within_budget()
+                if not self._busy:
+                    self.skipped += 1
+                    self._condition.notify_all()
+                    continue
+            started = time.monotonic()
+            try:
+                value = (
+                    None if self.calculator.is_cached(n) else self.calculator.warm(n)
+                )
+            except FactorialError:
+                value = None
+            elapsed = time.monotonic() - started
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+                self.busy_seconds += elapsed
+                rest = elapsed * (1 / self.max_cpu_fraction - 1)
+                self._resume_at = started + elapsed + rest
+                if value is None:
+                    self.skipped += 1
+                    continue
+                self.issued += 1
+                size = sys.getsizeof(value)
+                self._prefetched[n] = size
+                self._prefetched_bytes += size
+
+    def _within_budget(self) -> bool:
+        """
+        Check the memory budget, forgetting prefetched entries evicted since.
+
+        Returns:
+            bool: True if another result may be prefetched.
+        """
+        if self._prefetched_bytes < self.max_bytes:
+            return True
+        for n in [n for n in self._prefetched if not self.calculator.is_cached(n)]:
+            self._prefetched_bytes -= self._prefetched.pop(n)
+        return self._prefetched_bytes < self.max_bytes
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """
+        Block until every queued prediction has been handled.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait forever.
+
+        Returns:
+            bool: True if the queue drained before the timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Report prefetch activity.
+
+        Returns:
+            dict[str, int | float]: Results prefetched, prefetched results
+            later requested, predictions skipped, accuracy (requested per
+            prefetched), bytes of results not requested yet and seconds
+            spent computing.
+        """
+        with self._condition:
+            return {
+                "prefetch_issued": self.issued,
+                "prefetch_useful": self.useful,
+                "prefetch_skipped": self.skipped,
+                "prefetch_accuracy": self.useful / self.issued if self.issued else 0.0,
+                "prefetch_bytes": self._prefetched_bytes,
+                "prefetch_seconds": self.busy_seconds,
+            }
+
+    def close(self) -> None:
+        """Stop the background thread and drop queued predictions."""
+        with self._condition:
+            self._closed = True
+            self._pending.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,198 @@
+"""
+Prime sieve service shared by factorisation-based algorithms.
+
+This module provides a segmented sieve of Eratosthenes that grows
+incrementally: each extension sieves only the new ``bytearray``
+segments, and the primes found so far are kept in a compact
+``array('I')``. A single shared instance serves the combinatorics
+functions, the primorial and any calculator strategy that needs primes.
+"""
+
+import math
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from itertools import compress
+
+# Numbers sieved per segment
+DEFAULT_SEGMENT_SIZE = 1 << 16
+
+# Largest value representable in the array('I') prime store
+_MAX_PRIME_LIMIT = 2**32 - 1
+
+
+class PrimeSieve:
+    """
+    Segmented, incrementally extended sieve of Eratosthenes.
+
+    Extensions are serialised by a lock, so the sieve can be shared
+    between threads.
+
+    Attributes:
+        segment_size: Number of integers sieved per segment.
+    """
+
+    def __init__(self, segment_size: int = DEFAULT_SEGMENT_SIZE) -> None:
+        """
+        Initialize an empty sieve.
+
+        Args:
+            segment_size: Number of integers sieved per segment.
+        """
+        self.segment_size = max(segment_size, 16)
+        self._primes = array("I")
+        self._limit = 1
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Return the bound up to which all primes are known."""
+        return self._limit
+
+    def __len__(self) -> int:
+        """Return the number of primes found so far."""
+        return len(self._primes)
+
+    def extend(self, limit: int) -> None:
+        """
+        Sieve further segments until all primes <= limit are known.
+
+        Args:
+            limit: The bound to reach.
+
+        Raises:
+            ValueError: If limit does not fit the 32-bit prime store.
+        """
+        if limit <= self._limit:
+            return
+        if limit > _MAX_PRIME_LIMIT:
+            raise ValueError(f"Prime limit {limit} exceeds {_MAX_PRIME_LIMIT}")
+        with self._lock:
+            while self._limit < limit:
+                low = self._limit + 1
+                high = min(low + self.segment_size, _MAX_PRIME_LIMIT + 1)
+                self._sieve_segment(low, high)
+                self._limit = high - 1
+
+    def _sieve_segment(self, low: int, high: int) -> None:
+        """
+        Append the primes of [low, high) to the prime store.
+
+        Base primes up to sqrt(high) are taken from the store; on the
+        first segment they are discovered within the segment itself.
+
+        Args:
+            low: First integer of the segment (>= 2).
+            high: End of the segment (exclusive).
+        """
+        segment = bytearray([1]) * (high - low)
+        if low == 2:
+            for p in range(2, math.isqrt(high - 1) + 1):
+                if segment[p - low]:
+                    segment[p * p - low :: p] = bytes(len(range(p * p, high, p)))
+        else:
+            for p in self._primes:
+                square = p * p
+                if square >= high:
+                    break
+                start = max(square, -(-low // p) * p)
+                segment[start - low :: p] = bytes(len(range(start, high, p)))
+        self._primes.extend(compress(range(low, high), segment))
+
+    def primes_up_to(self, limit: int) -> array:
+        """
+        Return all primes less than or equal to limit.
+
+        Args:
+            limit: Upper bound (inclusive).
+
+        Returns:
+            array: An ``array('I')`` of primes in ascending order.
+        """
+        self.extend(limit)
+        with self._lock:
+            return self._primes[: bisect_right(self._primes, limit)]
+
+    def primes_in_range(self, low: int, high: int) -> Iterator[int]:
+        """
+        Iterate over the primes p with low <= p <= high.
+
+        Args:
+            low: Lower bound (inclusive).
+            high: Upper bound (inclusive).
+
+        Returns:
+            Iterator[int]: Primes in ascending order.
+        """
+        self.extend(high)
+        with self._lock:
+            start = bisect_left(self._primes, low)
+            stop = bisect_right(self._primes, high)
+            return iter(self._primes[start:stop])
+
+    def prime_count(self, limit: int) -> int:
+        """
+        Return the number of primes less than or equal to limit.
+
+        Args:
+            limit: Upper bound (inclusive).
+
+        Returns:
+            int: The prime-counting function pi(limit).
+        """
+        self.extend(limit)
+        with self._lock:
+            return bisect_right(self._primes, limit)
+
+
+_shared_sieve = PrimeSieve()
+
+
+def get_sieve() -> PrimeSieve:
+    """
+    Return the process-wide shared sieve.
+
+    Returns:
+        PrimeSieve: The shared instance.
+    """
+    return _shared_sieve
+
+
+def primes_up_to(limit: int) -> list[int]:
+    """
+    Return all primes less than or equal to limit from the shared sieve.
+
+    Args:
+        limit: Upper bound (inclusive).
+
+    Returns:
+        list[int]: Primes in ascending order.
+
+    Examples:
+        >>> primes_up_to(20)
+        [2, 3, 5, 7, 11, 13, 17, 19]
+    """
+    return _shared_sieve.primes_up_to(limit).tolist()
+
+
+def legendre_exponent(n: int, p: int) -> int:
+    """
+    Return the exponent of prime p in n! (Legendre's formula).
+
+    Args:
+        n: A non-negative integer.
+        p: A prime.
+
+    Returns:
+        int: The largest e such that p**e divides n!.
+
+    Examples:
+        >>> legendre_exponent(10, 2)
+        8
+    """
+    exponent = 0
+    while n:
+        n //= p
+        exponent += n
+    return exponent
@@ -0,0 +1,335 @@
+"""
+Lazy factorial result type.
+
+This module provides FactorialResult, an opt-in wrapper around a
+computed factorial that derives expensive views (digit counts, leading
+and trailing digits, hex and byte forms) only on demand and caches each
+of them. Decimal output can be streamed in chunks so that callers never
+hold the full decimal string of a huge result. A result may also be
+held as its odd part and power-of-two exponent, in which case the shift
+is applied only when the full integer is needed.
+"""
+
+import math
+from collections.abc import Callable, Iterator
+from typing import Literal, TextIO, TypeVar
+
+from factorial_calculator.exceptions import InvalidInputError
+
+# Digits per streamed decimal chunk; must stay below CPython's integer
+# string conversion limit (4300 digits by default)
+DEFAULT_CHUNK_DIGITS = 1000
+MAX_CHUNK_DIGITS = 4000
+
+T = TypeVar("T")
+
+
+def iter_decimal(value: int, chunk_digits: int = DEFAULT_CHUNK_DIGITS) -> Iterator[str]:
+    """
+    Yield the decimal digits of a non-negative integer, most significant first.
+
+    The value is split recursively around powers 10**(chunk_digits * 2**i)
+    so that only chunks of at most chunk_digits digits are converted by
+    str(). Concatenating the chunks gives str(value).
+
+    Args:
+        value: A non-negative integer.
+        chunk_digits: Maximum number of digits per chunk.
+
+    Returns:
+        Iterator[str]: Decimal chunks in output order.
+
+    Raises:
+        InvalidInputError: If value is negative or chunk_digits is out of
+            range.
+
+    Examples:
+        >>> list(iter_decimal(1234567, chunk_digits=3))
+        ['1', '234', '567']
+    """
+    if value < 0:
+        raise InvalidInputError("Invalid input: cannot stream a negative value")
+    if not 1 <= chunk_digits <= MAX_CHUNK_DIGITS:
+        raise InvalidInputError(
+            f"Invalid chunk size: {chunk_digits} is not between 1 and "
+            f"{MAX_CHUNK_DIGITS}"
+        )
+    powers = [10**chunk_digits]
+    while powers[-1].bit_length() * 2 - 1 <= value.bit_length():
+        powers.append(powers[-1] * powers[-1])
+    return _emit_decimal(value, powers, len(powers) - 1, chunk_digits, pad=False)
+
+
+def _emit_decimal(
+    value: int, powers: list[int], level: int, chunk_digits: int, pad: bool
+) -> Iterator[str]:
+    """
+    Recursively yield decimal chunks of value < powers[level] ** 2.
+
+    Args:
+        value: The part of the number to emit.
+        powers: powers[i] == 10 ** (chunk_digits * 2 ** i).
+        level: Index of the power to split around, or -1 for a leaf.
+        chunk_digits: Digits per leaf chunk.
+        pad: True if leading zeros must be kept (not the leading part).
+
+    Returns:
+        Iterator[str]: Decimal chunks in output order.
+    """
+    if level < 0:
+        text = str(value)
+        yield text.zfill(chunk_digits) if pad else text
+        return
+    high, low = divmod(value, powers[level])
+    if high or pad:
+        yield from _emit_decimal(high, powers, level - 1, chunk_digits, pad)
+        yield from _emit_decimal(low, powers, level - 1, chunk_digits, True)
+    else:
+        yield from _emit_decimal(low, powers, level - 1, chunk_digits, False)
+
+
+class FactorialResult:
+    """
+    Lazily evaluated view of a factorial result.
+
+    The wrapped integer is available through int(), operator.index() and
+    the value attribute, so the result can be used wherever an int is
+    expected. Derived views are computed on first use and cached.
+
+    Attributes:
+        n: The input the result was computed for, if known.
+    """
+
+    __slots__ = ("_odd", "_shift", "_value", "_views", "n")
+
+    def __init__(self, value: int, n: int | None = None) -> None:
+        """
+        Wrap an already computed result.
+
+        Args:
+            value: The non-negative result.
+            n: The input it was computed for, if known.
+        """
+        self._value: int | None = value
+        # Odd part, or 0 if the result was given whole; _value is only
+        # None when it is set
+        self._odd = 0
+        self._shift = 0
+        self._views: dict[object, object] = {}
+        self.n = n
+
+    @classmethod
+    def from_odd_part(
+        cls, odd: int, shift: int, n: int | None = None
+    ) -> "FactorialResult":
+        """
+        Wrap a result given as odd * 2**shift.
+
+        The full integer is only formed when first needed; bit lengths,
+        hex digits and byte encodings are derived from the odd part.
+
+        Args:
+            odd: The odd part of the result.
+            shift: The exponent of 2 in the result.
+            n: The input it was computed for, if known.
+
+        Returns:
+            FactorialResult: The wrapped result.
+
+        Raises:
+            InvalidInputError: If odd is not a positive odd integer or
+                shift is negative.
+
+        Examples:
+            >>> FactorialResult.from_odd_part(15, 3, n=5).hex()
+            '78'
+        """
+        if odd < 1 or not odd & 1 or shift < 0:
+            raise InvalidInputError(
+                f"Invalid odd part: {odd} * 2**{shift} is not an odd part "
+                "and a non-negative shift"
+            )
+        result = cls(0, n)
+        result._value = None
+        result._odd = odd
+        result._shift = shift
+        return result
+
+    @property
+    def value(self) -> int:
+        """Return the wrapped integer, applying the shift on first use."""
+        if self._value is None:
+            self._value = self._odd << self._shift
+        return self._value
+
+    def __int__(self) -> int:
+        """Return the wrapped integer."""
+        return self.value
+
+    def __index__(self) -> int:
+        """Return the wrapped integer for slicing, bin(), hex() and friends."""
+        return self.value
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another result or an int."""
+        if isinstance(other, FactorialResult):
+            return self.value == other.value
+        if isinstance(other, int):
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash like the wrapped integer."""
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        """Describe the result without converting it to decimal."""
+        return f"FactorialResult(n={self.n}, bits={self.bit_length()})"
+
+    def __str__(self) -> str:
+        """Return the full decimal representation."""
+        return "".join(self.iter_decimal())
+
+    def _cached(self, key: object, compute: Callable[[], T]) -> T:
+        """Return the cached view for key, computing it on first use."""
+        try:
+            return self._views[key]  # type: ignore[return-value]
+        except KeyError:
+            view = compute()
+            self._views[key] = view
+            return view
+
+    def bit_length(self) -> int:
+        """
+        Return the number of bits of the result.
+
+        Returns:
+            int: The bit length.
+        """
+        if self._odd:
+            return self._odd.bit_length() + self._shift
+        return self.value.bit_length()
+
+    @property
+    def digit_count(self) -> int:
+        """Return the number of decimal digits, without a full conversion."""
+
+        def compute() -> int:
+            value = self.value
+            if value == 0:
+                return 1
+            estimate = int((value.bit_length() - 1) * math.log10(2)) + 1
+            power: int = 10**estimate
+            return estimate + (value >= power)
+
+        return self._cached("digit_count", compute)
+
+    def leading_digits(self, count: int = 10) -> str:
+        """
+        Return the first decimal digits of the result.
+
+        Args:
+            count: Number of digits to return.
+
+        Returns:
+            str: Up to count leading digits.
+        """
+
+        def compute() -> str:
+            drop = self.digit_count - count
+            head = self.value // 10**drop if drop > 0 else self.value
+            return str(head)
+
+        return self._cached(("leading", count), compute)
+
+    def trailing_digits(self, count: int = 10) -> str:
+        """
+        Return the last decimal digits of the result, zero-padded.
+
+        Args:
+            count: Number of digits to return.
+
+        Returns:
+            str: The last min(count, digit_count) digits.
+        """
+
+        def compute() -> str:
+            width = min(count, self.digit_count)
+            return str(self.value % 10**width).zfill(width)
+
+        return self._cached(("trailing", count), compute)
+
+    def hex(self) -> str:
+        """
+        Return the lower-case hexadecimal digits of the result.
+
+        Results built from an odd part only convert the odd part; the
+        factor 2**shift becomes shift // 4 trailing zero digits.
+
+        Returns:
+            str: Hex digits without a ``0x`` prefix.
+        """
+
+        def compute() -> str:
+            if not self._odd:
+                return format(self.value, "x")
+            head = format(self._odd << (self._shift & 3), "x")
+            return head + "0" * (self._shift >> 2)
+
+        return self._cached("hex", compute)
+
+    def to_bytes(self, byteorder: Literal["little", "big"] = "big") -> bytes:
+        """
+        Return the minimal unsigned byte encoding of the result.
+
+        Results built from an odd part only encode the odd part; the
+        factor 2**shift becomes shift // 8 zero bytes.
+
+        Args:
+            byteorder: "big" or "little".
+
+        Returns:
+            bytes: The encoded value.
+        """
+
+        def compute() -> bytes:
+            if not self._odd:
+                value = self.value
+                return value.to_bytes(max(1, (value.bit_length() + 7) // 8), byteorder)
+            head = self._odd << (self._shift & 7)
+            body = head.to_bytes((head.bit_length() + 7) // 8, byteorder)
+            zeros = bytes(self._shift >> 3)
+            return body + zeros if byteorder == "big" else zeros + body
+
+        return self._cached(("bytes", byteorder), compute)
+
+    def iter_decimal(self, chunk_digits: int = DEFAULT_CHUNK_DIGITS) -> Iterator[str]:
+        """
+        Stream the decimal representation in chunks.
+
+        Args:
+            chunk_digits: Maximum number of digits per chunk.
+
+        Returns:
+            Iterator[str]: Decimal chunks, most significant first.
+        """
+        return iter_decimal(self.value, chunk_digits)
+
+    def write_decimal(
+        self, stream: TextIO, chunk_digits: int = DEFAULT_CHUNK_DIGITS
+    ) -> int:
+        """
+        Write the decimal representation to a text stream chunk by chunk.
+
+        Args:
+            stream: Destination text stream.
+            chunk_digits: Maximum number of digits per chunk.
+
+        Returns:
+            int: Number of digits written.
+        """
+        written = 0
+        for chunk in self.iter_decimal(chunk_digits):
+            stream.write(chunk)
+            written += len(chunk)
+        return written
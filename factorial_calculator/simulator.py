@@ -0,0 +1,537 @@
+"""
+Offline cache-policy simulator.
+
+This module replays a sequence of requested inputs through candidate
+cache policies without computing any factorial. Each policy tracks which
+results it would hold and how many bytes they would take; every miss is
+priced with a CostModel built from big-integer multiplication times
+measured on the current machine. The resulting reports compare hit
+ratio, memory footprint and estimated compute time per policy, so that
+cache settings can be chosen from recorded traffic.
+
+Available policies:
+
+* ``unbounded``: keep every result (the default FactorialCache);
+* ``lru``/``lfu``: keep at most a number of entries, evicting the least
+  recently or least frequently used one;
+* ``bytes``: LRU within a byte budget, like ``FactorialCache(max_bytes)``;
+* ``checkpoint``: keep only multiples of an interval and extend the
+  nearest checkpoint to the requested input on a miss.
+"""
+
+import math
+import operator
+import random
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import ClassVar
+
+from factorial_calculator.combinatorics import log2_factorial
+from factorial_calculator.core import LEAF_SIZE, WORD_BITS
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.loadtest import TraceRequest
+from factorial_calculator.policy import estimate_factorial_bits
+from factorial_calculator.tuning import best_time
+
+# Operand sizes in bits of the balanced products timed by CostModel.measure()
+DEFAULT_MEASURE_BITS: tuple[int, ...] = tuple(1 << k for k in range(6, 21, 2))
+
+
+def result_size(bits: int) -> int:
+    """
+    Return sys.getsizeof() of a non-negative int with the given bit length.
+
+    Args:
+        bits: Bit length of the value.
+
+    Returns:
+        int: Size of the int object in bytes.
+
+    Examples:
+        >>> result_size(100) == sys.getsizeof(2**99)
+        True
+    """
+    digits = max(1, -(-bits // sys.int_info.bits_per_digit))
+    return int.__basicsize__ + int.__itemsize__ * digits
+
+
+@dataclass(frozen=True)
+class CostModel:
+    """
+    Estimated time of the multiplications behind a factorial.
+
+    Attributes:
+        samples: Sorted (bits, seconds) timings of products of two
+            random integers of the same bit length.
+    """
+
+    samples: tuple[tuple[int, float], ...]
+
+    @classmethod
+    def measure(
+        cls, sizes: Sequence[int] = DEFAULT_MEASURE_BITS, repeat: int = 3
+    ) -> "CostModel":
+        """
+        Time balanced multiplications on this machine.
+
+        Args:
+            sizes: Operand bit lengths to time.
+            repeat: Measurements per size.
+
+        Returns:
+            CostModel: The measured model.
+
+        Raises:
+            InvalidInputError: If no positive size is given.
+        """
+        ordered = sorted({bits for bits in sizes if bits > 0})
+        if not ordered:
+            raise InvalidInputError("The cost model needs at least one size")
+        # Operands only need all their bits set at random, not secrecy
+        rng = random.Random(0)  # nosec B311
+        samples = []
+        for bits in ordered:
+            a = rng.getrandbits(bits) | 1 << (bits - 1)
+            b = rng.getrandbits(bits) | 1 << (bits - 1)
+            samples.append((bits, best_time(partial(operator.mul, a), b, repeat)))
+        return cls(tuple(samples))
+
+    def balanced(self, bits: float) -> float:
+        """
+        Estimate the time of multiplying two integers of the given size.
+
+        Timings are interpolated, and extrapolated beyond the measured
+        sizes, linearly in log-log space.
+
+        Args:
+            bits: Bit length of both operands.
+
+        Returns:
+            float: Estimated seconds.
+
+        Examples:
+            >>> CostModel(((64, 1e-7), (1024, 1.6e-6))).balanced(4096)
+            6.4e-06
+        """
+        points = self.samples
+        if len(points) == 1:
+            return points[0][1] * bits / points[0][0]
+        index = 1
+        while index < len(points) - 1 and points[index][0] < bits:
+            index += 1
+        (x0, y0), (x1, y1) = points[index - 1], points[index]
+        exponent = math.log(y1 / y0) / math.log(x1 / x0)
+        return y0 * math.pow(bits / x0, exponent)
+
+    def multiply(self, a_bits: float, b_bits: float) -> float:
+        """
+        Estimate the time of multiplying integers of two sizes.
+
+        An unbalanced product costs one balanced product per chunk of
+        the larger operand.
+
+        Args:
+            a_bits: Bit length of one operand.
+            b_bits: Bit length of the other operand.
+
+        Returns:
+            float: Estimated seconds.
+        """
+        small, large = sorted((max(a_bits, 1.0), max(b_bits, 1.0)))
+        return math.ceil(large / small) * self.balanced(small)
+
+    def range_product(self, low: int, high: int) -> float:
+        """
+        Estimate the time of range_product(low, high).
+
+        Args:
+            low: First factor (at least 1).
+            high: Last factor.
+
+        Returns:
+            float: Estimated seconds.
+        """
+        count = high - low + 1
+        if count <= 1:
+            return 0.0
+        bits = log2_factorial(high) - log2_factorial(low - 1)
+        leaves = -(-count // LEAF_SIZE)
+        seconds = count * self.multiply(WORD_BITS, bits / leaves / 2)
+        parts = 1
+        while parts < leaves:
+            seconds += parts * self.balanced(bits / (2 * parts))
+            parts *= 2
+        return seconds
+
+    def factorial(self, n: int) -> float:
+        """
+        Estimate the time of computing n! from scratch.
+
+        Args:
+            n: A non-negative integer.
+
+        Returns:
+            float: Estimated seconds.
+        """
+        return self.range_product(2, n)
+
+    def extend(self, m: int, n: int) -> float:
+        """
+        Estimate the time of computing n! from a known m! (m < n).
+
+        Args:
+            m: The input whose factorial is known.
+            n: The input to compute.
+
+        Returns:
+            float: Estimated seconds.
+        """
+        if n <= m:
+            return 0.0
+        tail_bits = log2_factorial(n) - log2_factorial(m)
+        return self.range_product(m + 1, n) + self.multiply(
+            estimate_factorial_bits(m), tail_bits
+        )
+
+
+class CachePolicy:
+    """
+    Simulated cache keeping every result (no eviction).
+
+    Subclasses override _touch() and _evict() to implement eviction, or
+    fill() to change what a miss computes and stores.
+
+    Attributes:
+        name: Short label of the policy in reports.
+    """
+
+    kind: ClassVar[str] = "unbounded"
+
+    def __init__(self) -> None:
+        """Initialize an empty simulated cache."""
+        self.name = self.kind
+        self._sizes: OrderedDict[int, int] = OrderedDict()
+        self.nbytes = 0
+
+    def access(self, n: int) -> bool:
+        """
+        Look up n! and update the usage bookkeeping.
+
+        Args:
+            n: The requested input.
+
+        Returns:
+            bool: True on a hit.
+        """
+        if n in self._sizes:
+            self._touch(n)
+            return True
+        return False
+
+    def fill(self, n: int, costs: CostModel) -> float:
+        """
+        Compute n! after a miss and store it.
+
+        Args:
+            n: The requested input.
+            costs: Model pricing the computation.
+
+        Returns:
+            float: Estimated seconds spent computing.
+        """
+        self._store(n)
+        return costs.factorial(n)
+
+    def _store(self, n: int) -> None:
+        """Record n! as cached, then evict as needed."""
+        size = result_size(estimate_factorial_bits(n))
+        self._sizes[n] = size
+        self.nbytes += size
+        self._evict()
+
+    def _discard(self, n: int) -> None:
+        """Drop n! from the cache."""
+        self.nbytes -= self._sizes.pop(n)
+
+    def _touch(self, n: int) -> None:
+        """Record a hit on n! (nothing to do without eviction)."""
+
+    def _evict(self) -> None:
+        """Evict entries until the policy's limit holds (no limit here)."""
+
+
+class LRUPolicy(CachePolicy):
+    """Simulated cache of at most max_entries, evicting the least recent."""
+
+    kind = "lru"
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_entries: Number of results kept.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.name = f"lru({max_entries})"
+
+    def _touch(self, n: int) -> None:
+        """Mark n! as most recently used."""
+        self._sizes.move_to_end(n)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_entries."""
+        while len(self._sizes) > self.max_entries:
+            self._discard(next(iter(self._sizes)))
+
+
+class LFUPolicy(CachePolicy):
+    """
+    Simulated cache of at most max_entries, evicting the least frequent.
+
+    Ties are broken by age, oldest first. Frequencies are remembered for
+    evicted inputs too, so a popular input regains its rank when it
+    returns.
+    """
+
+    kind = "lfu"
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_entries: Number of results kept.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.name = f"lfu({max_entries})"
+        self._counts: dict[int, int] = {}
+
+    def access(self, n: int) -> bool:
+        """Count the access to n!, then look it up."""
+        self._counts[n] = self._counts.get(n, 0) + 1
+        return super().access(n)
+
+    def _evict(self) -> None:
+        """Drop least frequently used entries beyond max_entries."""
+        while len(self._sizes) > self.max_entries:
+            self._discard(min(self._sizes, key=self._counts.__getitem__))
+
+
+class ByteBudgetPolicy(LRUPolicy):
+    """
+    Simulated ``FactorialCache(max_bytes)``: LRU within a byte budget.
+
+    Results larger than the whole budget are not cached.
+    """
+
+    kind = "bytes"
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_bytes: Memory budget of cached results.
+        """
+        super().__init__(sys.maxsize)
+        self.max_bytes = max_bytes
+        self.name = f"bytes({max_bytes})"
+
+    def _store(self, n: int) -> None:
+        """Record n! as cached unless it exceeds the whole budget."""
+        if result_size(estimate_factorial_bits(n)) <= self.max_bytes:
+            super()._store(n)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond the byte budget."""
+        while self.nbytes > self.max_bytes:
+            self._discard(next(iter(self._sizes)))
+
+
+class CheckpointPolicy(CachePolicy):
+    """
+    Simulated cache holding only the factorials of multiples of interval.
+
+    A miss for n extends the checkpoint below n, computing that
+    checkpoint first (from the nearest cached one below it) if needed.
+    Only checkpoints are stored, so other inputs always miss but cost
+    at most interval small multiplications plus one product.
+    """
+
+    kind = "checkpoint"
+
+    def __init__(self, interval: int) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            interval: Distance between checkpoints (positive).
+
+        Raises:
+            InvalidInputError: If interval is not positive.
+        """
+        if interval < 1:
+            raise InvalidInputError("The checkpoint interval must be positive")
+        super().__init__()
+        self.interval = interval
+        self.name = f"checkpoint({interval})"
+
+    def fill(self, n: int, costs: CostModel) -> float:
+        """Extend the checkpoint below n, creating it if needed."""
+        checkpoint = n - n % self.interval
+        seconds = 0.0
+        if checkpoint not in self._sizes:
+            below = max((c for c in self._sizes if c < checkpoint), default=None)
+            seconds += (
+                costs.factorial(checkpoint)
+                if below is None
+                else costs.extend(below, checkpoint)
+            )
+            self._store(checkpoint)
+        return seconds + costs.extend(checkpoint, n)
+
+
+@dataclass
+class PolicyReport:
+    """
+    Outcome of replaying a trace through one policy.
+
+    Attributes:
+        policy: Name of the policy.
+        hits: Requests served from the simulated cache.
+        misses: Requests that had to compute.
+        peak_bytes: Largest simulated cache footprint.
+        final_bytes: Footprint at the end of the trace.
+        compute_seconds: Estimated time spent computing misses.
+    """
+
+    policy: str
+    hits: int
+    misses: int
+    peak_bytes: int
+    final_bytes: int
+    compute_seconds: float
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return hits per request."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def trace_inputs(requests: Iterable[TraceRequest]) -> list[int]:
+    """
+    Flatten a load trace into the sequence of inputs it requests.
+
+    A range request contributes every input from its start to its end.
+
+    Args:
+        requests: Requests of a recorded or synthetic trace.
+
+    Returns:
+        list[int]: The requested inputs, in order.
+    """
+    inputs: list[int] = []
+    for request in requests:
+        inputs.extend(range(request.low, request.high + 1))
+    return inputs
+
+
+def default_policies(
+    max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024, interval: int = 100
+) -> list[CachePolicy]:
+    """
+    Build one policy of each kind.
+
+    Args:
+        max_entries: Capacity of the LRU and LFU policies.
+        max_bytes: Budget of the byte-budgeted policy.
+        interval: Checkpoint interval.
+
+    Returns:
+        list[CachePolicy]: Unbounded, LRU, LFU, byte-budgeted and
+        checkpointed policies.
+    """
+    return [
+        CachePolicy(),
+        LRUPolicy(max_entries),
+        LFUPolicy(max_entries),
+        ByteBudgetPolicy(max_bytes),
+        CheckpointPolicy(interval),
+    ]
+
+
+def simulate(
+    inputs: Sequence[int], policies: Iterable[CachePolicy], costs: CostModel
+) -> list[PolicyReport]:
+    """
+    Replay inputs through each policy.
+
+    Args:
+        inputs: Requested inputs, in order.
+        policies: Fresh policies to compare.
+        costs: Model pricing each computation.
+
+    Returns:
+        list[PolicyReport]: One report per policy, in order.
+
+    Raises:
+        InvalidInputError: If an input is negative.
+
+    Examples:
+        >>> model = CostModel(((64, 1e-7), (1024, 1.6e-6)))
+        >>> [r.hits for r in simulate([5, 9, 5, 9], [LRUPolicy(1)], model)]
+        [0]
+    """
+    if any(n < 0 for n in inputs):
+        raise InvalidInputError("Invalid input: traces cannot contain negatives")
+    reports = []
+    for policy in policies:
+        hits = peak = 0
+        seconds = 0.0
+        for n in inputs:
+            if policy.access(n):
+                hits += 1
+                continue
+            seconds += policy.fill(n, costs)
+            peak = max(peak, policy.nbytes)
+        reports.append(
+            PolicyReport(
+                policy.name,
+                hits,
+                len(inputs) - hits,
+                peak,
+                policy.nbytes,
+                seconds,
+            )
+        )
+    return reports
+
+
+def format_reports(reports: Iterable[PolicyReport]) -> str:
+    """
+    Render policy reports as an aligned text table.
+
+    Args:
+        reports: The reports to render.
+
+    Returns:
+        str: A header line and one line per policy.
+    """
+    lines = [
+        f"{'Policy':<24} {'Hit ratio':>9} {'Peak bytes':>14} "
+        f"{'Final bytes':>14} {'Compute':>12}"
+    ]
+    for report in reports:
+        lines.append(
+            f"{report.policy:<24} {report.hit_ratio:>9.1%} "
+            f"{report.peak_bytes:>14,} {report.final_bytes:>14,} "
+            f"{report.compute_seconds:>11.4f}s"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,259 @@
+"""
+Machine-specific tuning of factorial strategy crossovers.
+
+The fastest way to compute n! depends on n, the CPU and the Python
+build. This module defines the TuningProfile that maps input sizes to
+strategy names, reads and writes it as a small JSON file, and measures
+a set of strategies on the current machine to produce a new profile.
+Without a profile file the built-in defaults are used.
+"""
+
+import json
+import math
+import os
+import platform
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from factorial_calculator.exceptions import InvalidInputError, VerificationError
+
+# Environment variable overriding the profile location
+PROFILE_ENV_VAR = "FACTORIAL_TUNING_PROFILE"
+
+PROFILE_VERSION = 1
+
+# Input sizes measured by default when tuning; the largest is above
+# core.PARALLEL_MIN_INPUT so that the parallel strategy is measured too
+DEFAULT_TUNING_SIZES: tuple[int, ...] = (16, 64, 256, 1024, 4096, 16384, 32768)
+
+
+@dataclass(frozen=True)
+class TuningProfile:
+    """
+    Mapping from input size to the strategy used to compute n!.
+
+    Attributes:
+        ranges: Sorted (max_n, strategy) pairs; n uses the strategy of
+            the first pair whose max_n is at least n.
+        fallback: Strategy for inputs beyond the last range.
+        timings: Measured seconds per size and strategy, for reference.
+    """
+
+    ranges: tuple[tuple[int, str], ...] = ()
+    fallback: str = "tree"
+    timings: dict[str, dict[str, float]] = field(
+        default_factory=dict, compare=False, hash=False
+    )
+
+    def strategy_for(self, n: int) -> str:
+        """
+        Return the name of the strategy to use for n.
+
+        Args:
+            n: A validated non-negative integer.
+
+        Returns:
+            str: The strategy name.
+
+        Examples:
+            >>> TuningProfile(((64, "linear"),), "tree").strategy_for(100)
+            'tree'
+        """
+        index = bisect_left(self.ranges, n, key=lambda entry: entry[0])
+        if index < len(self.ranges):
+            return self.ranges[index][1]
+        return self.fallback
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return a JSON-serialisable representation of the profile.
+
+        Returns:
+            dict[str, Any]: Version, machine description, ranges,
+            fallback and timings.
+        """
+        return {
+            "version": PROFILE_VERSION,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "ranges": [list(entry) for entry in self.ranges],
+            "fallback": self.fallback,
+            "timings": self.timings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TuningProfile":
+        """
+        Build a profile from its dictionary representation.
+
+        Args:
+            data: A mapping as produced by to_dict().
+
+        Returns:
+            TuningProfile: The decoded profile.
+
+        Raises:
+            ValueError: If the mapping is malformed or of another version.
+        """
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(
+                f"Unsupported tuning profile version: {data.get('version')}"
+            )
+        ranges = tuple(
+            sorted((int(limit), str(name)) for limit, name in data["ranges"])
+        )
+        return cls(ranges, str(data["fallback"]), dict(data.get("timings", {})))
+
+
+DEFAULT_PROFILE = TuningProfile()
+
+
+def profile_path() -> Path:
+    """
+    Return the location of the tuning profile.
+
+    The FACTORIAL_TUNING_PROFILE environment variable takes precedence;
+    otherwise the profile lives in the user's configuration directory.
+
+    Returns:
+        Path: The profile file path.
+    """
+    override = os.environ.get(PROFILE_ENV_VAR)
+    if override:
+        return Path(override)
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / "factorial_calculator" / "tuning.json"
+
+
+def load_profile(path: Path | str | None = None) -> TuningProfile:
+    """
+    Load a tuning profile, falling back to the defaults.
+
+    A missing, unreadable or malformed file yields DEFAULT_PROFILE, so a
+    bad profile can never prevent the calculator from starting.
+
+    Args:
+        path: Profile file, or None for profile_path().
+
+    Returns:
+        TuningProfile: The loaded or default profile.
+    """
+    try:
+        with open(path or profile_path(), encoding="utf-8") as f:
+            return TuningProfile.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return DEFAULT_PROFILE
+
+
+def save_profile(profile: TuningProfile, path: Path | str | None = None) -> Path:
+    """
+    Write a tuning profile as JSON, creating parent directories.
+
+    Args:
+        profile: The profile to write.
+        path: Destination, or None for profile_path().
+
+    Returns:
+        Path: The file written.
+    """
+    target = Path(path) if path else profile_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(profile.to_dict(), indent=2) + "\n", encoding="utf-8")
+    return target
+
+
+def best_time(func: Callable[[int], object], n: int, repeat: int) -> float:
+    """
+    Return the best per-call time of func(n) in seconds.
+
+    Calls are batched so that each measurement lasts at least a few
+    milliseconds.
+
+    Args:
+        func: The function to time, such as a factorial strategy.
+        n: Its argument.
+        repeat: Number of measurements.
+
+    Returns:
+        float: The fastest measured time per call.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(n)
+        elapsed = time.perf_counter() - start
+        if elapsed >= 0.005 or number >= 1 << 16:
+            break
+        number *= 4
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(n)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def tune(
+    strategies: Mapping[str, Callable[[int], int]],
+    sizes: Sequence[int] = DEFAULT_TUNING_SIZES,
+    repeat: int = 3,
+    min_inputs: Mapping[str, int] | None = None,
+) -> TuningProfile:
+    """
+    Measure strategies on this machine and derive a profile.
+
+    Each size is assigned its fastest strategy; neighbouring sizes with
+    the same winner are merged and crossovers are placed at the
+    geometric mean of the two sizes around them. A strategy is only
+    measured from its minimum input on: below it, a strategy that just
+    delegates to another would otherwise win or lose on noise.
+
+    Args:
+        strategies: Strategy name -> function computing n!.
+        sizes: Input sizes to measure, in any order.
+        repeat: Measurements per size and strategy.
+        min_inputs: Strategy name -> smallest size it is measured at;
+                    strategies without an entry are measured at every size.
+
+    Returns:
+        TuningProfile: The measured profile.
+
+    Raises:
+        InvalidInputError: If no sizes are given or a size is negative.
+        VerificationError: If the strategies disagree on a result.
+    """
+    ordered = sorted(set(sizes))
+    if not ordered or ordered[0] < 0:
+        raise InvalidInputError("Tuning needs at least one non-negative size")
+    minimums = min_inputs or {}
+    timings: dict[str, dict[str, float]] = {}
+    winners: list[str] = []
+    for n in ordered:
+        candidates = {
+            name: func
+            for name, func in strategies.items()
+            if n >= minimums.get(name, 0)
+        }
+        if not candidates:
+            raise InvalidInputError(f"No strategy applies to size {n}")
+        results = {name: func(n) for name, func in candidates.items()}
+        if len(set(results.values())) > 1:
+            raise VerificationError(f"Strategies disagree on {n}!")
+        timings[str(n)] = {
+            name: best_time(func, n, repeat) for name, func in candidates.items()
+        }
+        winners.append(min(timings[str(n)], key=timings[str(n)].__getitem__))
+
+    ranges: list[tuple[int, str]] = []
+    for index in range(len(ordered) - 1):
+        if winners[index] != winners[index + 1]:
+            ranges.append(
+                (math.isqrt(ordered[index] * ordered[index + 1]), winners[index])
+            )
+    return TuningProfile(tuple(ranges), winners[-1], timings)
@@ -5,7 +5,40 @@ This module provides validation functionality to ensure input values
 are valid for factorial calculation.
 """
 
+from collections.abc import Iterable
+from typing import NamedTuple
+
 from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.policy import DEFAULT_POLICY, ResourcePolicy
+
+# struct format characters of integer buffers accepted by validate_many
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+
+# struct formats of memoryviews read as text, like the bytes they view
+_TEXT_FORMATS = frozenset({"B", "c"})
+
+
+class BulkValidationResult(NamedTuple):
+    """
+    Outcome of validating a batch of inputs.
+
+    Attributes:
+        values: Validated integers, with 0 in place of invalid items.
+        errors: One byte per item, 1 where the item is invalid.
+    """
+
+    values: list[int]
+    errors: bytearray
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of invalid items."""
+        return self.errors.count(1)
+
+    @property
+    def all_valid(self) -> bool:
+        """Return True if every item passed validation."""
+        return 1 not in self.errors
 
 
 class InputValidator:
@@ -16,16 +49,25 @@ class InputValidator:
     providing comprehensive checks for factorial calculation inputs.
     """
 
-    # Maximum safe value for factorial calculation to prevent overflow
-    MAX_FACTORIAL_INPUT = 10000
+    # Default maximum input, kept for callers that do not pass a policy
+    MAX_FACTORIAL_INPUT = DEFAULT_POLICY.max_input
 
     @staticmethod
-    def validate_number(value: int | str) -> int:
+    def _max_input(policy: ResourcePolicy | None) -> int:
+        """Return the input limit of policy, or the default limit."""
+        if policy is None:
+            return InputValidator.MAX_FACTORIAL_INPUT
+        return policy.max_input
+
+    @staticmethod
+    def validate_number(value: int | str, policy: ResourcePolicy | None = None) -> int:
         """
         Validate and convert input to a valid integer for factorial calculation.
 
         Args:
             value: The input value to validate (can be int or string).
+            policy: Resource policy providing the input limit, or None for
+                    MAX_FACTORIAL_INPUT.
 
         Returns:
             int: The validated integer value.
@@ -57,21 +99,22 @@ class InputValidator:
                 "Factorial is only defined for non-negative integers"
             )
 
-        if num > InputValidator.MAX_FACTORIAL_INPUT:
+        max_input = InputValidator._max_input(policy)
+        if num > max_input:
             raise InvalidInputError(
-                f"Invalid input: {num} exceeds maximum allowed value "
-                f"of {InputValidator.MAX_FACTORIAL_INPUT}"
+                f"Invalid input: {num} exceeds maximum allowed value of {max_input}"
             )
 
         return num
 
     @staticmethod
-    def is_valid_range(value: int) -> bool:
+    def is_valid_range(value: int, policy: ResourcePolicy | None = None) -> bool:
         """
         Check if a value is within valid range for factorial calculation.
 
         Args:
             value: The integer value to check.
+            policy: Resource policy providing the input limit, or None.
 
         Returns:
             bool: True if value is within valid range, False otherwise.
@@ -82,4 +125,103 @@ class InputValidator:
             >>> InputValidator.is_valid_range(-1)
             False
         """
-        return 0 <= value <= InputValidator.MAX_FACTORIAL_INPUT
+        return 0 <= value <= InputValidator._max_input(policy)
+
+    @staticmethod
+    def validate_many(
+        values: Iterable[object] | bytes | bytearray | memoryview,
+        policy: ResourcePolicy | None = None,
+    ) -> BulkValidationResult:
+        """
+        Validate a batch of inputs without raising per element.
+
+        Accepts any iterable of ints, strings or bytes lines, a bytes
+        blob (or memoryview of bytes) of newline-separated numbers, and
+        ``array``/buffer-protocol integer columns. Columns and lists made
+        only of ints are checked with a single min/max pass; other items
+        follow the same rules as validate_number, but failures are
+        recorded in the error mask instead of raising.
+
+        Args:
+            values: The batch of inputs to validate.
+            policy: Resource policy providing the input limit, or None.
+
+        Returns:
+            BulkValidationResult: Validated values and error mask.
+
+        Examples:
+            >>> InputValidator.validate_many(["5", 3, "x"]).values
+            [5, 3, 0]
+            >>> InputValidator.validate_many(["5", 3, "x"]).error_count
+            1
+        """
+        limit = InputValidator._max_input(policy)
+        if isinstance(values, memoryview) and values.format in _TEXT_FORMATS:
+            values = values.tobytes()
+        if isinstance(values, bytes | bytearray):
+            items: list = values.splitlines()
+        else:
+            column = InputValidator._integer_column(values)
+            if column is not None:
+                return InputValidator._validate_int_column(column, limit)
+            items = values if isinstance(values, list) else list(values)
+
+        if set(map(type, items)) <= {int}:
+            return InputValidator._validate_int_column(items, limit)
+
+        out: list[int] = []
+        errors = bytearray(len(items))
+        for index, value in enumerate(items):
+            try:
+                num = int(value)
+            except (TypeError, ValueError, OverflowError):
+                num = -1
+            if 0 <= num <= limit:
+                out.append(num)
+            else:
+                out.append(0)
+                errors[index] = 1
+        return BulkValidationResult(out, errors)
+
+    @staticmethod
+    def _integer_column(values: object) -> list[int] | None:
+        """
+        Extract an integer buffer (e.g. ``array('q')``) as a list.
+
+        Args:
+            values: Object that may support the buffer protocol.
+
+        Returns:
+            list[int] | None: The column values, or None if values is not
+            a one-dimensional integer buffer.
+        """
+        try:
+            view = memoryview(values)  # type: ignore[arg-type]
+        except TypeError:
+            return None
+        with view:
+            if view.ndim != 1 or view.format.lstrip("@=<>!")[-1:] not in (
+                _INTEGER_FORMATS
+            ):
+                return None
+            return view.tolist()
+
+    @staticmethod
+    def _validate_int_column(column: list[int], limit: int) -> BulkValidationResult:
+        """
+        Validate a list made only of ints with a min/max fast path.
+
+        Args:
+            column: List of Python ints.
+            limit: Largest accepted value.
+
+        Returns:
+            BulkValidationResult: Validated values, never the caller's
+            list itself, and error mask.
+        """
+        if not column or (min(column) >= 0 and max(column) <= limit):
+            return BulkValidationResult(list(column), bytearray(len(column)))
+
+        errors = bytearray(not 0 <= value <= limit for value in column)
+        out = [0 if bad else value for value, bad in zip(column, errors, strict=True)]
+        return BulkValidationResult(out, errors)
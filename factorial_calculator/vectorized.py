@@ -0,0 +1,206 @@
+"""
+NumPy-vectorised log-factorial kernels.
+
+This optional module evaluates log(n!) and derived log-ratios over whole
+arrays without Python-level iteration. Inputs up to a configurable
+limit are served from a precomputed cumulative log table; larger inputs
+use the Stirling series. NumPy is only needed when these functions are
+called: without it they raise BackendUnavailableError.
+"""
+
+import math
+from types import ModuleType
+from typing import Any
+
+from factorial_calculator.exceptions import BackendUnavailableError, InvalidInputError
+
+np: ModuleType | None
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Largest n served from the cumulative log table by default
+DEFAULT_TABLE_LIMIT = 65536
+
+_tables: dict[int, Any] = {}
+
+
+def is_numpy_available() -> bool:
+    """
+    Check whether the vectorised kernels can be used.
+
+    Returns:
+        bool: True if NumPy is importable.
+    """
+    return np is not None
+
+
+def _numpy() -> ModuleType:
+    """
+    Return the NumPy module.
+
+    Raises:
+        BackendUnavailableError: If NumPy is not installed.
+    """
+    if np is None:
+        raise BackendUnavailableError("The vectorised kernels require NumPy")
+    return np
+
+
+def _log_table(limit: int) -> Any:
+    """
+    Return log(n!) for n in 0..limit, building and caching it once.
+
+    Args:
+        limit: Largest n in the table.
+
+    Returns:
+        numpy.ndarray: float64 array of length limit + 1.
+    """
+    table = _tables.get(limit)
+    if table is None:
+        numpy = _numpy()
+        table = numpy.empty(limit + 1, dtype=numpy.float64)
+        table[0] = 0.0
+        numpy.cumsum(
+            numpy.log(numpy.arange(1, limit + 1, dtype=numpy.float64)), out=table[1:]
+        )
+        _tables[limit] = table
+    return table
+
+
+def _as_counts(values: Any) -> Any:
+    """
+    Convert array-like input to a non-negative int64 array.
+
+    Args:
+        values: Array-like of non-negative integers.
+
+    Returns:
+        numpy.ndarray: The validated int64 array.
+
+    Raises:
+        InvalidInputError: If values are negative or not integral.
+    """
+    numpy = _numpy()
+    array = numpy.asarray(values)
+    if array.dtype.kind == "f":
+        if not numpy.all(numpy.isfinite(array) & (array == numpy.floor(array))):
+            raise InvalidInputError("Invalid input: values must be integers")
+    elif array.dtype.kind not in "iub":
+        raise InvalidInputError("Invalid input: values must be integers")
+    array = array.astype(numpy.int64, copy=False)
+    if array.size and array.min() < 0:
+        raise InvalidInputError(
+            "Invalid input: negative values. "
+            "Factorial is only defined for non-negative integers"
+        )
+    return array
+
+
+def _stirling(n: Any) -> Any:
+    """
+    Evaluate the Stirling series for log(n!) with n >= 1.
+
+    Args:
+        n: float64 array of inputs.
+
+    Returns:
+        numpy.ndarray: Approximations accurate to double precision for
+        the table limits used here.
+    """
+    numpy = _numpy()
+    inv = 1.0 / n
+    inv2 = inv * inv
+    series = inv * (1 / 12 - inv2 * (1 / 360 - inv2 * (1 / 1260 - inv2 / 1680)))
+    return n * numpy.log(n) - n + 0.5 * numpy.log(2 * math.pi * n) + series
+
+
+def log_factorial(values: Any, table_limit: int = DEFAULT_TABLE_LIMIT) -> Any:
+    """
+    Compute log(n!) element-wise.
+
+    Args:
+        values: Array-like of non-negative integers.
+        table_limit: Largest n served from the precomputed table; larger
+                     inputs use the Stirling series.
+
+    Returns:
+        numpy.ndarray: float64 array of natural logarithms, with the
+        shape of values.
+
+    Raises:
+        InvalidInputError: If values are negative or not integral.
+        BackendUnavailableError: If NumPy is not installed.
+
+    Examples:
+        >>> float(log_factorial([5])[0]) == math.log(120)
+        True
+    """
+    numpy = _numpy()
+    n = _as_counts(values)
+    table = _log_table(table_limit)
+    small = n <= table_limit
+    result = numpy.empty(n.shape, dtype=numpy.float64)
+    result[small] = table[n[small]]
+    large = ~small
+    if large.any():
+        result[large] = _stirling(n[large].astype(numpy.float64))
+    return result
+
+
+def log_factorial_ratio(
+    numerators: Any, denominators: Any, table_limit: int = DEFAULT_TABLE_LIMIT
+) -> Any:
+    """
+    Compute log(a! / b!) element-wise with broadcasting.
+
+    Args:
+        numerators: Array-like of non-negative integers a.
+        denominators: Array-like of non-negative integers b.
+        table_limit: Largest n served from the precomputed table.
+
+    Returns:
+        numpy.ndarray: float64 array of log(a!) - log(b!).
+
+    Raises:
+        InvalidInputError: If inputs are negative or not integral.
+        BackendUnavailableError: If NumPy is not installed.
+    """
+    return log_factorial(numerators, table_limit) - log_factorial(
+        denominators, table_limit
+    )
+
+
+def log_binomial(n: Any, k: Any, table_limit: int = DEFAULT_TABLE_LIMIT) -> Any:
+    """
+    Compute log C(n, k) element-wise with broadcasting.
+
+    Args:
+        n: Array-like of non-negative integers.
+        k: Array-like of non-negative integers.
+        table_limit: Largest n served from the precomputed table.
+
+    Returns:
+        numpy.ndarray: float64 array of log C(n, k), with -inf where
+        k > n.
+
+    Raises:
+        InvalidInputError: If inputs are negative or not integral.
+        BackendUnavailableError: If NumPy is not installed.
+
+    Examples:
+        >>> round(float(log_binomial(5, 2)), 12) == round(math.log(10), 12)
+        True
+    """
+    numpy = _numpy()
+    n, k = numpy.broadcast_arrays(_as_counts(n), _as_counts(k))
+    valid = k <= n
+    rest = numpy.where(valid, n - k, 0)
+    result = (
+        log_factorial(n, table_limit)
+        - log_factorial(k, table_limit)
+        - log_factorial(rest, table_limit)
+    )
+    return numpy.where(valid, result, -numpy.inf)
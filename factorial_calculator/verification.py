@@ -0,0 +1,68 @@
+"""
+Residue-based verification of computed factorials.
+
+A result is checked by reducing it modulo a few word-sized primes and
+comparing against n! mod p computed independently with small integers.
+The check costs O(n) word operations plus one reduction of the result
+per prime, which is negligible next to computing n! itself.
+"""
+
+import math
+from collections.abc import Sequence
+
+from factorial_calculator.exceptions import VerificationError
+
+# Primes larger than any supported n, so that n! mod p is never trivially 0
+VERIFICATION_PRIMES: tuple[int, ...] = (2**61 - 1, 2**62 - 57, 2**62 - 87)
+
+# Consecutive factors multiplied together before each modular reduction
+_BATCH = 64
+
+
+def factorial_residues(
+    n: int, moduli: Sequence[int] = VERIFICATION_PRIMES
+) -> list[int]:
+    """
+    Compute n! modulo each of the given moduli.
+
+    Factors are multiplied in small batches and reduced once per batch,
+    so intermediate values stay a few machine words long.
+
+    Args:
+        n: A non-negative integer.
+        moduli: Moduli to reduce by.
+
+    Returns:
+        list[int]: n! mod m for each modulus m, in order.
+
+    Examples:
+        >>> factorial_residues(5, (7, 1000))
+        [1, 120]
+    """
+    residues = [1 % m for m in moduli]
+    for start in range(2, n + 1, _BATCH):
+        batch = math.prod(range(start, min(start + _BATCH, n + 1)))
+        residues = [r * batch % m for r, m in zip(residues, moduli, strict=True)]
+    return residues
+
+
+def verify_factorial(
+    n: int, value: int, moduli: Sequence[int] = VERIFICATION_PRIMES
+) -> None:
+    """
+    Check that value is n! by comparing residues.
+
+    Args:
+        n: The factorial input.
+        value: The computed result to check.
+        moduli: Moduli to compare residues for.
+
+    Raises:
+        VerificationError: If any residue differs.
+    """
+    expected = factorial_residues(n, moduli)
+    for modulus, residue in zip(moduli, expected, strict=True):
+        if value % modulus != residue:
+            raise VerificationError(
+                f"Result for {n}! failed verification modulo {modulus}"
+            )
@@ -26,6 +26,6 @@ def calculator_with_cache() -> FactorialCalculator:
     """
     calc = FactorialCalculator()
     # Pre-populate cache
-    calc.calculate(5)
-    calc.calculate(10)
+    calc.calculate(200)
+    calc.calculate(250)
     return calc
@@ -0,0 +1,93 @@
+"""Unit tests for the arithmetic backends module."""
+
+import math
+
+import pytest
+
+from factorial_calculator import backends
+from factorial_calculator.backends import (
+    GMPBackend,
+    PythonBackend,
+    get_backend,
+    is_gmpy2_available,
+)
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import BackendUnavailableError, InvalidInputError
+
+
+class TestPythonBackend:
+    """Test suite for PythonBackend class."""
+
+    def test_factorial(self) -> None:
+        """Test factorial matches math.factorial."""
+        backend = PythonBackend()
+        for n in (0, 1, 5, 20, 300):
+            assert backend.factorial(n) == math.factorial(n)
+
+    def test_multiply(self) -> None:
+        """Test multiplication of big integers."""
+        assert PythonBackend().multiply(10**30, 7) == 7 * 10**30
+
+    @pytest.mark.parametrize(
+        "base,expected", [(10, "255"), (16, "ff"), (2, "11111111"), (36, "73")]
+    )
+    def test_to_string(self, base: int, expected: str) -> None:
+        """Test radix conversion in several bases."""
+        assert PythonBackend().to_string(255, base) == expected
+
+    def test_to_string_zero_and_negative(self) -> None:
+        """Test radix conversion of zero and negative values."""
+        backend = PythonBackend()
+        assert backend.to_string(0, 7) == "0"
+        assert backend.to_string(-10, 3) == "-101"
+
+    def test_to_string_invalid_base(self) -> None:
+        """Test that unsupported bases raise InvalidInputError."""
+        with pytest.raises(InvalidInputError, match="base"):
+            PythonBackend().to_string(10, 1)
+
+
+class TestBackendSelection:
+    """Test suite for backend selection helpers."""
+
+    def test_get_backend_python(self) -> None:
+        """Test explicit selection of the Python backend."""
+        assert isinstance(get_backend("python"), PythonBackend)
+
+    def test_get_backend_unknown(self) -> None:
+        """Test that unknown backends raise BackendUnavailableError."""
+        with pytest.raises(BackendUnavailableError, match="Unknown"):
+            get_backend("fortran")
+
+    def test_auto_falls_back_without_gmpy2(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test automatic fallback to pure Python when gmpy2 is missing."""
+        monkeypatch.setattr(backends, "gmpy2", None)
+        assert isinstance(get_backend(), PythonBackend)
+        with pytest.raises(BackendUnavailableError):
+            GMPBackend()
+
+    def test_calculator_accepts_backend_name(self) -> None:
+        """Test that the calculator resolves backend names."""
+        calc = FactorialCalculator(backend="python")
+        assert calc.backend.name == "python"
+        assert calc.calculate(10) == 3628800
+
+
+@pytest.mark.skipif(not is_gmpy2_available(), reason="gmpy2 not installed")
+class TestGMPBackend:
+    """Test suite for GMPBackend class."""
+
+    def test_results_are_plain_ints(self) -> None:
+        """Test that GMP results are converted back to int."""
+        backend = GMPBackend()
+        assert type(backend.factorial(50)) is int
+        assert type(backend.multiply(3, 4)) is int
+
+    def test_matches_python_backend(self) -> None:
+        """Test GMP and Python backends agree."""
+        gmp, python = GMPBackend(), PythonBackend()
+        value = python.factorial(500)
+        assert gmp.factorial(500) == value
+        assert gmp.to_string(value, 16) == python.to_string(value, 16)
@@ -0,0 +1,139 @@
+"""Unit tests for the factorial cache module."""
+
+import math
+import sys
+
+import pytest
+
+from factorial_calculator.cache import BASE_CASES, FactorialCache
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import InvalidInputError
+
+
+class TestFactorialCache:
+    """Test suite for FactorialCache class."""
+
+    def test_starts_with_base_cases(self) -> None:
+        """Test that a new cache holds 0! and 1!."""
+        cache = FactorialCache()
+        assert len(cache) == len(BASE_CASES)
+        assert cache[0] == 1
+        assert cache[1] == 1
+
+    def test_store_and_get(self) -> None:
+        """Test storing and retrieving a value."""
+        cache = FactorialCache()
+        cache.store(10, math.factorial(10))
+        assert 10 in cache
+        assert cache.get(10) == 3628800
+        assert cache.get(11) is None
+
+    def test_nbytes_tracking(self) -> None:
+        """Test that stored values are accounted in nbytes."""
+        cache = FactorialCache()
+        value = math.factorial(100)
+        cache.store(100, value)
+        assert cache.nbytes == sys.getsizeof(value)
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        values = {n: math.factorial(n) for n in (50, 51, 52)}
+        budget = sum(sys.getsizeof(v) for v in values.values()) - 1
+        cache = FactorialCache(max_bytes=budget)
+        cache.store(50, values[50])
+        cache.store(51, values[51])
+        cache[50]
+        cache.store(52, values[52])
+        assert 50 in cache
+        assert 51 not in cache
+        assert 0 in cache and 1 in cache
+
+    def test_oversized_value_not_cached(self) -> None:
+        """Test that values larger than the budget are skipped."""
+        cache = FactorialCache(max_bytes=16)
+        cache.store(100, math.factorial(100))
+        assert 100 not in cache
+
+    def test_clear(self) -> None:
+        """Test that clear resets to the base cases."""
+        cache = FactorialCache()
+        cache.store(5, 120)
+        cache.clear()
+        assert len(cache) == len(BASE_CASES)
+        assert cache.nbytes == 0
+
+
+class TestColdTier:
+    """Test suite for the compressed cold tier."""
+
+    @staticmethod
+    def _filled_cache(compression: str | None) -> FactorialCache:
+        """Build a cache whose hot tier holds only a few large entries."""
+        cache = FactorialCache(max_hot_bytes=8000, compression=compression)
+        for n in range(500, 3001, 250):
+            cache.store(n, math.factorial(n))
+        return cache
+
+    @pytest.mark.parametrize("compression", ["zlib", "lzma", None])
+    def test_demotion_and_promotion(self, compression: str | None) -> None:
+        """Test that cold entries round-trip exactly."""
+        cache = self._filled_cache(compression)
+        stats = cache.stats()
+        assert stats["cold_entries"] > 0
+        assert stats["hot_bytes"] <= 8000
+        assert cache[500] == math.factorial(500)
+        assert cache.stats()["promotions"] == 1
+
+    def test_compression_ratio(self) -> None:
+        """Test that zlib shrinks blobs of factorials."""
+        stats = self._filled_cache("zlib").stats()
+        assert stats["compression_ratio"] > 1.0
+        assert stats["cold_bytes"] > 0
+
+    def test_cold_tier_drops_trailing_zero_bits(self) -> None:
+        """Test that uncompressed blobs hold only the odd part."""
+        stats = self._filled_cache(None).stats()
+        assert stats["cold_entries"] > 0
+        assert stats["compression_ratio"] > 1.0
+
+    def test_len_and_contains_cover_both_tiers(self) -> None:
+        """Test mapping behaviour across tiers."""
+        cache = self._filled_cache("zlib")
+        assert len(cache) == len(BASE_CASES) + 11
+        assert all(n in cache for n in range(500, 3001, 250))
+        assert set(cache) >= {0, 1, 500, 3000}
+
+    def test_total_budget_evicts_cold_first(self) -> None:
+        """Test that max_bytes drops the oldest cold entries first."""
+        cache = FactorialCache(max_bytes=20000, max_hot_bytes=8000)
+        for n in range(500, 3001, 250):
+            cache.store(n, math.factorial(n))
+        assert cache.nbytes <= 20000
+        assert 500 not in cache
+        assert 3000 in cache
+
+    def test_pinned_entries_stay_hot(self) -> None:
+        """Test that base cases and negative values end demotion and eviction."""
+        cache = FactorialCache(max_bytes=64, max_hot_bytes=0)
+        cache.store(("stirling1", 5, 2), -50)
+        cache.store(7, 5040)
+        assert cache.stats()["hot_entries"] == len(BASE_CASES) + 1
+        assert cache.get(("stirling1", 5, 2)) == -50
+        assert cache.get(7) == 5040
+        assert cache.nbytes > 0
+
+    def test_unknown_compression(self) -> None:
+        """Test that unknown codecs raise InvalidInputError."""
+        with pytest.raises(InvalidInputError, match="compression"):
+            FactorialCache(compression="brotli")
+
+    def test_calculator_reports_tier_stats(self) -> None:
+        """Test that calculator statistics include tier sizes."""
+        cache = FactorialCache(max_hot_bytes=2000)
+        calc = FactorialCalculator(cache=cache)
+        for n in (1000, 2000):
+            calc.calculate(n)
+        stats = calc.get_stats()
+        assert stats["cold_entries"] >= 1
+        assert "compression_ratio" in stats
+        assert calc.calculate(1000) == math.factorial(1000)
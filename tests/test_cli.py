@@ -1,10 +1,23 @@
 """Unit tests for the CLI module."""
 
+import _thread
+import math
+import threading
+import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from factorial_calculator.cli import CLI
+from factorial_calculator.policy import CancellationToken
+from factorial_calculator.simulator import CostModel
+from factorial_calculator.tuning import (
+    PROFILE_ENV_VAR,
+    TuningProfile,
+    load_profile,
+    save_profile,
+)
 
 
 class TestCLI:
@@ -147,6 +160,24 @@ class TestCLI:
         assert "120" in captured.out
         assert "factorial" in captured.out.lower() or "5" in captured.out
 
+    def test_output_through_native_backend(
+        self, capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a backend with native radix conversion prints results."""
+        cli = CLI()
+        backend = cli.calculator.backend
+        calls: list[int] = []
+
+        def to_string(value: int, base: int = 10) -> str:
+            calls.append(value)
+            return str(value)
+
+        monkeypatch.setattr(backend, "native_to_string", True)
+        monkeypatch.setattr(backend, "to_string", to_string)
+        assert cli.run(["6"]) == 0
+        assert calls == [720]
+        assert "720" in capsys.readouterr().out
+
     def test_output_format_range_mode(self, capsys: pytest.CaptureFixture) -> None:
         """Test output format in range mode."""
         cli = CLI()
@@ -156,6 +187,12 @@ class TestCLI:
         assert "24" in captured.out  # 4!
         assert "120" in captured.out  # 5!
 
+    def test_range_mode_large_factorials(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that lines printed from decimal limbs match the factorials."""
+        assert CLI().run(["--range", "1300", "1310"]) == 0
+        lines = capsys.readouterr().out.splitlines()[1:]
+        assert lines == [f"  {n}! = {math.factorial(n)}" for n in range(1300, 1311)]
+
     def test_error_output_to_stderr(self, capsys: pytest.CaptureFixture) -> None:
         """Test that errors are output to stderr."""
         cli = CLI()
@@ -181,3 +218,208 @@ class TestCLIMain:
 
         main()
         mock_exit.assert_called_once()
+
+
+class TestCLIPolicyOptions:
+    """Test suite for resource limit options."""
+
+    def test_max_input_option(self) -> None:
+        """Test that --max-input lowers the accepted input."""
+        cli = CLI()
+        assert cli.run(["--max-input", "5", "6"]) == 1
+        assert cli.calculator.policy.max_input == 5
+
+    def test_time_limit_option(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that --time-limit aborts slow calculations with an error."""
+        cli = CLI()
+        assert cli.run(["--time-limit", "0", "5000"]) == 1
+        assert "time limit" in capsys.readouterr().err
+
+    def test_verify_option(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that --verify enables residue checking."""
+        cli = CLI()
+        assert cli.run(["--verify", "300"]) == 0
+        assert cli.calculator._verify
+        assert "The factorial of 300 is:" in capsys.readouterr().out
+
+    def test_options_keep_tuning_profile(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a calculator built for limits uses the saved profile."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, str(tmp_path / "tuning.json"))
+        save_profile(TuningProfile(((500, "linear"),), "factorised"))
+        cli = CLI()
+        assert cli.run(["--max-input", "2000", "1000"]) == 0
+        assert cli.calculator._tuning.strategy_for(1000) == "factorised"
+
+
+class TestCLIParallelRange:
+    """Test suite for --parallel range mode."""
+
+    def test_parallel_range_output(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that parallel output matches sequential output."""
+        assert CLI().run(["-r", "25", "5"]) == 0
+        sequential = capsys.readouterr().out
+        assert CLI().run(["-r", "25", "5", "--parallel", "--workers", "2"]) == 0
+        assert capsys.readouterr().out == sequential
+
+    def test_parallel_range_invalid(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that invalid bounds are reported as errors."""
+        assert CLI().run(["-r", "-3", "5", "--parallel"]) == 1
+        assert "Error:" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("option", [["--parallel"], ["--workers", "2"]])
+    def test_parallel_other_kind_rejected(
+        self, option: list[str], capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that parallel options are not silently dropped for other kinds."""
+        args = ["-r", "1", "5", "--kind", "double", *option]
+        assert CLI().run(args) == 1
+        assert "only apply to factorial ranges" in capsys.readouterr().err
+
+    def test_workers_without_parallel_rejected(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that --workers is not ignored on a sequential range."""
+        assert CLI().run(["-r", "1", "5", "--workers", "2"]) == 1
+        assert "--workers requires --parallel" in capsys.readouterr().err
+
+
+class TestCLIKinds:
+    """Test suite for the --kind option."""
+
+    def test_double_factorial(self, capsys: pytest.CaptureFixture) -> None:
+        """Test a large double factorial, beyond str()'s digit limit."""
+        cli = CLI()
+        assert cli.run(["--kind", "double", "5001"]) == 0
+        output = capsys.readouterr().out
+        assert "5001!!" in output
+        assert len(output) > 8000
+
+    def test_multifactorial_order(self, capsys: pytest.CaptureFixture) -> None:
+        """Test --order as the multifactorial step."""
+        cli = CLI()
+        assert cli.run(["-k", "multi", "--order", "3", "10"]) == 0
+        assert "10!(3) is: 280" in capsys.readouterr().out
+
+    def test_kind_range_mode(self, capsys: pytest.CaptureFixture) -> None:
+        """Test range mode with a non-factorial kind."""
+        cli = CLI()
+        assert cli.run(["-k", "subfactorial", "-r", "4", "2"]) == 0
+        output = capsys.readouterr().out
+        assert "!2 = 1" in output
+        assert "!4 = 9" in output
+
+    def test_kind_invalid_order(self) -> None:
+        """Test that an invalid --order is reported as an error."""
+        cli = CLI()
+        assert cli.run(["-k", "rising", "--order", "x", "5"]) == 1
+
+    def test_large_factorial_output(self, capsys: pytest.CaptureFixture) -> None:
+        """Test printing a factorial with more than 4300 digits."""
+        cli = CLI()
+        assert cli.run(["2000"]) == 0
+        assert capsys.readouterr().out.rstrip().endswith("0" * 40)
+
+
+class TestCLIInteractiveSession:
+    """Test suite for background calculations and history in interactive mode."""
+
+    @patch("builtins.input", side_effect=["5", "6", "!1", "history", "quit"])
+    def test_history_reference(
+        self, mock_input: object, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that !N reuses an earlier result without recomputing."""
+        cli = CLI()
+        cli.calculator.clear_cache()
+        assert cli.run(["--interactive"]) == 0
+        output = capsys.readouterr().out
+        assert "Result [1]: 5! = 120" in output
+        assert "Result [2]: 6! = 720" in output
+        assert output.count("Result [1]: 5! = 120") == 2
+        assert "!2: 6! (3 digits)" in output
+
+    @patch("builtins.input", side_effect=["!3", "quit"])
+    def test_unknown_history_reference(
+        self, mock_input: object, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that a reference to a missing result is an error."""
+        assert CLI().run(["--interactive"]) == 0
+        assert "No result !3" in capsys.readouterr().err
+
+    def test_ctrl_c_cancels_only_calculation(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that Ctrl-C cancels the running job and keeps the session."""
+        cli = CLI()
+
+        def slow_calculate(n: str, token: CancellationToken) -> int:
+            token.report_progress(0.25)
+            while True:
+                token.check()
+                time.sleep(0.01)
+
+        threading.Timer(0.8, _thread.interrupt_main).start()
+        with (
+            patch.object(cli.calculator, "calculate", side_effect=slow_calculate),
+            patch("builtins.input", side_effect=["9999", "quit"]),
+        ):
+            assert cli.run(["--interactive"]) == 0
+        captured = capsys.readouterr()
+        assert "Calculation cancelled." in captured.out
+        assert "Goodbye!" in captured.out
+        assert "25.0% done" in captured.err
+
+
+class TestCLITune:
+    """Test suite for the tune subcommand."""
+
+    def test_tune_writes_profile(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that tune measures strategies and saves a profile."""
+        path = tmp_path / "tuning.json"
+        args = ["tune", "--sizes", "16", "256", "--repeat", "1", "-o", str(path)]
+        assert CLI().run(args) == 0
+        assert "Tuning profile written to" in capsys.readouterr().out
+        profile = load_profile(path)
+        assert set(profile.timings) == {"16", "256"}
+
+
+class TestCLILoad:
+    """Test suite for the load subcommand."""
+
+    def test_synthetic_load(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a synthetic replay that also saves its trace."""
+        trace = tmp_path / "trace.jsonl"
+        args = ["load", "--count", "50", "--seed", "1", "--write-trace", str(trace)]
+        assert CLI().run(args) == 0
+        assert "Throughput:" in capsys.readouterr().out
+        assert CLI().run(["load", str(trace), "--mode", "asyncio"]) == 0
+
+    def test_missing_trace(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that an unreadable trace is an error."""
+        assert CLI().run(["load", "/nonexistent/trace.jsonl"]) == 1
+        assert "Error:" in capsys.readouterr().err
+
+
+class TestCLISimulate:
+    """Test suite for the simulate subcommand."""
+
+    def test_synthetic_simulation(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that every default policy is reported."""
+        model = CostModel(((64, 1e-7), (1024, 2e-6)))
+        args = ["simulate", "--count", "200", "--seed", "1", "--entries", "8"]
+        with patch.object(CostModel, "measure", return_value=model):
+            assert CLI().run(args) == 0
+        out = capsys.readouterr().out
+        assert "Requests: 200" in out
+        for name in ("unbounded", "lru(8)", "lfu(8)", "bytes(", "checkpoint(100)"):
+            assert name in out
+
+    def test_invalid_interval(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that a non-positive checkpoint interval is an error."""
+        assert CLI().run(["simulate", "--count", "5", "--interval", "0"]) == 1
+        assert "Error:" in capsys.readouterr().err
@@ -0,0 +1,86 @@
+"""Unit tests for the combinatorics module."""
+
+import math
+
+import pytest
+
+from factorial_calculator.combinatorics import (
+    binomial,
+    legendre_exponent,
+    multinomial,
+    permutations,
+)
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import InvalidInputError, OverflowError
+from factorial_calculator.policy import ResourcePolicy
+
+
+class TestLegendreExponent:
+    """Test suite for Legendre's formula."""
+
+    @pytest.mark.parametrize("n,p", [(10, 2), (100, 5), (1000, 3), (7, 11)])
+    def test_legendre_exponent(self, n: int, p: int) -> None:
+        """Test Legendre's formula against direct factorisation."""
+        value, exponent = math.factorial(n), 0
+        while value % p == 0:
+            value //= p
+            exponent += 1
+        assert legendre_exponent(n, p) == exponent
+
+
+class TestCombinatorics:
+    """Test suite for binomial, permutations and multinomial."""
+
+    def test_binomial_matches_math_comb(self, calculator: FactorialCalculator) -> None:
+        """Test binomial coefficients against math.comb."""
+        for n in range(40):
+            for k in range(n + 2):
+                assert binomial(n, k, calculator) == math.comb(n, k)
+
+    def test_binomial_large(self, calculator: FactorialCalculator) -> None:
+        """Test a large central binomial coefficient."""
+        assert binomial(10000, 5000, calculator) == math.comb(10000, 5000)
+
+    def test_permutations_matches_math_perm(
+        self, calculator: FactorialCalculator
+    ) -> None:
+        """Test permutations against math.perm."""
+        for n in range(30):
+            for k in range(n + 2):
+                assert permutations(n, k, calculator) == math.perm(n, k)
+
+    def test_multinomial(self, calculator: FactorialCalculator) -> None:
+        """Test multinomial coefficients against factorial quotients."""
+        counts = [3, 0, 5, 1, 7]
+        expected = math.factorial(16)
+        for k in counts:
+            expected //= math.factorial(k)
+        assert multinomial(counts, calculator) == expected
+        assert multinomial([], calculator) == 1
+
+    def test_string_inputs(self, calculator: FactorialCalculator) -> None:
+        """Test that string inputs are validated like calculate."""
+        assert binomial("6", " 3 ", calculator) == 20
+
+    def test_invalid_inputs(self, calculator: FactorialCalculator) -> None:
+        """Test that invalid inputs raise InvalidInputError."""
+        with pytest.raises(InvalidInputError):
+            binomial(-1, 2, calculator)
+        with pytest.raises(InvalidInputError, match="exceeds maximum"):
+            multinomial([6000, 6000], calculator)
+
+    def test_results_are_cached(self, calculator: FactorialCalculator) -> None:
+        """Test that results share the calculator cache and statistics."""
+        binomial(100, 30, calculator)
+        binomial(100, 70, calculator)
+        stats = calculator.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert ("binomial", 100, 30) in calculator._cache
+
+    def test_result_bits_policy(self) -> None:
+        """Test that max_result_bits applies to combinatorics."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_result_bits=100))
+        assert permutations(30, 5, calc) == math.perm(30, 5)
+        with pytest.raises(OverflowError):
+            binomial(1000, 500, calc)
@@ -1,9 +1,37 @@
 """Unit tests for the core factorial calculator module."""
 
+import math
+
 import pytest
 
-from factorial_calculator.core import FactorialCalculator, FactorialCalculatorFactory
-from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.core import (
+    FACTORIAL_STRATEGIES,
+    MAX_FLOAT_FACTORIAL_INPUT,
+    MAX_UINT64_FACTORIAL_INPUT,
+    SMALL_FACTORIAL_LIMIT,
+    SMALL_FACTORIALS,
+    WORD_BITS,
+    FactorialCalculator,
+    FactorialCalculatorFactory,
+    available_strategies,
+    decimal_sweep,
+    factorial_sweep,
+    factorial_two_exponent,
+    odd_factorial,
+    parallel_decimal_range,
+    parallel_factorial,
+    parallel_range,
+    product_tree,
+    range_product,
+    word_products,
+)
+from factorial_calculator.exceptions import (
+    ComputationCancelledError,
+    InvalidInputError,
+    OverflowError,
+)
+from factorial_calculator.policy import CancellationToken, ResourcePolicy
+from factorial_calculator.tuning import TuningProfile
 
 
 class TestFactorialCalculator:
@@ -59,20 +87,20 @@ class TestFactorialCalculator:
     def test_caching_mechanism(self, calculator: FactorialCalculator) -> None:
         """Test that caching works correctly."""
         # Calculate factorial
-        result1 = calculator.calculate(10)
+        result1 = calculator.calculate(200)
 
         # Check cache
-        assert 10 in calculator._cache
-        assert calculator._cache[10] == result1
+        assert 200 in calculator._cache
+        assert calculator._cache[200] == result1
 
         # Calculate again and verify it uses cache
-        result2 = calculator.calculate(10)
+        result2 = calculator.calculate(200)
         assert result1 == result2
 
     def test_cache_population(self, calculator: FactorialCalculator) -> None:
         """Test that cache is populated correctly."""
         initial_size = calculator.get_cache_size()
-        calculator.calculate(5)
+        calculator.calculate(200)
         assert calculator.get_cache_size() > initial_size
 
     def test_clear_cache(self, calculator_with_cache: FactorialCalculator) -> None:
@@ -86,8 +114,8 @@ class TestFactorialCalculator:
     def test_get_cache_size(self, calculator: FactorialCalculator) -> None:
         """Test cache size retrieval."""
         initial_size = calculator.get_cache_size()
-        calculator.calculate(5)
-        calculator.calculate(10)
+        calculator.calculate(200)
+        calculator.calculate(250)
         assert calculator.get_cache_size() > initial_size
 
     def test_calculate_range_ascending(self, calculator: FactorialCalculator) -> None:
@@ -182,3 +210,267 @@ class TestFactorialCalculatorFactory:
         calc = FactorialCalculatorFactory.get_calculator(use_singleton=False)
         result = calc.calculate(5)
         assert result == 120
+
+
+class TestCalculatorStats:
+    """Test suite for FactorialCalculator statistics."""
+
+    def test_initial_stats(self, calculator: FactorialCalculator) -> None:
+        """Test statistics of a fresh calculator."""
+        stats = calculator.get_stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
+        assert stats["hit_ratio"] == 0.0
+        assert stats["cache_size"] == 2
+
+    def test_hits_and_misses(self, calculator: FactorialCalculator) -> None:
+        """Test that repeated calculations count as cache hits."""
+        calculator.calculate(200)
+        calculator.calculate(200)
+        calculator.calculate(0)
+        stats = calculator.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
+class TestRangeProduct:
+    """Test suite for the shared range-product engine."""
+
+    @pytest.mark.parametrize(
+        "low,high,step", [(2, 1, 1), (1, 1, 1), (2, 10, 1), (1, 999, 2), (7, 5000, 3)]
+    )
+    def test_matches_math_prod(self, low: int, high: int, step: int) -> None:
+        """Test range_product against math.prod."""
+        assert range_product(low, high, step) == math.prod(range(low, high + 1, step))
+
+    @pytest.mark.parametrize("n", [*range(0, 70), 255, 256, 257, 4097])
+    def test_odd_factorial(self, n: int) -> None:
+        """Test that n! is its odd part shifted by the exponent of 2."""
+        odd = odd_factorial(n)
+        assert odd & 1
+        assert odd << factorial_two_exponent(n) == math.factorial(n)
+
+    def test_product_tree(self) -> None:
+        """Test the balanced product of a sequence."""
+        assert product_tree([]) == 1
+        assert product_tree([7]) == 7
+        assert product_tree(range(1, 301)) == math.factorial(300)
+
+    @pytest.mark.parametrize(
+        "low,high,step",
+        [(2, 1, 1), (0, 0, 1), (5, 5, 1), (2, 100, 1), (1, 999, 2), (7, 5000, 3)]
+        + [(2**30 - 5, 2**30 + 5, 1), (2**40, 2**40 + 9, 3)],
+    )
+    def test_word_products(self, low: int, high: int, step: int) -> None:
+        """Test that packed words multiply to the range and fit a word."""
+        words = list(word_products(low, high, step))
+        assert math.prod(words) == math.prod(range(low, high + 1, step))
+        if high < 1 << (WORD_BITS // 2):
+            assert all(word < 1 << WORD_BITS for word in words)
+
+    def test_word_products_pack_factors(self) -> None:
+        """Test that small factors are folded several per word."""
+        assert len(list(word_products(2, 1000))) < 999 // 5
+
+    def test_large_factorial_exact(self, calculator: FactorialCalculator) -> None:
+        """Test that the product-tree path computes exact factorials."""
+        assert calculator.calculate(10000) == math.factorial(10000)
+
+
+class TestFactorialFamily:
+    """Test suite for the generalised factorial family."""
+
+    @staticmethod
+    def _multifactorial(n: int, k: int) -> int:
+        """Reference multifactorial."""
+        result = 1
+        while n > 0:
+            result *= n
+            n -= k
+        return result
+
+    def test_multifactorial(self, calculator: FactorialCalculator) -> None:
+        """Test multifactorials against a reference loop."""
+        for k in range(1, 5):
+            for n in range(0, 120, 7):
+                expected = self._multifactorial(n, k)
+                assert calculator.multifactorial(n, k) == expected
+
+    def test_multifactorial_invalid_step(self, calculator: FactorialCalculator) -> None:
+        """Test that a zero step raises InvalidInputError."""
+        with pytest.raises(InvalidInputError, match="step"):
+            calculator.multifactorial(5, 0)
+
+    def test_double_factorial(self, calculator: FactorialCalculator) -> None:
+        """Test double factorials, including a large odd input."""
+        assert calculator.double_factorial(0) == 1
+        assert calculator.double_factorial(8) == 384
+        assert calculator.double_factorial(5001) == self._multifactorial(5001, 2)
+
+    def test_rising_factorial(self, calculator: FactorialCalculator) -> None:
+        """Test rising factorials against math.prod."""
+        assert calculator.rising_factorial(0, 0) == 1
+        assert calculator.rising_factorial(0, 3) == 0
+        assert calculator.rising_factorial(5, 10) == math.prod(range(5, 15))
+
+    def test_falling_factorial(self, calculator: FactorialCalculator) -> None:
+        """Test falling factorials against math.perm."""
+        assert calculator.falling_factorial(5, 6) == 0
+        assert calculator.falling_factorial(100, 40) == math.perm(100, 40)
+
+    def test_primorial(self, calculator: FactorialCalculator) -> None:
+        """Test primorials of small inputs."""
+        assert calculator.primorial(0) == 1
+        assert calculator.primorial(2) == 2
+        assert calculator.primorial(30) == 6469693230
+
+    def test_subfactorial(self, calculator: FactorialCalculator) -> None:
+        """Test subfactorials against the derangement recurrence."""
+        expected = 1
+        for n in range(200):
+            if n:
+                expected = n * expected + (-1) ** n
+            assert calculator.subfactorial(n) == expected
+
+    def test_family_results_are_cached(self, calculator: FactorialCalculator) -> None:
+        """Test that family results share the calculator cache."""
+        calculator.double_factorial(99)
+        calculator.double_factorial(99)
+        assert ("multifactorial", 99, 2) in calculator._cache
+        assert calculator.get_stats()["hits"] == 1
+
+    def test_family_respects_policy(self) -> None:
+        """Test that family operations use the calculator policy."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_result_bits=64))
+        assert calc.subfactorial(20) == 895014631192902121
+        with pytest.raises(OverflowError):
+            calc.primorial(1000)
+
+
+class TestSmallFactorialTable:
+    """Test suite for the constant table fast path."""
+
+    def test_table_is_exact(self) -> None:
+        """Test every table entry against math.factorial."""
+        assert len(SMALL_FACTORIALS) == SMALL_FACTORIAL_LIMIT + 1
+        for n, value in enumerate(SMALL_FACTORIALS):
+            assert value == math.factorial(n)
+
+    def test_markers(self) -> None:
+        """Test the uint64 and float markers are the tightest bounds."""
+        assert SMALL_FACTORIALS[MAX_UINT64_FACTORIAL_INPUT] < 2**64
+        assert math.factorial(MAX_UINT64_FACTORIAL_INPUT + 1) >= 2**64
+        assert math.isfinite(float(SMALL_FACTORIALS[MAX_FLOAT_FACTORIAL_INPUT]))
+        with pytest.raises(ArithmeticError):
+            float(math.factorial(MAX_FLOAT_FACTORIAL_INPUT + 1))
+
+    def test_fast_path_bypasses_cache(self, calculator: FactorialCalculator) -> None:
+        """Test that table hits are counted but not copied into the cache."""
+        assert calculator.calculate(170) == SMALL_FACTORIALS[170]
+        assert calculator.calculate(170) == SMALL_FACTORIALS[170]
+        assert 170 not in calculator._cache
+        stats = calculator.get_stats()
+        assert stats["table_hits"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 0
+
+    def test_fast_path_respects_policy(self) -> None:
+        """Test that a lower policy limit still rejects table inputs."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_input=10))
+        assert calc.calculate(10) == 3628800
+        with pytest.raises(InvalidInputError, match="exceeds maximum"):
+            calc.calculate(11)
+
+    def test_non_int_inputs_use_validation(
+        self, calculator: FactorialCalculator
+    ) -> None:
+        """Test that strings and bools still go through the validator."""
+        assert calculator.calculate(" 6 ") == 720
+        assert calculator.calculate(True) == 1
+
+
+class TestFactorialStrategies:
+    """Test suite for the tunable factorial strategies."""
+
+    @pytest.mark.parametrize("name", sorted(FACTORIAL_STRATEGIES))
+    @pytest.mark.parametrize("n", [0, 1, 2, 31, 32, 33, 500, 3000])
+    def test_strategies_agree(self, name: str, n: int) -> None:
+        """Test every strategy against math.factorial."""
+        assert FACTORIAL_STRATEGIES[name](n) == math.factorial(n)
+
+    def test_parallel_with_workers(self) -> None:
+        """Test the parallel strategy with explicit worker processes."""
+        assert parallel_factorial(25000, workers=2) == math.factorial(25000)
+
+    def test_available_strategies(self) -> None:
+        """Test that the core strategies are always measured."""
+        assert {"linear", "tree", "factorised"} <= set(available_strategies())
+
+    def test_calculator_dispatch(self) -> None:
+        """Test that the calculator follows its tuning profile."""
+        profile = TuningProfile(((300, "linear"),), "factorised")
+        calculator = FactorialCalculator(backend="python", tuning=profile)
+        assert calculator.calculate(250) == math.factorial(250)
+        assert calculator.calculate(2000) == math.factorial(2000)
+
+    def test_unknown_strategy_falls_back(self) -> None:
+        """Test that a profile naming an unknown strategy still works."""
+        calculator = FactorialCalculator(
+            backend="python", tuning=TuningProfile((), "quantum")
+        )
+        assert calculator.calculate(400) == math.factorial(400)
+
+
+class TestParallelRange:
+    """Test suite for chunked parallel range computation."""
+
+    def test_factorial_sweep(self) -> None:
+        """Test a sweep against math.factorial."""
+        assert factorial_sweep(0, 40) == [math.factorial(n) for n in range(41)]
+
+    @pytest.mark.parametrize("workers", [1, 2, 3])
+    def test_in_order(self, workers: int) -> None:
+        """Test ordered, complete output for several worker counts."""
+        pairs = list(parallel_range(10, 700, workers=workers, max_in_flight=2))
+        assert [n for n, _ in pairs] == list(range(10, 701))
+        assert all(value == math.factorial(n) for n, value in pairs)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_decimal_range(self, workers: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test decimal sweeps seeded from the first factorial of each chunk."""
+        monkeypatch.setattr("factorial_calculator.core.PARALLEL_CHUNK_BITS", 50000)
+        pairs = list(parallel_decimal_range(1400, 1460, workers=workers))
+        assert pairs == [(n, str(math.factorial(n))) for n in range(1400, 1461)]
+        assert decimal_sweep(0, 3) == ["1", "1", "2", "6"]
+
+    def test_small_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test many tiny chunks with a single chunk in flight."""
+        monkeypatch.setattr("factorial_calculator.core.PARALLEL_CHUNK_BITS", 2000)
+        pairs = list(parallel_range(100, 160, workers=2, max_in_flight=1))
+        assert [value for _, value in pairs] == [
+            math.factorial(n) for n in range(100, 161)
+        ]
+
+    def test_calculate_range_parallel(self) -> None:
+        """Test the calculator's parallel option, including swapped bounds."""
+        calculator = FactorialCalculator()
+        expected = calculator.calculate_range(20, 90)
+        assert calculator.calculate_range(90, 20, parallel=True, workers=2) == expected
+
+    def test_iter_range_validates_eagerly(self) -> None:
+        """Test that invalid bounds fail before any result is produced."""
+        calculator = FactorialCalculator()
+        with pytest.raises(InvalidInputError):
+            calculator.iter_range(-1, 10, parallel=True)
+        with pytest.raises(OverflowError):
+            FactorialCalculator(policy=ResourcePolicy(max_result_bits=100)).iter_range(
+                1, 50, parallel=True
+            )
+
+    def test_cancelled_between_chunks(self) -> None:
+        """Test that a cancelled token stops a parallel range."""
+        token = CancellationToken()
+        token.cancel()
+        with pytest.raises(ComputationCancelledError):
+            list(parallel_range(0, 50, workers=2, token=token))
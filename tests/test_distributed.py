@@ -0,0 +1,207 @@
+"""Unit tests for the distributed coordinator and worker module."""
+
+import math
+import os
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from factorial_calculator import distributed
+from factorial_calculator.cli import CLI
+from factorial_calculator.distributed import (
+    DEFAULT_PORT,
+    Coordinator,
+    WorkerServer,
+    parse_address,
+)
+from factorial_calculator.exceptions import InvalidInputError, WorkerError
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def worker_processes() -> Iterator[list[str]]:
+    """Start three worker processes on loopback and yield their addresses."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    command = [sys.executable, "-m", "factorial_calculator.cli", "worker"]
+    processes = [
+        subprocess.Popen(
+            [*command, "--listen", "127.0.0.1:0"],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        for _ in range(3)
+    ]
+    try:
+        addresses = []
+        for process in processes:
+            assert process.stdout is not None
+            addresses.append(process.stdout.readline().split()[-1])
+        yield addresses
+    finally:
+        for process in processes:
+            process.kill()
+            process.wait()
+
+
+@pytest.fixture
+def worker_server() -> Iterator[WorkerServer]:
+    """Run an in-process worker on a free loopback port."""
+    server = WorkerServer(("127.0.0.1", 0), max_input=100000)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _dead_address() -> str:
+    """Return a loopback address nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"127.0.0.1:{port}"
+
+
+def _address(server: WorkerServer) -> str:
+    """Return the address of an in-process worker."""
+    host, port = server.server_address[:2]
+    return f"{host}:{port}"
+
+
+class TestParseAddress:
+    """Test suite for worker address parsing."""
+
+    def test_forms(self) -> None:
+        """Test host:port, port-only and host-only addresses."""
+        assert parse_address("example.org:81") == ("example.org", 81)
+        assert parse_address("81") == ("127.0.0.1", 81)
+        assert parse_address("example.org") == ("example.org", DEFAULT_PORT)
+
+    @pytest.mark.parametrize("text", ["host:port", "host:70000"])
+    def test_invalid(self, text: str) -> None:
+        """Test that bad ports are rejected."""
+        with pytest.raises(InvalidInputError):
+            parse_address(text)
+
+
+class TestCoordinator:
+    """Test suite for distributed products."""
+
+    def test_worker_processes(self, worker_processes: list[str]) -> None:
+        """Test a factorial split across several local worker processes."""
+        coordinator = Coordinator(worker_processes)
+        assert coordinator.factorial(12345) == math.factorial(12345)
+        assert coordinator.factorial(0) == 1
+        assert coordinator.range_product(10, 20) == math.prod(range(10, 21))
+
+    def test_more_workers_than_factors(self, worker_server: WorkerServer) -> None:
+        """Test ranges shorter than the number of sub-ranges."""
+        coordinator = Coordinator([_address(worker_server)] * 3)
+        assert coordinator.factorial(3) == 6
+
+    def test_dead_worker_is_reassigned(self, worker_server: WorkerServer) -> None:
+        """Test that sub-ranges of an unreachable worker go elsewhere."""
+        coordinator = Coordinator([_dead_address(), _address(worker_server)])
+        assert coordinator.factorial(5000) == math.factorial(5000)
+
+    def test_dropped_connection_is_retried(self, worker_server: WorkerServer) -> None:
+        """Test that a worker closing the connection once is retried."""
+        drops = [0]
+        answer = worker_server.answer
+
+        def flaky(payload: bytes) -> bytes:
+            if drops[0] == 0:
+                drops[0] += 1
+                raise ConnectionResetError("dropped")
+            return answer(payload)
+
+        worker_server.answer = flaky  # type: ignore[method-assign]
+        coordinator = Coordinator([_address(worker_server)], retries=1)
+        assert coordinator.factorial(2000) == math.factorial(2000)
+        assert drops == [1]
+
+    def test_oversized_response_is_rejected(self, worker_server: WorkerServer) -> None:
+        """Test that a bogus length header fails the worker, not the job."""
+
+        class Bogus(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                self.request.recv(64)
+                self.request.sendall(struct.pack("!Q", 2**62))
+
+        with socketserver.ThreadingTCPServer(("127.0.0.1", 0), Bogus) as bogus:
+            threading.Thread(target=bogus.serve_forever, daemon=True).start()
+            host, port = bogus.server_address[:2]
+            workers = [f"{host}:{port}", _address(worker_server)]
+            assert Coordinator(workers).factorial(3000) == math.factorial(3000)
+            with pytest.raises(WorkerError, match="exceeds"):
+                Coordinator(workers[:1], retries=0).factorial(3000)
+            bogus.shutdown()
+
+    def test_unexpected_error_returns_the_sub_range(
+        self, worker_server: WorkerServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a driver dying on any error hands its sub-range back."""
+        calls = [0]
+        exchange = distributed._exchange
+
+        def failing(sock: socket.socket, low: int, high: int) -> bytes:
+            calls[0] += 1
+            if calls[0] == 1:
+                raise ValueError("unexpected")
+            return exchange(sock, low, high)
+
+        monkeypatch.setattr(distributed, "_exchange", failing)
+        coordinator = Coordinator([_address(worker_server)] * 2, chunks_per_worker=1)
+        assert coordinator.factorial(2000) == math.factorial(2000)
+        with pytest.raises(WorkerError, match="unexpected"):
+            calls[0] = 0
+            Coordinator([_address(worker_server)]).factorial(2000)
+
+    def test_all_workers_down(self) -> None:
+        """Test that WorkerError is raised once every worker has failed."""
+        coordinator = Coordinator([_dead_address(), _dead_address()], retries=0)
+        with pytest.raises(WorkerError):
+            coordinator.factorial(100)
+
+    def test_rejected_range(self, worker_server: WorkerServer) -> None:
+        """Test that a worker's refusal is reported, not retried."""
+        worker_server.max_input = 50
+        with pytest.raises(InvalidInputError, match="outside"):
+            Coordinator([_address(worker_server)]).factorial(100)
+
+    def test_invalid_arguments(self) -> None:
+        """Test argument checks of the coordinator."""
+        with pytest.raises(InvalidInputError):
+            Coordinator([])
+        with pytest.raises(InvalidInputError):
+            Coordinator(["127.0.0.1:1"]).factorial(-1)
+        with pytest.raises(InvalidInputError):
+            Coordinator(["127.0.0.1:1"]).range_product(0, 5)
+        with pytest.raises(InvalidInputError):
+            Coordinator(["127.0.0.1:1"]).range_product(1, 2**64)
+
+
+class TestCLICoordinate:
+    """Test suite for the coordinate subcommand."""
+
+    def test_coordinate(
+        self, worker_server: WorkerServer, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test computing a factorial through the CLI."""
+        assert CLI().run(["coordinate", "30", "-w", _address(worker_server)]) == 0
+        assert str(math.factorial(30)) in capsys.readouterr().out
+
+    def test_coordinate_without_workers(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that unreachable workers are an error."""
+        args = ["coordinate", "30", "-w", _dead_address(), "--retries", "0"]
+        assert CLI().run(args) == 1
+        assert "Error:" in capsys.readouterr().err
@@ -0,0 +1,130 @@
+"""Unit tests for the batch executor module."""
+
+import math
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from factorial_calculator.cache import FactorialCache
+from factorial_calculator.core import FactorialCalculator, FactorialCalculatorFactory
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.executor import (
+    BatchExecutor,
+    calculate_many,
+    has_subinterpreters,
+    is_free_threaded,
+    select_mode,
+)
+
+
+class TestModeSelection:
+    """Test suite for runtime detection."""
+
+    def test_select_mode_matches_runtime(self) -> None:
+        """Test that the selected mode follows the detected features."""
+        if is_free_threaded():
+            assert select_mode() == "thread"
+        elif has_subinterpreters():
+            assert select_mode() == "interpreter"
+        else:
+            assert select_mode() == "process"
+
+    def test_gil_build_falls_back_to_processes(self) -> None:
+        """Test the fallback on a GIL build without sub-interpreters."""
+        with (
+            patch("factorial_calculator.executor.is_free_threaded", return_value=False),
+            patch(
+                "factorial_calculator.executor.has_subinterpreters", return_value=False
+            ),
+        ):
+            assert select_mode() == "process"
+
+    def test_free_threaded_prefers_threads(self) -> None:
+        """Test that a free-threaded runtime uses threads."""
+        with patch("factorial_calculator.executor.is_free_threaded", return_value=True):
+            assert select_mode() == "thread"
+
+    def test_invalid_modes(self) -> None:
+        """Test unknown and unsupported modes."""
+        with pytest.raises(InvalidInputError):
+            BatchExecutor(mode="fibers")
+        if not has_subinterpreters():
+            with pytest.raises(InvalidInputError):
+                BatchExecutor(mode="interpreter")
+
+
+class TestCalculateMany:
+    """Test suite for calculate_many function."""
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_results_in_order(self, mode: str) -> None:
+        """Test results against math.factorial, with duplicates."""
+        values = [300, 5, "12", 300, 0, 2500]
+        calculator = FactorialCalculator()
+        results = calculate_many(values, calculator, workers=2, mode=mode)
+        assert results == [math.factorial(int(v)) for v in values]
+        assert calculator.is_cached(2500)
+
+    def test_cached_inputs_served_locally(self) -> None:
+        """Test that cached inputs are not sent to worker processes."""
+        calculator = FactorialCalculator()
+        calculator.calculate(400)
+        with BatchExecutor(calculator, workers=2, mode="process") as executor:
+            assert executor.map([400, 401]) == [
+                math.factorial(400),
+                math.factorial(401),
+            ]
+        assert calculator.get_stats()["hits"] >= 1
+
+    def test_invalid_input_rejected_up_front(self) -> None:
+        """Test that one invalid input aborts the whole batch."""
+        with pytest.raises(InvalidInputError, match="position 1"):
+            calculate_many([5, -1, "x"], FactorialCalculator(), mode="thread")
+
+    def test_empty_batch(self) -> None:
+        """Test an empty batch in process mode."""
+        assert calculate_many([], FactorialCalculator(), mode="process") == []
+
+
+class TestThreadSafety:
+    """Test suite for shared state under concurrent access."""
+
+    def test_shared_cache_under_contention(self) -> None:
+        """Test a bounded two-tier cache hammered by several threads."""
+        calculator = FactorialCalculator(
+            cache=FactorialCache(max_bytes=200_000, max_hot_bytes=50_000)
+        )
+        errors: list[BaseException] = []
+
+        def work(offset: int) -> None:
+            try:
+                for n in range(200 + offset, 1200, 7):
+                    assert calculator.calculate(n) == math.factorial(n)
+            except BaseException as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert calculator.get_stats()["cache_bytes"] <= 200_000
+
+    def test_singleton_created_once(self) -> None:
+        """Test that concurrent first calls share one singleton."""
+        FactorialCalculatorFactory._instance = None
+        barrier = threading.Barrier(8)
+        seen: list[FactorialCalculator] = []
+
+        def get() -> None:
+            barrier.wait()
+            seen.append(FactorialCalculatorFactory.get_calculator())
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(calculator) for calculator in seen}) == 1
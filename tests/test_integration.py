@@ -108,9 +108,9 @@ class TestPackageIntegration:
         calc = FactorialCalculator()
 
         # Calculate multiple factorials
-        for i in range(50):
+        for i in range(200, 250):
             result = calc.calculate(i)
             assert result > 0
 
-        # Verify cache is working (50 calculations + base cases 0 and 1)
+        # Verify cache is working (50 calculations beyond the constant table)
         assert calc.get_cache_size() >= 50
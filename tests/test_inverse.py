@@ -0,0 +1,93 @@
+"""Unit tests for the inverse factorial module."""
+
+import math
+
+import pytest
+
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.inverse import (
+    inverse_factorial,
+    is_factorial,
+    largest_factorial_input,
+    smallest_input_with_digits,
+)
+
+
+class TestLargestFactorialInput:
+    """Test suite for the largest n with n! <= x."""
+
+    @pytest.mark.parametrize("n", [2, 3, 10, 170, 171, 999, 4000])
+    def test_around_factorials(self, n: int) -> None:
+        """Test exact factorials and their immediate neighbours."""
+        value = math.factorial(n)
+        calculator = FactorialCalculator()
+        assert largest_factorial_input(value, calculator) == n
+        assert largest_factorial_input(value - 1, calculator) == n - 1
+        assert largest_factorial_input(value + 1, calculator) == n
+
+    def test_small_values(self) -> None:
+        """Test the base cases where 0! and 1! coincide."""
+        assert largest_factorial_input(1) == 1
+        assert largest_factorial_input(5) == 2
+        assert largest_factorial_input(6) == 3
+
+    def test_far_from_boundaries_skips_computation(self) -> None:
+        """Test that clear-cut queries never compute a factorial."""
+        calculator = FactorialCalculator()
+        x = 3 * math.factorial(5000) // 2
+        assert largest_factorial_input(x, calculator) == 5000
+        assert calculator.get_stats()["misses"] == 0
+
+    def test_beyond_max_input(self) -> None:
+        """Test huge targets that only lgamma can bracket."""
+        calculator = FactorialCalculator()
+        assert largest_factorial_input(10**200000, calculator) == 47175
+        assert calculator.get_stats()["misses"] == 0
+
+    @pytest.mark.parametrize("x", [0, -5, 2.5, "24", True])
+    def test_invalid(self, x: object) -> None:
+        """Test that non-positive and non-integer values are rejected."""
+        with pytest.raises(InvalidInputError):
+            largest_factorial_input(x)  # type: ignore[arg-type]
+
+
+class TestSmallestInputWithDigits:
+    """Test suite for the smallest n with at least D digits."""
+
+    def test_matches_brute_force(self) -> None:
+        """Test against the digit counts of the first factorials."""
+        lengths = [len(str(math.factorial(n))) for n in range(400)]
+        calculator = FactorialCalculator()
+        for digits in range(1, lengths[-1] + 1):
+            expected = next(n for n, size in enumerate(lengths) if size >= digits)
+            assert smallest_input_with_digits(digits, calculator) == expected
+
+    def test_invalid(self) -> None:
+        """Test that a digit count below 1 is rejected."""
+        with pytest.raises(InvalidInputError):
+            smallest_input_with_digits(0)
+
+
+class TestInverseFactorial:
+    """Test suite for recognising factorials."""
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 20, 21, 500, 2500])
+    def test_factorials(self, n: int) -> None:
+        """Test that every factorial is recognised."""
+        assert inverse_factorial(math.factorial(n)) == n
+        assert is_factorial(math.factorial(n))
+
+    @pytest.mark.parametrize("x", [3, 7, 25, 5040 * 2, 2**64])
+    def test_non_factorials(self, x: int) -> None:
+        """Test values that are not factorials."""
+        assert inverse_factorial(x) is None
+        assert not is_factorial(x)
+
+    def test_same_trailing_zeros(self) -> None:
+        """Test a non-factorial that passes the trailing-zero check."""
+        n = 300
+        shift = n - n.bit_count()
+        fake = math.factorial(n) + (1 << (shift + 1))
+        assert largest_factorial_input(fake) == n
+        assert not is_factorial(fake)
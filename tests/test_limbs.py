@@ -0,0 +1,127 @@
+"""Unit tests for the decimal-limb accumulator module."""
+
+import io
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from factorial_calculator import limbs
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import InvalidInputError, OverflowError
+from factorial_calculator.limbs import (
+    MAX_MULTIPLIER,
+    DecimalAccumulator,
+    iter_factorial_decimals,
+)
+from factorial_calculator.policy import ResourcePolicy
+from factorial_calculator.vectorized import is_numpy_available
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(
+            not is_numpy_available(), reason="numpy not installed"
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestDecimalAccumulator:
+    """Test suite for limb arithmetic and decimal output."""
+
+    def test_running_factorial(self, use_numpy: bool) -> None:
+        """Test multiplying up to 1000! against math.factorial."""
+        accumulator = DecimalAccumulator(use_numpy=use_numpy)
+        for k in range(2, 1001):
+            accumulator.multiply(k)
+        expected = str(math.factorial(1000))
+        assert str(accumulator) == expected
+        assert accumulator.digit_count == len(expected)
+
+    def test_carry_ripple(self, use_numpy: bool) -> None:
+        """Test carries through runs of all-nines limbs and the largest factor."""
+        accumulator = DecimalAccumulator(10**40 - 1, use_numpy=use_numpy)
+        accumulator.multiply(MAX_MULTIPLIER)
+        assert str(accumulator) == str((10**40 - 1) * MAX_MULTIPLIER)
+        accumulator = DecimalAccumulator(10**27 - 1, use_numpy=use_numpy)
+        accumulator.multiply(1)
+        assert str(accumulator) == "9" * 27
+
+    def test_chunked_output(self, use_numpy: bool) -> None:
+        """Test small chunks and writing to a stream."""
+        value = math.factorial(300)
+        accumulator = DecimalAccumulator(value, use_numpy=use_numpy)
+        chunks = list(accumulator.iter_decimal(chunk_limbs=4))
+        assert "".join(chunks) == str(value)
+        assert all(len(chunk) <= 36 for chunk in chunks)
+        stream = io.StringIO()
+        assert accumulator.write_decimal(stream) == len(str(value))
+        assert stream.getvalue() == str(value)
+
+    def test_invalid_arguments(self, use_numpy: bool) -> None:
+        """Test rejected start values and multipliers."""
+        with pytest.raises(InvalidInputError):
+            DecimalAccumulator(0, use_numpy=use_numpy)
+        accumulator = DecimalAccumulator(use_numpy=use_numpy)
+        with pytest.raises(InvalidInputError):
+            accumulator.multiply(0)
+        with pytest.raises(InvalidInputError):
+            accumulator.multiply(MAX_MULTIPLIER + 1)
+
+
+class TestIterFactorialDecimals:
+    """Test suite for streaming consecutive factorials."""
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_across_threshold(
+        self, use_numpy: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test results on both sides of the switch to limbs."""
+        monkeypatch.setattr(limbs, "NUMPY_THRESHOLD_DIGITS", 200)
+        monkeypatch.setattr(limbs, "PYTHON_THRESHOLD_DIGITS", 200)
+        pairs = iter_factorial_decimals(0, 300, 1, use_numpy=use_numpy)
+        for n, chunks in pairs:
+            assert "".join(chunks) == str(math.factorial(n))
+
+    def test_seeded_above_threshold(self) -> None:
+        """Test a range whose first value is already large."""
+        first = math.factorial(1400)
+        pairs = iter_factorial_decimals(1400, 1403, first)
+        assert [(n, "".join(chunks)) for n, chunks in pairs] == [
+            (n, str(math.factorial(n))) for n in range(1400, 1404)
+        ]
+
+    def test_calculator_range(self) -> None:
+        """Test the calculator entry point, including swapped bounds."""
+        calculator = FactorialCalculator()
+        pairs = calculator.iter_range_decimal(40, 1)
+        assert [(n, "".join(chunks)) for n, chunks in pairs] == [
+            (n, str(math.factorial(n))) for n in range(1, 41)
+        ]
+        assert calculator.is_cached(1)
+        assert not calculator.is_cached(40)
+
+    def test_calculator_validates_eagerly(self) -> None:
+        """Test that invalid bounds fail before any result is produced."""
+        with pytest.raises(InvalidInputError):
+            FactorialCalculator().iter_range_decimal(-1, 10)
+        calculator = FactorialCalculator(policy=ResourcePolicy(max_result_bits=100))
+        with pytest.raises(OverflowError):
+            calculator.iter_range_decimal(1, 50)
+
+    def test_numpy_not_loaded_on_import(self) -> None:
+        """Test that importing the package and CLI leaves NumPy unloaded."""
+        code = "import sys, factorial_calculator.cli; print('numpy' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        assert result.stdout.strip() == "False"
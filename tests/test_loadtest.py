@@ -0,0 +1,114 @@
+"""Unit tests for the load-replay module."""
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.loadtest import (
+    MODES,
+    TraceRequest,
+    _percentile,
+    read_trace,
+    replay,
+    synthetic_trace,
+    write_trace,
+)
+from factorial_calculator.policy import ResourcePolicy
+
+
+class TestTraces:
+    """Test suite for trace files and synthetic traces."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test writing and reading a trace."""
+        requests = [TraceRequest(5, 5, 0.5), TraceRequest(3, 8, 0.25)]
+        path = tmp_path / "trace.jsonl"
+        write_trace(requests, path)
+        assert read_trace(path) == sorted(requests, key=lambda r: r.timestamp)
+
+    def test_read_plain_lines(self, tmp_path: Path) -> None:
+        """Test lines without timestamps and blank lines."""
+        path = tmp_path / "trace.jsonl"
+        path.write_text('{"n": 7}\n\n{"range": [1, 3]}\n')
+        assert read_trace(path) == [TraceRequest(7, 7), TraceRequest(1, 3)]
+
+    def test_invalid_line(self, tmp_path: Path) -> None:
+        """Test that malformed lines are reported with their number."""
+        path = tmp_path / "trace.jsonl"
+        path.write_text('{"n": 7}\n{"x": 1}\n')
+        with pytest.raises(InvalidInputError, match="line 2"):
+            read_trace(path)
+
+    def test_zipf_is_skewed(self) -> None:
+        """Test that a Zipf trace concentrates on a few inputs."""
+        trace = synthetic_trace("zipf", 5000, max_n=500, seed=7)
+        top = Counter(r.low for r in trace).most_common(10)
+        assert sum(count for _, count in top) > 5000 * 0.3
+        assert all(0 <= r.low <= 500 for r in trace)
+
+    def test_uniform_and_rate(self) -> None:
+        """Test uniform inputs with Poisson arrival times."""
+        trace = synthetic_trace("uniform", 200, max_n=50, rate=100.0, seed=1)
+        timestamps = [r.timestamp for r in trace]
+        assert timestamps == sorted(timestamps)
+        assert 0.5 < timestamps[-1] < 4.0
+        assert synthetic_trace("uniform", 50, seed=3) == synthetic_trace(
+            "uniform", 50, seed=3
+        )
+
+    def test_unknown_distribution(self) -> None:
+        """Test that an unknown distribution is rejected."""
+        with pytest.raises(InvalidInputError):
+            synthetic_trace("pareto", 10)
+
+
+class TestReplay:
+    """Test suite for replay function."""
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_modes(self, mode: str) -> None:
+        """Test every concurrency model on a sequential trace."""
+        trace = synthetic_trace("sequential", 200, max_n=9)
+        report = replay(trace, concurrency=2, mode=mode)
+        assert report.requests == 200
+        assert report.errors == 0
+        assert 0 <= report.p50 <= report.p95 <= report.p99
+        assert report.hit_ratio >= 0.5
+        assert report.throughput > 0
+        assert "p99" in report.format()
+
+    def test_errors_counted(self) -> None:
+        """Test that failing requests are counted separately."""
+        trace = [TraceRequest(5, 5), TraceRequest(10**6, 10**6)]
+        report = replay(trace, FactorialCalculator(), concurrency=1)
+        assert (report.requests, report.errors) == (1, 1)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_policy_applies_in_every_mode(self, mode: str) -> None:
+        """Test that every mode rejects the inputs the caller's policy rejects."""
+        calculator = FactorialCalculator(policy=ResourcePolicy(max_input=50))
+        trace = [TraceRequest(40, 40), TraceRequest(60, 60)]
+        report = replay(trace, calculator, concurrency=1, mode=mode)
+        assert (report.requests, report.errors) == (1, 1)
+
+    def test_paced_replay(self) -> None:
+        """Test that pacing honours the trace timestamps."""
+        trace = [TraceRequest(n, n, n * 0.01) for n in range(10)]
+        assert replay(trace, pace=True).duration >= 0.09
+
+    def test_invalid_arguments(self) -> None:
+        """Test unknown modes and zero concurrency."""
+        with pytest.raises(InvalidInputError):
+            replay([], mode="fibers")
+        with pytest.raises(InvalidInputError):
+            replay([], concurrency=0)
+
+    def test_percentile(self) -> None:
+        """Test nearest-rank percentiles."""
+        data = [float(i) for i in range(1, 101)]
+        assert _percentile(data, 0.5) == 50.0
+        assert _percentile(data, 0.99) == 99.0
+        assert _percentile([], 0.5) == 0.0
@@ -0,0 +1,171 @@
+"""Unit tests for the resource policy module."""
+
+import math
+import threading
+
+import pytest
+
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import (
+    ComputationCancelledError,
+    DeadlineExceededError,
+    FactorialError,
+    InvalidInputError,
+    OverflowError,
+)
+from factorial_calculator.policy import (
+    DEFAULT_POLICY,
+    CancellationToken,
+    ResourcePolicy,
+    estimate_factorial_bits,
+)
+from factorial_calculator.validator import InputValidator
+
+
+class TestResourcePolicy:
+    """Test suite for ResourcePolicy class."""
+
+    def test_default_policy_matches_validator_limit(self) -> None:
+        """Test the default policy keeps the historical input limit."""
+        assert DEFAULT_POLICY.max_input == InputValidator.MAX_FACTORIAL_INPUT
+
+    def test_negative_limit_rejected(self) -> None:
+        """Test that negative limits raise InvalidInputError."""
+        with pytest.raises(InvalidInputError, match="max_input"):
+            ResourcePolicy(max_input=-1)
+
+    def test_new_token_without_time_limit(self) -> None:
+        """Test that no token is created without max_wall_time."""
+        assert ResourcePolicy().new_token() is None
+
+    def test_new_token_with_time_limit(self) -> None:
+        """Test that max_wall_time produces a token with a deadline."""
+        token = ResourcePolicy(max_wall_time=5).new_token()
+        assert token is not None
+        assert token.deadline is not None
+
+    @pytest.mark.parametrize("n", [0, 1, 2, 3, 10, 100, 1000, 2500])
+    def test_estimate_factorial_bits(self, n: int) -> None:
+        """Test bit estimates against exact bit lengths."""
+        assert estimate_factorial_bits(n) == math.factorial(n).bit_length()
+
+
+class TestCancellationToken:
+    """Test suite for CancellationToken class."""
+
+    def test_fresh_token_passes_check(self) -> None:
+        """Test that an untouched token does not raise."""
+        CancellationToken().check()
+
+    def test_cancel_from_other_thread(self) -> None:
+        """Test cancelling a token from another thread."""
+        token = CancellationToken()
+        thread = threading.Thread(target=token.cancel)
+        thread.start()
+        thread.join()
+        assert token.cancelled
+        with pytest.raises(ComputationCancelledError):
+            token.check()
+
+    def test_expired_deadline(self) -> None:
+        """Test that an expired deadline raises DeadlineExceededError."""
+        with pytest.raises(DeadlineExceededError):
+            CancellationToken(timeout=-1).check()
+
+    def test_progress_and_eta(self) -> None:
+        """Test progress reporting and the derived time estimate."""
+        token = CancellationToken()
+        assert token.eta() is None
+        token.report_progress(1.5)
+        assert token.progress == 1.0
+        assert token.eta() == 0.0
+        token.report_progress(0.5)
+        eta = token.eta()
+        assert eta is not None and eta >= 0.0
+
+    def test_chunked_factorial_reports_progress(self) -> None:
+        """Test that a token-driven calculation reaches full progress."""
+        token = CancellationToken()
+        FactorialCalculator().calculate(3000, token)
+        assert token.progress == 1.0
+
+    def test_deadline_error_is_factorial_error(self) -> None:
+        """Test the cancellation exception hierarchy."""
+        assert issubclass(DeadlineExceededError, ComputationCancelledError)
+        assert issubclass(ComputationCancelledError, FactorialError)
+
+
+class TestCalculatorWithPolicy:
+    """Test suite for FactorialCalculator under a ResourcePolicy."""
+
+    def test_raised_max_input(self) -> None:
+        """Test that a policy can raise the input limit."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_input=12000))
+        assert calc.calculate(11000) == math.factorial(11000)
+
+    def test_lowered_max_input(self) -> None:
+        """Test that a policy can lower the input limit."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_input=10))
+        with pytest.raises(InvalidInputError, match="exceeds maximum"):
+            calc.calculate(11)
+
+    def test_max_result_bits(self) -> None:
+        """Test that results larger than max_result_bits are refused."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_result_bits=64))
+        assert calc.calculate(20) == math.factorial(20)
+        with pytest.raises(OverflowError, match="bits"):
+            calc.calculate(21)
+
+    def test_cancelled_token_aborts_calculation(self) -> None:
+        """Test that a cancelled token aborts and leaves the cache intact."""
+        calc = FactorialCalculator()
+        token = CancellationToken()
+        token.cancel()
+        with pytest.raises(ComputationCancelledError):
+            calc.calculate(5000, token)
+        assert 5000 not in calc._cache
+        assert calc.calculate(5000) == math.factorial(5000)
+
+    def test_chunked_calculation_matches(self) -> None:
+        """Test that the chunked path computes exact results."""
+        calc = FactorialCalculator()
+        assert calc.calculate(3000, CancellationToken()) == math.factorial(3000)
+
+    @pytest.mark.parametrize("n", [0, 1, 2, 511, 513, 1025, 1537, 4000])
+    def test_chunked_tree_matches_across_chunk_counts(self, n: int) -> None:
+        """Test the chunk product tree with odd and even numbers of leaves."""
+        calc = FactorialCalculator(backend="python")
+        assert calc._chunked_factorial(n, CancellationToken()) == math.factorial(n)
+
+    def test_cancelled_while_merging(self) -> None:
+        """Test that the token is honoured between tree multiplications."""
+
+        class CancelHalfway(CancellationToken):
+            reported: list[float] = []
+
+            def report_progress(self, fraction: float) -> None:
+                self.reported.append(fraction)
+                super().report_progress(fraction)
+                if fraction > 0.5:
+                    self.cancel()
+
+        token = CancelHalfway()
+        with pytest.raises(ComputationCancelledError):
+            FactorialCalculator(backend="python")._chunked_factorial(8000, token)
+        assert token.reported == sorted(token.reported)
+        assert 0.5 < token.reported[-1] < 1.0
+
+    def test_wall_time_limit(self) -> None:
+        """Test that max_wall_time aborts long calculations."""
+        calc = FactorialCalculator(policy=ResourcePolicy(max_wall_time=0))
+        with pytest.raises(DeadlineExceededError):
+            calc.calculate(5000)
+
+    def test_cache_byte_budget(self) -> None:
+        """Test that the cache respects max_cache_bytes."""
+        policy = ResourcePolicy(max_cache_bytes=4096)
+        calc = FactorialCalculator(policy=policy)
+        for n in range(100, 400, 10):
+            calc.calculate(n)
+        assert calc._cache.nbytes <= 4096
+        assert calc._cache.evictions > 0
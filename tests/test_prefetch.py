@@ -0,0 +1,149 @@
+"""Unit tests for the prefetch module."""
+
+import math
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from factorial_calculator.core import FactorialCalculator, FactorialCalculatorFactory
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.policy import ResourcePolicy
+from factorial_calculator.prefetch import Prefetcher
+
+
+@pytest.fixture
+def prefetched() -> Iterator[FactorialCalculator]:
+    """Provide a calculator with an attached prefetcher that never waits."""
+    calculator = FactorialCalculator(backend="python")
+    calculator.prefetcher = Prefetcher(calculator, idle_delay=0)
+    yield calculator
+    calculator.prefetcher.close()
+
+
+class TestPrediction:
+    """Test suite for stride and neighbour prediction."""
+
+    @staticmethod
+    def _predict(accesses: list[int], depth: int = 2) -> list[int]:
+        """Feed accesses to a detached prefetcher and return its prediction."""
+        prefetcher = Prefetcher(FactorialCalculator(), depth=depth)
+        prefetcher._recent.extend(accesses)
+        return prefetcher.predict()
+
+    def test_stride(self) -> None:
+        """Test that a repeated step is extrapolated."""
+        assert self._predict([200, 207, 214], depth=3) == [221, 228, 235]
+        assert self._predict([500, 400, 300]) == [200, 100]
+
+    def test_neighbours_without_stride(self) -> None:
+        """Test that irregular accesses predict the neighbours."""
+        assert self._predict([300, 900, 400]) == [401, 399]
+        assert self._predict([]) == []
+
+
+class TestPrefetcher:
+    """Test suite for background prefetching."""
+
+    def test_walk_turns_misses_into_hits(self, prefetched: FactorialCalculator) -> None:
+        """Test that an upward walk is served from prefetched results."""
+        for n in range(1000, 1100, 10):
+            assert prefetched.calculate(n) == math.factorial(n)
+            assert prefetched.prefetcher.wait_idle(10)
+        stats = prefetched.get_stats()
+        assert stats["hits"] >= 7
+        assert stats["prefetch_useful"] >= 7
+        assert 0 < stats["prefetch_accuracy"] <= 1
+
+    def test_max_input_budget(self, prefetched: FactorialCalculator) -> None:
+        """Test that predictions above max_input are never computed."""
+        prefetched.prefetcher.max_input = 500
+        for n in (480, 490, 500):
+            prefetched.calculate(n)
+        assert prefetched.prefetcher.wait_idle(10)
+        assert not prefetched.is_cached(510)
+
+    def test_max_input_follows_policy(self) -> None:
+        """Test that predictions are limited to inputs the policy accepts."""
+        calculator = FactorialCalculator(policy=ResourcePolicy(max_input=600))
+        prefetcher = Prefetcher(calculator, idle_delay=0)
+        calculator.prefetcher = prefetcher
+        try:
+            assert prefetcher.max_input == 600
+            for n in (580, 590, 600):
+                calculator.calculate(n)
+            assert prefetcher.wait_idle(10)
+            assert calculator.get_stats()["prefetch_skipped"] == 0
+        finally:
+            prefetcher.close()
+        assert Prefetcher(FactorialCalculator(), max_input=50).max_input == 50
+
+    def test_memory_budget(self, prefetched: FactorialCalculator) -> None:
+        """Test that prefetching stops once unused results fill the budget."""
+        prefetched.prefetcher.max_bytes = 1
+        for n in (2000, 3000, 4000, 6000):
+            prefetched.calculate(n)
+            assert prefetched.prefetcher.wait_idle(10)
+        stats = prefetched.get_stats()
+        assert stats["prefetch_issued"] == 1
+        assert stats["prefetch_skipped"] > 0
+
+    def test_cpu_budget(self) -> None:
+        """Test that the thread rests in proportion to its computations."""
+        calculator = FactorialCalculator(backend="python")
+        prefetcher = Prefetcher(
+            calculator, depth=4, idle_delay=0, max_cpu_fraction=0.25
+        )
+        calculator.prefetcher = prefetcher
+        try:
+            start = time.monotonic()
+            calculator.calculate(9000)
+            assert prefetcher.wait_idle(30)
+            wall = time.monotonic() - start
+            stats = calculator.get_stats()
+            assert stats["prefetch_issued"] == 4
+            # Three of the four computations are followed by a rest of
+            # three times their duration
+            assert wall >= 1.5 * stats["prefetch_seconds"] > 0
+        finally:
+            prefetcher.close()
+        with pytest.raises(InvalidInputError):
+            Prefetcher(calculator, max_cpu_fraction=0)
+
+    def test_small_table_accesses_are_observed(
+        self, prefetched: FactorialCalculator
+    ) -> None:
+        """Test that inputs served from the constant table feed predictions."""
+        for n in (100, 120, 140):
+            prefetched.calculate(n)
+        assert list(prefetched.prefetcher._recent) == [100, 120, 140]
+        assert prefetched.prefetcher.predict() == [160, 180]
+
+    def test_close_stops_prefetching(self, prefetched: FactorialCalculator) -> None:
+        """Test that a closed prefetcher ignores further accesses."""
+        prefetched.prefetcher.close()
+        prefetched.calculate(700)
+        prefetched.calculate(710)
+        prefetched.calculate(720)
+        assert not prefetched.is_cached(730)
+
+    def test_stats_absent_without_prefetcher(self) -> None:
+        """Test that plain calculators report no prefetch counters."""
+        assert "prefetch_issued" not in FactorialCalculator().get_stats()
+
+
+class TestFactoryPrefetch:
+    """Test suite for prefetching on the shared singleton."""
+
+    def test_enable_and_disable(self) -> None:
+        """Test attaching, replacing and detaching the prefetcher."""
+        calculator = FactorialCalculatorFactory.get_calculator()
+        first = FactorialCalculatorFactory.enable_prefetch(idle_delay=0)
+        second = FactorialCalculatorFactory.enable_prefetch(idle_delay=0)
+        try:
+            assert calculator.prefetcher is second
+            assert first._closed
+        finally:
+            FactorialCalculatorFactory.disable_prefetch()
+        assert calculator.prefetcher is None
+        assert second._closed
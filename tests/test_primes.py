@@ -0,0 +1,79 @@
+"""Unit tests for the prime sieve module."""
+
+import threading
+from array import array
+
+import pytest
+
+from factorial_calculator.primes import PrimeSieve, get_sieve, primes_up_to
+
+
+def _reference_primes(limit: int) -> list[int]:
+    """Return primes up to limit by trial division."""
+    return [
+        n for n in range(2, limit + 1) if all(n % d for d in range(2, int(n**0.5) + 1))
+    ]
+
+
+class TestPrimeSieve:
+    """Test suite for PrimeSieve class."""
+
+    def test_small_bounds(self) -> None:
+        """Test primes_up_to on tiny bounds."""
+        sieve = PrimeSieve()
+        assert list(sieve.primes_up_to(1)) == []
+        assert list(sieve.primes_up_to(2)) == [2]
+        assert list(sieve.primes_up_to(30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+    def test_segments_match_reference(self) -> None:
+        """Test that many small segments produce the right primes."""
+        sieve = PrimeSieve(segment_size=16)
+        assert list(sieve.primes_up_to(3000)) == _reference_primes(3000)
+
+    def test_incremental_growth(self) -> None:
+        """Test that extensions only add new segments."""
+        sieve = PrimeSieve(segment_size=100)
+        sieve.extend(150)
+        assert sieve.limit >= 150
+        first = len(sieve)
+        sieve.extend(100)
+        assert len(sieve) == first
+        assert sieve.prime_count(10000) == 1229
+
+    def test_prime_store_is_compact_array(self) -> None:
+        """Test that primes are returned as array('I')."""
+        primes = PrimeSieve().primes_up_to(100)
+        assert isinstance(primes, array)
+        assert primes.typecode == "I"
+
+    def test_primes_in_range(self) -> None:
+        """Test iteration over primes within bounds."""
+        sieve = PrimeSieve(segment_size=64)
+        assert list(sieve.primes_in_range(90, 110)) == [97, 101, 103, 107, 109]
+        assert list(sieve.primes_in_range(24, 28)) == []
+
+    def test_limit_too_large(self) -> None:
+        """Test that limits beyond 32 bits are rejected."""
+        with pytest.raises(ValueError):
+            PrimeSieve().extend(2**32)
+
+    def test_concurrent_extension(self) -> None:
+        """Test that concurrent extensions leave a consistent store."""
+        sieve = PrimeSieve(segment_size=256)
+        threads = [
+            threading.Thread(target=sieve.extend, args=(limit,))
+            for limit in (5000, 20000, 10000, 20000)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        primes = list(sieve.primes_up_to(20000))
+        assert primes == sorted(set(primes))
+        assert len(primes) == 2262
+
+
+def test_shared_sieve() -> None:
+    """Test the module-level helpers share one sieve."""
+    assert get_sieve() is get_sieve()
+    assert primes_up_to(20) == [2, 3, 5, 7, 11, 13, 17, 19]
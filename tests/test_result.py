@@ -0,0 +1,142 @@
+"""Unit tests for the lazy result module."""
+
+import io
+import math
+import operator
+
+import pytest
+
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.result import FactorialResult, iter_decimal
+
+
+class TestIterDecimal:
+    """Test suite for chunked decimal streaming."""
+
+    @pytest.mark.parametrize("value", [0, 7, 10**9, 10**12 - 1, 10**30 + 5])
+    def test_matches_str(self, value: int) -> None:
+        """Test that the chunks concatenate to str(value)."""
+        assert "".join(iter_decimal(value, chunk_digits=4)) == str(value)
+
+    def test_chunks_are_bounded(self) -> None:
+        """Test that no chunk exceeds the requested size."""
+        chunks = list(iter_decimal(math.factorial(300), chunk_digits=50))
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 50 for chunk in chunks)
+
+    def test_huge_value_beyond_str_limit(self) -> None:
+        """Test streaming a value with more digits than str() allows."""
+        value = math.factorial(3000)
+        text = "".join(iter_decimal(value))
+        assert len(text) == 9131
+        assert int(text[:20]) == value // 10 ** (len(text) - 20)
+
+    @pytest.mark.parametrize("chunk_digits", [0, 5000])
+    def test_invalid_chunk_size(self, chunk_digits: int) -> None:
+        """Test that out-of-range chunk sizes are rejected."""
+        with pytest.raises(InvalidInputError):
+            iter_decimal(10, chunk_digits)
+
+    def test_negative_value(self) -> None:
+        """Test that negative values are rejected."""
+        with pytest.raises(InvalidInputError):
+            iter_decimal(-1)
+
+
+class TestFactorialResult:
+    """Test suite for FactorialResult class."""
+
+    def test_int_interchangeable(self) -> None:
+        """Test int(), operator.index() and equality."""
+        result = FactorialResult(120, 5)
+        assert int(result) == 120
+        assert operator.index(result) == 120
+        assert result == 120
+        assert result == FactorialResult(120)
+        assert hash(result) == hash(120)
+        assert [0, 1, 2][: FactorialResult(2)] == [0, 1]
+
+    def test_repr_does_not_convert(self) -> None:
+        """Test that repr reports the size instead of the digits."""
+        assert repr(FactorialResult(120, 5)) == "FactorialResult(n=5, bits=7)"
+
+    @pytest.mark.parametrize("n", [0, 1, 9, 10, 25, 100, 1000])
+    def test_digit_count(self, n: int) -> None:
+        """Test the digit count against the decimal string."""
+        value = math.factorial(n)
+        assert FactorialResult(value, n).digit_count == len(str(value))
+
+    def test_digit_count_at_powers_of_ten(self) -> None:
+        """Test the digit count at exact powers of ten."""
+        for exponent in range(1, 40):
+            assert FactorialResult(10**exponent).digit_count == exponent + 1
+            assert FactorialResult(10**exponent - 1).digit_count == exponent
+
+    def test_leading_and_trailing_digits(self) -> None:
+        """Test the digit slices against the decimal string."""
+        value = math.factorial(50)
+        text = str(value)
+        result = FactorialResult(value, 50)
+        assert result.leading_digits(12) == text[:12]
+        assert result.trailing_digits(15) == text[-15:]
+        assert result.leading_digits(100) == text
+        assert FactorialResult(7).trailing_digits(3) == "7"
+
+    def test_binary_views(self) -> None:
+        """Test the hex and byte views."""
+        result = FactorialResult(math.factorial(20))
+        assert result.hex() == format(math.factorial(20), "x")
+        assert int.from_bytes(result.to_bytes(), "big") == math.factorial(20)
+        assert int.from_bytes(result.to_bytes("little"), "little") == int(result)
+        assert FactorialResult(0).to_bytes() == b"\x00"
+
+    @pytest.mark.parametrize("n", [2, 3, 8, 9, 31, 200, 1001])
+    def test_odd_part_views(self, n: int) -> None:
+        """Test that views of an odd-part result match the full integer."""
+        value = math.factorial(n)
+        shift = n - n.bit_count()
+        result = FactorialResult.from_odd_part(value >> shift, shift, n)
+        assert result.bit_length() == value.bit_length()
+        assert result.hex() == format(value, "x")
+        assert int.from_bytes(result.to_bytes(), "big") == value
+        assert int.from_bytes(result.to_bytes("little"), "little") == value
+        assert len(result.to_bytes()) == (value.bit_length() + 7) // 8
+        assert result == value
+        assert str(result) == str(value)
+
+    @pytest.mark.parametrize("odd,shift", [(0, 5), (6, 1), (-3, 0), (3, -1)])
+    def test_invalid_odd_part(self, odd: int, shift: int) -> None:
+        """Test that results that are not odd * 2**shift are rejected."""
+        with pytest.raises(InvalidInputError, match="odd part"):
+            FactorialResult.from_odd_part(odd, shift)
+
+    def test_views_are_cached(self) -> None:
+        """Test that a derived view is computed only once."""
+        result = FactorialResult(math.factorial(40))
+        assert result.hex() is result.hex()
+        assert result.to_bytes() is result.to_bytes()
+
+    def test_write_decimal(self) -> None:
+        """Test writing the decimal form to a stream."""
+        stream = io.StringIO()
+        written = FactorialResult(math.factorial(30)).write_decimal(stream, 7)
+        assert stream.getvalue() == str(math.factorial(30))
+        assert written == len(stream.getvalue())
+        assert str(FactorialResult(math.factorial(30))) == stream.getvalue()
+
+    def test_calculate_lazy(self) -> None:
+        """Test the calculator's lazy entry point."""
+        result = FactorialCalculator().calculate_lazy("25")
+        assert result.n == 25
+        assert result == math.factorial(25)
+        assert result.digit_count == 26
+
+    def test_calculate_lazy_odd_part(self) -> None:
+        """Test that a lazy miss beyond the table is built from the odd part."""
+        calculator = FactorialCalculator(backend="python")
+        result = calculator.calculate_lazy(1000)
+        assert result.hex() == format(math.factorial(1000), "x")
+        assert calculator.is_cached(1000)
+        assert calculator.calculate(1000) == result
+        assert calculator.calculate_lazy(1000) == result
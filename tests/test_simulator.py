@@ -0,0 +1,121 @@
+"""Unit tests for the cache-policy simulator module."""
+
+import sys
+
+import pytest
+
+from factorial_calculator.exceptions import InvalidInputError
+from factorial_calculator.loadtest import TraceRequest
+from factorial_calculator.policy import estimate_factorial_bits
+from factorial_calculator.simulator import (
+    ByteBudgetPolicy,
+    CachePolicy,
+    CheckpointPolicy,
+    CostModel,
+    LFUPolicy,
+    LRUPolicy,
+    PolicyReport,
+    default_policies,
+    format_reports,
+    result_size,
+    simulate,
+    trace_inputs,
+)
+
+# Quadratic-ish model, so tests do not depend on this machine's timings
+MODEL = CostModel(((64, 1e-7), (1024, 2e-6), (16384, 1e-4)))
+
+
+class TestCostModel:
+    """Test suite for the multiplication cost model."""
+
+    def test_interpolation_hits_samples(self) -> None:
+        """Test that measured sizes return their own timings."""
+        for bits, seconds in MODEL.samples:
+            assert MODEL.balanced(bits) == pytest.approx(seconds)
+
+    def test_costs_grow_with_n(self) -> None:
+        """Test that larger factorials are estimated to cost more."""
+        costs = [MODEL.factorial(n) for n in (10, 100, 1000, 10000)]
+        assert costs == sorted(costs)
+        assert MODEL.factorial(1) == 0.0
+
+    def test_extend_is_cheaper_than_scratch(self) -> None:
+        """Test that extending a nearby factorial beats recomputing it."""
+        assert MODEL.extend(990, 1000) < MODEL.factorial(1000)
+        assert MODEL.extend(1000, 1000) == 0.0
+
+    def test_unbalanced_multiply(self) -> None:
+        """Test that a product costs one balanced product per chunk."""
+        assert MODEL.multiply(64, 640) == pytest.approx(10 * MODEL.balanced(64))
+
+    def test_measure(self) -> None:
+        """Test measuring a small model on this machine."""
+        model = CostModel.measure([64, 4096], repeat=1)
+        assert [bits for bits, _ in model.samples] == [64, 4096]
+        assert all(seconds > 0 for _, seconds in model.samples)
+        with pytest.raises(InvalidInputError):
+            CostModel.measure([])
+
+    def test_result_size(self) -> None:
+        """Test that simulated sizes match real int objects."""
+        for bits in (1, 30, 31, 61, 1000):
+            assert result_size(bits) == sys.getsizeof(1 << (bits - 1))
+
+
+class TestPolicies:
+    """Test suite for the simulated cache policies."""
+
+    @staticmethod
+    def _run(policy: CachePolicy, inputs: list[int]) -> PolicyReport:
+        """Replay inputs through a single policy."""
+        return simulate(inputs, [policy], MODEL)[0]
+
+    def test_unbounded_misses_once_per_input(self) -> None:
+        """Test that only the first access to each input misses."""
+        report = self._run(CachePolicy(), [5, 6, 5, 6, 7])
+        assert (report.hits, report.misses) == (2, 3)
+        assert report.final_bytes == report.peak_bytes > 0
+
+    def test_lru_evicts_least_recent(self) -> None:
+        """Test LRU eviction order."""
+        report = self._run(LRUPolicy(2), [100, 200, 100, 300, 100, 200])
+        assert report.hits == 2
+
+    def test_lfu_keeps_frequent(self) -> None:
+        """Test that LFU keeps a popular input that LRU would drop."""
+        inputs = [100, 100, 100, 200, 300, 100]
+        assert self._run(LFUPolicy(2), inputs).hits == 3
+        assert self._run(LRUPolicy(1), inputs).hits == 2
+
+    def test_byte_budget(self) -> None:
+        """Test that the byte budget bounds the footprint."""
+        budget = result_size(2000)
+        report = self._run(ByteBudgetPolicy(budget), [50, 100, 150, 200, 1000])
+        assert report.peak_bytes <= budget
+        assert self._run(ByteBudgetPolicy(10), [50]).peak_bytes == 0
+
+    def test_checkpoint_extends_nearest(self) -> None:
+        """Test that only checkpoints are stored and reused."""
+        report = self._run(CheckpointPolicy(100), [250, 260, 200, 450])
+        assert report.hits == 1
+        assert report.final_bytes == sum(
+            result_size(estimate_factorial_bits(n)) for n in (200, 400)
+        )
+        assert report.compute_seconds < sum(MODEL.factorial(n) for n in (250, 260, 450))
+        with pytest.raises(InvalidInputError):
+            CheckpointPolicy(0)
+
+    def test_default_policies_and_table(self) -> None:
+        """Test the comparison table of the default policies."""
+        inputs = trace_inputs([TraceRequest(3, 3), TraceRequest(10, 14)])
+        assert inputs == [3, 10, 11, 12, 13, 14]
+        reports = simulate(inputs * 2, default_policies(4, 1 << 20, 5), MODEL)
+        table = format_reports(reports)
+        assert len(table.splitlines()) == 6
+        assert reports[0].hit_ratio == 0.5
+
+    def test_negative_input(self) -> None:
+        """Test that traces with negative inputs are rejected."""
+        with pytest.raises(InvalidInputError):
+            simulate([-1], [CachePolicy()], MODEL)
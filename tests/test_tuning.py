@@ -0,0 +1,132 @@
+"""Unit tests for the tuning module."""
+
+import json
+import math
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from factorial_calculator.core import (
+    PARALLEL_MIN_INPUT,
+    FactorialCalculatorFactory,
+)
+from factorial_calculator.exceptions import InvalidInputError, VerificationError
+from factorial_calculator.tuning import (
+    DEFAULT_PROFILE,
+    DEFAULT_TUNING_SIZES,
+    PROFILE_ENV_VAR,
+    TuningProfile,
+    load_profile,
+    profile_path,
+    save_profile,
+    tune,
+)
+
+
+def _slow_when(slow: Callable[[int], bool]) -> Callable[[int], int]:
+    """Return a factorial function that sleeps for inputs where slow(n)."""
+
+    def strategy(n: int) -> int:
+        if slow(n):
+            time.sleep(0.001)
+        return math.factorial(n)
+
+    return strategy
+
+
+class TestTuningProfile:
+    """Test suite for TuningProfile class."""
+
+    def test_strategy_for(self) -> None:
+        """Test range lookup and the fallback."""
+        profile = TuningProfile(((64, "linear"), (4096, "tree")), "factorised")
+        assert profile.strategy_for(0) == "linear"
+        assert profile.strategy_for(64) == "linear"
+        assert profile.strategy_for(65) == "tree"
+        assert profile.strategy_for(5000) == "factorised"
+        assert DEFAULT_PROFILE.strategy_for(10**6) == "tree"
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test saving and loading a profile."""
+        profile = TuningProfile(((100, "linear"),), "tree", {"16": {"tree": 1e-6}})
+        path = save_profile(profile, tmp_path / "nested" / "tuning.json")
+        loaded = load_profile(path)
+        assert loaded == profile
+        assert loaded.timings == profile.timings
+
+    def test_missing_or_malformed_file(self, tmp_path: Path) -> None:
+        """Test that unusable files fall back to the defaults."""
+        assert load_profile(tmp_path / "missing.json") is DEFAULT_PROFILE
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert load_profile(bad) is DEFAULT_PROFILE
+        bad.write_text(json.dumps({"version": 99, "ranges": [], "fallback": "x"}))
+        assert load_profile(bad) is DEFAULT_PROFILE
+
+    def test_profile_path_env_override(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the environment variable override."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, str(tmp_path / "p.json"))
+        assert profile_path() == tmp_path / "p.json"
+
+
+class TestTune:
+    """Test suite for tune function."""
+
+    def test_crossover_detection(self) -> None:
+        """Test that a crossover is placed between the measured sizes."""
+        strategies = {
+            "small": _slow_when(lambda n: n >= 100),
+            "large": _slow_when(lambda n: n < 100),
+        }
+        profile = tune(strategies, sizes=[10, 1000], repeat=1)
+        assert profile.ranges == ((100, "small"),)
+        assert profile.fallback == "large"
+        assert set(profile.timings) == {"10", "1000"}
+
+    def test_min_inputs(self) -> None:
+        """Test that a strategy is not measured below its minimum input."""
+        strategies = {
+            "tree": _slow_when(lambda n: True),
+            "parallel": _slow_when(lambda n: False),
+        }
+        profile = tune(
+            strategies, sizes=[10, 1000], repeat=1, min_inputs={"parallel": 100}
+        )
+        assert set(profile.timings["10"]) == {"tree"}
+        assert profile.ranges == ((100, "tree"),)
+        assert profile.fallback == "parallel"
+        with pytest.raises(InvalidInputError):
+            tune(strategies, sizes=[10], min_inputs={"tree": 50, "parallel": 50})
+
+    def test_disagreeing_strategies(self) -> None:
+        """Test that a wrong strategy is rejected."""
+        strategies = {"good": math.factorial, "bad": lambda n: math.factorial(n) + 1}
+        with pytest.raises(VerificationError):
+            tune(strategies, sizes=[5], repeat=1)
+
+    def test_default_sizes_reach_parallel(self) -> None:
+        """Test that the default sizes include one where parallel runs."""
+        assert max(DEFAULT_TUNING_SIZES) >= PARALLEL_MIN_INPUT
+
+    def test_no_sizes(self) -> None:
+        """Test that an empty size list is rejected."""
+        with pytest.raises(InvalidInputError):
+            tune({"tree": math.factorial}, sizes=[])
+
+
+class TestFactoryProfile:
+    """Test suite for profile loading by the factory."""
+
+    def test_factory_loads_profile(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that new calculators dispatch with the saved profile."""
+        monkeypatch.setenv(PROFILE_ENV_VAR, str(tmp_path / "tuning.json"))
+        save_profile(TuningProfile(((500, "linear"),), "factorised"))
+        calculator = FactorialCalculatorFactory.get_calculator(use_singleton=False)
+        assert calculator._tuning.strategy_for(1000) == "factorised"
+        assert calculator.calculate(1000) == math.factorial(1000)
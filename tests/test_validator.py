@@ -1,9 +1,11 @@
 """Unit tests for the input validator module."""
 
+from array import array
+
 import pytest
 
 from factorial_calculator.exceptions import InvalidInputError
-from factorial_calculator.validator import InputValidator
+from factorial_calculator.validator import BulkValidationResult, InputValidator
 
 
 class TestInputValidator:
@@ -132,3 +134,83 @@ class TestInputValidator:
         """Test validation with various invalid string inputs."""
         with pytest.raises(InvalidInputError):
             InputValidator.validate_number(invalid_input)
+
+
+class TestBulkValidation:
+    """Test suite for InputValidator.validate_many."""
+
+    def test_all_valid_ints(self) -> None:
+        """Test the int fast path with valid values."""
+        result = InputValidator.validate_many([0, 5, 100])
+        assert result == BulkValidationResult([0, 5, 100], bytearray(3))
+        assert result.all_valid
+
+    def test_values_do_not_alias_input(self) -> None:
+        """Test that the int fast path returns a copy of the caller's list."""
+        column = [1, 2, 3]
+        result = InputValidator.validate_many(column)
+        column.append(4)
+        result.values[0] = 9
+        assert column == [1, 2, 3, 4]
+        assert result.values == [9, 2, 3]
+
+    def test_ints_with_out_of_range_values(self) -> None:
+        """Test that out-of-range ints are masked, not raised."""
+        limit = InputValidator.MAX_FACTORIAL_INPUT
+        result = InputValidator.validate_many([3, -1, limit + 1, limit])
+        assert result.values == [3, 0, 0, limit]
+        assert list(result.errors) == [0, 1, 1, 0]
+        assert result.error_count == 2
+
+    def test_array_column(self) -> None:
+        """Test validation of an array-typed integer column."""
+        result = InputValidator.validate_many(array("q", [1, 2, -3]))
+        assert result.values == [1, 2, 0]
+        assert list(result.errors) == [0, 0, 1]
+
+    def test_buffer_protocol_column(self) -> None:
+        """Test validation of a memoryview over an integer buffer."""
+        result = InputValidator.validate_many(memoryview(array("i", [7, 8])))
+        assert result.values == [7, 8]
+        assert result.all_valid
+
+    def test_bytes_lines(self) -> None:
+        """Test validation of a newline-separated bytes blob."""
+        result = InputValidator.validate_many(b"1\n 2 \nfoo\n")
+        assert result.values == [1, 2, 0]
+        assert list(result.errors) == [0, 0, 1]
+
+    def test_memoryview_of_bytes_is_text(self) -> None:
+        """Test that a memoryview over bytes is read as lines, not byte values."""
+        result = InputValidator.validate_many(memoryview(b"5\n6\n"))
+        assert result.values == [5, 6]
+        assert result.all_valid
+        cast = memoryview(b"7\n").cast("c")
+        assert InputValidator.validate_many(cast).values == [7]
+
+    def test_mixed_iterable(self) -> None:
+        """Test a generator mixing strings, bytes and invalid items."""
+        items = iter(["5", b"6\n", "", "  ", "3.14", None])
+        result = InputValidator.validate_many(items)
+        assert result.values == [5, 6, 0, 0, 0, 0]
+        assert list(result.errors) == [0, 0, 1, 1, 1, 1]
+
+    def test_empty_input(self) -> None:
+        """Test validation of an empty batch."""
+        result = InputValidator.validate_many([])
+        assert result.values == []
+        assert result.all_valid
+
+    @pytest.mark.parametrize(
+        "value", ["0", "42", " 7 ", "-5", "abc", "12.34", "1e5", 10001]
+    )
+    def test_matches_scalar_semantics(self, value: str | int) -> None:
+        """Test bulk and scalar validation agree item by item."""
+        result = InputValidator.validate_many([value])
+        try:
+            expected = InputValidator.validate_number(value)
+        except InvalidInputError:
+            assert result.errors[0] == 1
+        else:
+            assert result.errors[0] == 0
+            assert result.values[0] == expected
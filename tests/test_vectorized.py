@@ -0,0 +1,81 @@
+"""Unit tests for the NumPy-vectorised kernels."""
+
+import math
+
+import pytest
+
+from factorial_calculator import vectorized
+from factorial_calculator.exceptions import BackendUnavailableError, InvalidInputError
+from factorial_calculator.vectorized import (
+    log_binomial,
+    log_factorial,
+    log_factorial_ratio,
+)
+
+np = vectorized.np
+requires_numpy = pytest.mark.skipif(np is None, reason="numpy not installed")
+
+
+@requires_numpy
+class TestLogFactorial:
+    """Test suite for log_factorial."""
+
+    def test_matches_lgamma_across_table_limit(self) -> None:
+        """Test table and Stirling regions against math.lgamma."""
+        n = np.arange(0, 3000, 13)
+        expected = np.array([math.lgamma(x + 1) for x in n])
+        for limit in (10, 1000, 100000):
+            result = log_factorial(n, table_limit=limit)
+            assert np.allclose(result, expected, rtol=1e-13, atol=1e-13)
+
+    def test_large_inputs(self) -> None:
+        """Test inputs far above the table limit."""
+        n = np.array([10**6, 10**9])
+        expected = [math.lgamma(x + 1) for x in n]
+        assert np.allclose(log_factorial(n), expected, rtol=1e-14)
+
+    def test_preserves_shape(self) -> None:
+        """Test that multi-dimensional input keeps its shape."""
+        assert log_factorial(np.ones((3, 4), dtype=np.int32)).shape == (3, 4)
+
+    def test_integral_floats_accepted(self) -> None:
+        """Test that integral float arrays are accepted."""
+        assert np.allclose(log_factorial([2.0, 3.0]), [math.log(2), math.log(6)])
+
+    @pytest.mark.parametrize("values", [[-1, 2], [1.5], ["a"]])
+    def test_invalid_values(self, values: list) -> None:
+        """Test that negative or non-integral values raise."""
+        with pytest.raises(InvalidInputError):
+            log_factorial(values)
+
+
+@requires_numpy
+class TestLogRatios:
+    """Test suite for log_binomial and log_factorial_ratio."""
+
+    def test_log_binomial(self) -> None:
+        """Test log-binomials against math.comb with broadcasting."""
+        n = np.array([[10], [50], [400]])
+        k = np.array([0, 3, 10])
+        expected = [
+            [math.log(math.comb(a, b)) for b in (0, 3, 10)] for a in (10, 50, 400)
+        ]
+        assert np.allclose(log_binomial(n, k), expected, rtol=1e-12, atol=1e-12)
+
+    def test_log_binomial_k_greater_than_n(self) -> None:
+        """Test that k > n gives -inf."""
+        assert log_binomial([3], [5])[0] == -np.inf
+
+    def test_log_factorial_ratio(self) -> None:
+        """Test log(a!/b!) against math.perm."""
+        result = log_factorial_ratio([10, 100], [7, 90])
+        expected = [math.log(math.perm(10, 3)), math.log(math.perm(100, 10))]
+        assert np.allclose(result, expected, rtol=1e-12)
+
+
+def test_missing_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test graceful degradation when NumPy is not installed."""
+    monkeypatch.setattr(vectorized, "np", None)
+    assert not vectorized.is_numpy_available()
+    with pytest.raises(BackendUnavailableError, match="NumPy"):
+        log_factorial([1, 2, 3])
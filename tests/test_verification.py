@@ -0,0 +1,77 @@
+"""Unit tests for the verification module."""
+
+import math
+
+import pytest
+
+from factorial_calculator.backends import PythonBackend
+from factorial_calculator.core import FactorialCalculator
+from factorial_calculator.exceptions import FactorialError, VerificationError
+from factorial_calculator.verification import (
+    VERIFICATION_PRIMES,
+    factorial_residues,
+    verify_factorial,
+)
+
+
+class CorruptBackend(PythonBackend):
+    """Backend returning a slightly wrong factorial."""
+
+    native_factorial = True
+
+    def factorial(self, n: int) -> int:
+        """Return n! + 1."""
+        return math.factorial(n) + 1
+
+
+class TestFactorialResidues:
+    """Test suite for factorial_residues function."""
+
+    @pytest.mark.parametrize("n", [0, 1, 2, 63, 64, 65, 200, 1000])
+    def test_matches_math_factorial(self, n: int) -> None:
+        """Test residues against math.factorial."""
+        expected = [math.factorial(n) % p for p in VERIFICATION_PRIMES]
+        assert factorial_residues(n) == expected
+
+    def test_small_moduli(self) -> None:
+        """Test residues for moduli below n."""
+        assert factorial_residues(10, (7, 11, 1)) == [0, math.factorial(10) % 11, 0]
+
+
+class TestVerifyFactorial:
+    """Test suite for verify_factorial function."""
+
+    def test_accepts_correct_result(self) -> None:
+        """Test that a correct result passes."""
+        verify_factorial(500, math.factorial(500))
+
+    def test_rejects_corrupted_result(self) -> None:
+        """Test that a single flipped bit is detected."""
+        value = math.factorial(500) ^ (1 << 1000)
+        with pytest.raises(VerificationError, match="500!"):
+            verify_factorial(500, value)
+
+    def test_verification_error_is_factorial_error(self) -> None:
+        """Test the exception hierarchy."""
+        assert issubclass(VerificationError, FactorialError)
+
+
+class TestCalculatorVerification:
+    """Test suite for the calculator's verification mode."""
+
+    def test_verified_results(self) -> None:
+        """Test that verification passes for correct results."""
+        calculator = FactorialCalculator(verify=True)
+        assert calculator.calculate(1000) == math.factorial(1000)
+
+    def test_corrupt_backend_detected(self) -> None:
+        """Test that a faulty backend raises and caches nothing."""
+        calculator = FactorialCalculator(backend=CorruptBackend(), verify=True)
+        with pytest.raises(VerificationError):
+            calculator.calculate(500)
+        assert 500 not in calculator._cache
+
+    def test_disabled_by_default(self) -> None:
+        """Test that verification is opt-in."""
+        calculator = FactorialCalculator(backend=CorruptBackend())
+        assert calculator.calculate(500) == math.factorial(500) + 1